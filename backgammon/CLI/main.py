@@ -1,6 +1,8 @@
 """Interfaz de línea de comandos para el juego de Backgammon."""
 from backgammon.core.juego import Juego
 from backgammon.core.jugador import Jugador
+from backgammon.core.destinos import DESTINOS, FUERA, ORIGEN_BARRA
+from backgammon.core.perspectiva import distancia_para_salir, lado_de
 
 
 def limpiar_pantalla():
@@ -154,8 +156,10 @@ def obtener_movimiento(juego):
     if juego.tablero.fichas_en_barra(pid) > 0:
         print("\n⚠️  Tenés fichas en la BARRA. Debés reingresarlas primero.")
         entrada = juego._entrada_para(pid)
-        print(f"   Punto de entrada: {entrada}")
-        destino = obtener_punto(f"Ingresá el dado a usar (destino desde {entrada})")
+        desde_barra = DESTINOS[lado_de(pid)][ORIGEN_BARRA]
+        for dado in sorted(set(juego.movimientos_disponibles()), reverse=True):
+            print(f"   Dado {dado}: entra en el punto {desde_barra[dado]}")
+        destino = obtener_punto("Punto DESTINO para reingresar")
         if destino is None:
             return None
         return entrada, destino
@@ -193,32 +197,31 @@ def mostrar_movimientos_posibles(juego):
         print("\n⚠️  No hay dados disponibles. Tirá los dados primero (opción T).")
         return
 
+    # Solo movimientos que inician una jugada completa legal
+    legales = juego.movimientos_legales()
+
     # Verificar si hay fichas en la barra
     if juego.tablero.fichas_en_barra(jugador_id) > 0:
-        entrada = juego._entrada_para(jugador_id)
-        print(f"\n🚨 MOVIMIENTOS POSIBLES (desde BARRA - punto {entrada}):")
+        print("\n🚨 MOVIMIENTOS POSIBLES (desde BARRA):")
         print("─" * 60)
-        for dado in sorted(movimientos_dados, reverse=True):
-            destino = entrada + dado if jugador_id % 2 == 0 else entrada - dado
-            if 0 <= destino <= 23:
-                # Verificar si el movimiento es válido
-                punto_destino = juego.tablero.punto(destino)
-                puede = len([f for f in punto_destino if f.owner_id != jugador_id]) <= 1
-                estado = "✅" if puede else "❌"
-                print(f"  {estado} Dado {dado}: Barra → Punto {destino}")
+        desde_barra = DESTINOS[lado_de(jugador_id)][ORIGEN_BARRA]
+        legales_por_dado = {dado for _, _, dado in legales}
+        for dado in sorted(set(movimientos_dados), reverse=True):
+            if dado in legales_por_dado:
+                print(f"  ✅ Dado {dado}: Barra → Punto {desde_barra[dado]}")
             else:
-                print(f"  ❌ Dado {dado}: Fuera de rango")
+                print(f"  ❌ Dado {dado}: Sin entrada posible (punto {desde_barra[dado]})")
         print("─" * 60)
         return
 
     # Buscar todos los puntos con fichas del jugador
-    puntos_con_fichas = []
+    cantidades = {}
     for punto in range(24):
         fichas = juego.tablero.punto(punto)
         if fichas and fichas[0].owner_id == jugador_id:
-            puntos_con_fichas.append((punto, len(fichas)))
+            cantidades[punto] = len(fichas)
 
-    if not puntos_con_fichas:
+    if not cantidades:
         print("\n⚠️  No tenés fichas en el tablero.")
         return
 
@@ -227,77 +230,35 @@ def mostrar_movimientos_posibles(juego):
 
     movimientos_validos = []
 
-    # Verificar si puede hacer bearing off
-    puede_bearing = juego.tablero.puede_sacar_fichas(jugador_id)
-
-    for punto_origen, cantidad in puntos_con_fichas:
-        for dado in sorted(movimientos_dados, reverse=True):
-            # Calcular destino según dirección del jugador
-            if jugador_id % 2 == 1:  # Jugador impar
-                destino = punto_origen - dado
-            else:  # Jugador par
-                destino = punto_origen + dado
-
-            # Verificar bearing off
-            if puede_bearing:
-                home_inicio = 18 if jugador_id % 2 == 1 else 0
-                home_fin = 23 if jugador_id % 2 == 1 else 5
-                en_home = home_inicio <= punto_origen <= home_fin
-
-                if en_home and (destino < 0 or destino > 23):
-                    # Bearing off exacto
-                    movimientos_validos.append((
-                        punto_origen,
-                        "FUERA",
-                        dado,
-                        cantidad,
-                        "✅ Bearing off"
-                    ))
-                    continue
-                elif en_home and (
-                    (jugador_id % 2 == 1 and destino < 0) or
-                    (jugador_id % 2 == 0 and destino > 23)
-                ):
-                    # Over-bearing: verificar si es la más lejana
-                    puntos_mas_lejos = [
-                        p for p, _ in puntos_con_fichas
-                        if (jugador_id % 2 == 1 and p > punto_origen) or
-                           (jugador_id % 2 == 0 and p < punto_origen)
-                    ]
-                    if not puntos_mas_lejos:
-                        movimientos_validos.append((
-                            punto_origen,
-                            "FUERA",
-                            dado,
-                            cantidad,
-                            "✅ Over-bearing"
-                        ))
-                    continue
+    for punto_origen, destino, dado in legales:
+        cantidad = cantidades[punto_origen]
+
+        if destino == FUERA:
+            distancia = distancia_para_salir(punto_origen, lado_de(jugador_id))
+            descripcion = "✅ Bearing off" if dado == distancia else "✅ Over-bearing"
+            movimientos_validos.append(
+                (punto_origen, "FUERA", dado, cantidad, descripcion)
+            )
+            continue
+
+        punto_destino = juego.tablero.punto(destino)
+        fichas_enemigas = [f for f in punto_destino if f.owner_id != jugador_id]
+
+        descripcion = "✅ OK"
+        if len(fichas_enemigas) == 1:
+            descripcion = "✅ Captura ficha enemiga"
+        elif len(punto_destino) > 0:
+            descripcion = "✅ Apila con tus fichas"
 
-            # Movimiento normal
-            if 0 <= destino <= 23:
-                punto_destino = juego.tablero.punto(destino)
-                fichas_enemigas = [f for f in punto_destino if f.owner_id != jugador_id]
-
-                if len(fichas_enemigas) <= 1:
-                    descripcion = "✅ OK"
-                    if len(fichas_enemigas) == 1:
-                        descripcion = "✅ Captura ficha enemiga"
-                    elif len(punto_destino) > 0:
-                        descripcion = "✅ Apila con tus fichas"
-
-                    movimientos_validos.append((
-                        punto_origen,
-                        destino,
-                        dado,
-                        cantidad,
-                        descripcion
-                    ))
+        movimientos_validos.append(
+            (punto_origen, destino, dado, cantidad, descripcion)
+        )
 
     # Mostrar movimientos agrupados por punto de origen
     if movimientos_validos:
         punto_actual = None
-        for origen, destino, dado, cantidad, desc in sorted(movimientos_validos):
+        for origen, destino, dado, cantidad, desc in sorted(
+                movimientos_validos, key=lambda m: (m[0], -m[2])):
             if origen != punto_actual:
                 if punto_actual is not None:
                     print()
@@ -0,0 +1,62 @@
+"""Línea de comandos de los benchmarks: python -m backgammon.benchmarks.
+
+Sin argumentos mide todos los casos y los compara con la línea base guardada;
+termina con código 1 si alguno empeoró más que la tolerancia. Con --guardar
+reemplaza la línea base por las mediciones actuales.
+"""
+import argparse
+import os
+import sys
+from backgammon.benchmarks.casos import todos_los_casos
+from backgammon.benchmarks.medicion import (
+    medir, cargar_linea_base, guardar_linea_base, regresiones,
+)
+
+LINEA_BASE = os.path.join(os.path.dirname(__file__), "linea_base.json")
+
+
+def main(argv=None) -> int:
+    """Mide, imprime la tabla de resultados y devuelve el código de salida."""
+    parser = argparse.ArgumentParser(description="Benchmarks del motor de backgammon.")
+    parser.add_argument("--linea-base", default=LINEA_BASE)
+    parser.add_argument("--guardar", action="store_true",
+                        help="guarda las mediciones como nueva línea base")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="empeoramiento relativo permitido (0.25 = 25%%)")
+    parser.add_argument("--segundos", type=float, default=0.3,
+                        help="duración de cada tanda de medición")
+    parser.add_argument("--solo", nargs="*", default=None,
+                        help="nombres (o prefijos) de los casos a medir")
+    args = parser.parse_args(argv)
+
+    casos = todos_los_casos()
+    if args.solo:
+        casos = {n: c for n, c in casos.items() if any(n.startswith(p) for p in args.solo)}
+
+    linea_base = cargar_linea_base(args.linea_base)
+    mediciones = []
+    print(f"{'caso':34} {'ops/s':>14} {'B/op':>10} {'vs base':>9}")
+    for nombre, preparar in casos.items():
+        medicion = medir(nombre, preparar, segundos=args.segundos)
+        mediciones.append(medicion)
+        base = linea_base.get(nombre)
+        relativo = (
+            f"{medicion.ops_por_segundo / base['ops_por_segundo'] - 1:+.0%}" if base else "-"
+        )
+        print(f"{nombre:34} {medicion.ops_por_segundo:>14,.0f} "
+              f"{medicion.memoria_pico_bytes:>10,.0f} {relativo:>9}")
+
+    if args.guardar:
+        # Con --solo se conservan las entradas de los casos no medidos.
+        guardar_linea_base(args.linea_base, mediciones, linea_base if args.solo else None)
+        print(f"Línea base guardada en {args.linea_base}")
+        return 0
+
+    problemas = regresiones(mediciones, linea_base, args.tolerancia)
+    for problema in problemas:
+        print(f"REGRESIÓN {problema}")
+    return 1 if problemas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
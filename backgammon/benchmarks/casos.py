@@ -0,0 +1,162 @@
+"""Casos de benchmark de los caminos calientes del motor y del dibujo en Pygame.
+
+Cada función `caso_*` prepara su estado y devuelve la operación a medir.
+"""
+import os
+from backgammon.core.dados import Dados
+from backgammon.core.juego import juego_inicial
+from backgammon.core.jugadas import generar_jugadas
+from backgammon.core.tablero import Tablero
+from backgammon.core.tablero_compacto import TableroCompacto
+from backgammon.ia.estrategias import EstrategiaAleatoria
+from backgammon.simulacion.autojuego import jugar_partida
+from backgammon.simulacion.vectorizado import EntornoVectorizado
+
+
+def _caso_mover_ficha_seguro(clase):
+    """mover_ficha_seguro del backend dado: ida y vuelta de una ficha (dos movimientos)."""
+    tablero = clase()
+    tablero.posicion_inicial_estandar(1, 2)
+
+    def operacion():
+        tablero.mover_ficha_seguro(1, 12, 10)
+        tablero.mover_ficha_seguro(1, 10, 12)
+    return operacion
+
+
+def caso_mover_ficha_seguro():
+    """Tablero.mover_ficha_seguro: ida y vuelta de una ficha (dos movimientos)."""
+    return _caso_mover_ficha_seguro(Tablero)
+
+
+def caso_mover_ficha_seguro_compacto():
+    """TableroCompacto.mover_ficha_seguro: ida y vuelta de una ficha (dos movimientos)."""
+    return _caso_mover_ficha_seguro(TableroCompacto)
+
+
+def caso_validar_movimiento():
+    """Juego._validar_movimiento de un movimiento normal legal."""
+    juego = juego_inicial([2, 1])
+    return lambda: juego._validar_movimiento(12, 10)
+
+
+def caso_aplicar_movimiento():
+    """Juego.aplicar_movimiento y la vuelta atrás (tablero y dados) para repetirlo."""
+    juego = juego_inicial([2, 1])
+    pid = juego.jugador_actual.id
+
+    def operacion():
+        juego.aplicar_movimiento(12, 10)
+        juego.tablero.mover_ficha_seguro(pid, 10, 12)
+        juego.fijar_movimientos([2, 1])
+    return operacion
+
+
+def caso_estado_dict():
+    """Juego.estado_dict sobre la posición inicial."""
+    juego = juego_inicial([6, 5])
+    return juego.estado_dict
+
+
+def caso_jugadas_legales():
+    """Juego.jugadas_legales con un 6-5 en la posición inicial."""
+    juego = juego_inicial([6, 5])
+    return juego.jugadas_legales
+
+
+def caso_generar_jugadas():
+    """generar_jugadas con un 6-5 en la posición inicial, sin pasar por la caché."""
+    juego = juego_inicial([6, 5])
+    celdas = juego.tablero.celdas()
+    return lambda: generar_jugadas(celdas, 0, [6, 5])
+
+
+def caso_generar_jugadas_dobles():
+    """generar_jugadas con un 3-3 en la posición inicial (cuatro dados), sin caché."""
+    juego = juego_inicial([3, 3, 3, 3])
+    celdas = juego.tablero.celdas()
+    return lambda: generar_jugadas(celdas, 0, [3, 3, 3, 3])
+
+
+def caso_dados_tirar():
+    """Dados.tirar en el modo clásico (random)."""
+    return Dados(semilla=1).tirar
+
+
+def caso_dados_tirar_bloque():
+    """Dados.tirar en modo bloque (NumPy)."""
+    return Dados(semilla=1, bloque=4096).tirar
+
+
+def caso_partida_aleatoria():
+    """Una partida completa entre dos estrategias aleatorias (una por operación)."""
+    estrategias = [EstrategiaAleatoria(), EstrategiaAleatoria()]
+    contador = iter(range(1 << 30))
+    return lambda: jugar_partida(next(contador), estrategias)
+
+
+def caso_vectorizado_step():
+    """EntornoVectorizado.step de 1024 partidas con la primera jugada legal (un paso por op)."""
+    entorno = EntornoVectorizado(1024, semilla=1)
+    elecciones = [0] * entorno.partidas
+    return lambda: entorno.step(elecciones)
+
+
+CASOS_MOTOR = {
+    "tablero.mover_ficha_seguro": caso_mover_ficha_seguro,
+    "tablero_compacto.mover_ficha_seguro": caso_mover_ficha_seguro_compacto,
+    "juego._validar_movimiento": caso_validar_movimiento,
+    "juego.aplicar_movimiento": caso_aplicar_movimiento,
+    "juego.estado_dict": caso_estado_dict,
+    "juego.jugadas_legales": caso_jugadas_legales,
+    "jugadas.generar_jugadas": caso_generar_jugadas,
+    "jugadas.generar_jugadas_dobles": caso_generar_jugadas_dobles,
+    "dados.tirar": caso_dados_tirar,
+    "dados.tirar_bloque": caso_dados_tirar_bloque,
+    "partida.aleatoria": caso_partida_aleatoria,
+    "vectorizado.step": caso_vectorizado_step,
+}
+
+
+def casos_pygame() -> dict:
+    """Casos de las funciones de dibujo sobre una superficie fuera de pantalla.
+
+    Devuelve un diccionario vacío si Pygame no está disponible.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        import pygame  # pylint: disable=import-outside-toplevel
+        from backgammon.pygame import pygame_ui  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return {}
+
+    def preparar(dibujar):
+        def caso():
+            pygame.init()
+            superficie = pygame.Surface((pygame_ui.ANCHO, pygame_ui.ALTO))
+            fuente = pygame.font.Font(None, 16)
+            juego = juego_inicial([6, 5])
+            juego.tablero.enviar_a_barra(juego.jugadores[1].id)
+            return lambda: dibujar(superficie, juego, fuente)
+        return caso
+
+    return {
+        "pygame.dibujar_triangulos": preparar(
+            lambda s, j, f: pygame_ui.dibujar_triangulos(s)),
+        "pygame.dibujar_marco_y_labels": preparar(
+            lambda s, j, f: pygame_ui.dibujar_marco_y_labels(s, f)),
+        "pygame.dibujar_fichas": preparar(pygame_ui.dibujar_fichas),
+        "pygame.dibujar_barra": preparar(pygame_ui.dibujar_barra),
+        "pygame.draw_bearing_off_bar": preparar(pygame_ui.draw_bearing_off_bar),
+        "pygame.dibujar_hints": preparar(
+            lambda s, j, f: pygame_ui.dibujar_hints(s, 12, j.movimientos_disponibles(), j)),
+        "pygame.dibujar_hud": preparar(
+            lambda s, j, f: pygame_ui._dibujar_hud(s, j, None, f, f)),
+    }
+
+
+def todos_los_casos() -> dict:
+    """Todos los casos disponibles, motor primero y después Pygame."""
+    casos = dict(CASOS_MOTOR)
+    casos.update(casos_pygame())
+    return casos
@@ -0,0 +1,118 @@
+"""Medición de operaciones por segundo y memoria, y comparación contra una línea base.
+
+Cada caso es una función sin argumentos que devuelve la operación a medir (otra
+función sin argumentos); así la preparación no entra en la medición.
+"""
+import json
+import time
+import tracemalloc
+from typing import NamedTuple
+
+
+class Medicion(NamedTuple):
+    """Resultado de medir un caso."""
+    nombre: str
+    ops_por_segundo: float
+    memoria_pico_bytes: float
+
+
+def medir(nombre: str, preparar, segundos: float = 0.3, repeticiones: int = 3,
+          muestras_memoria: int = 20) -> Medicion:
+    """Mide un caso: mejor tasa de 'repeticiones' tandas y pico de memoria por operación.
+
+    Recibe:
+        nombre (str): nombre del caso.
+        preparar (Callable[[], Callable[[], object]]): arma el caso y devuelve la operación.
+        segundos (float): duración aproximada de cada tanda.
+        repeticiones (int): tandas medidas; se informa la más rápida.
+        muestras_memoria (int): operaciones medidas con tracemalloc.
+    Devuelve:
+        Medicion
+    """
+    operacion = preparar()
+
+    # Calibración: cuántas operaciones entran en 'segundos'.
+    cantidad = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(cantidad):
+            operacion()
+        transcurrido = time.perf_counter() - inicio
+        if transcurrido >= segundos / 10 or cantidad >= 1 << 24:
+            break
+        cantidad *= 2
+    cantidad = max(1, int(cantidad * segundos / max(transcurrido, 1e-9)))
+
+    mejor = 0.0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for _ in range(cantidad):
+            operacion()
+        mejor = max(mejor, cantidad / (time.perf_counter() - inicio))
+
+    # Memoria: pico de lo asignado durante cada operación (objetos temporales incluidos).
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(muestras_memoria):
+            actual, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            operacion()
+            total += tracemalloc.get_traced_memory()[1] - actual
+    finally:
+        tracemalloc.stop()
+
+    return Medicion(nombre, mejor, total / muestras_memoria)
+
+
+def cargar_linea_base(ruta) -> dict:
+    """Lee la línea base guardada ({nombre: {ops_por_segundo, memoria_pico_bytes}})."""
+    try:
+        with open(ruta, encoding="utf-8") as archivo:
+            return json.load(archivo)
+    except FileNotFoundError:
+        return {}
+
+
+def guardar_linea_base(ruta, mediciones, anterior: dict | None = None):
+    """Guarda las mediciones como nueva línea base.
+
+    Si se pasa 'anterior', sus casos no medidos se conservan en el archivo.
+    """
+    datos = dict(anterior or {})
+    datos.update({
+        m.nombre: {"ops_por_segundo": m.ops_por_segundo,
+                   "memoria_pico_bytes": m.memoria_pico_bytes}
+        for m in mediciones
+    })
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=2, sort_keys=True)
+        archivo.write("\n")
+
+
+def regresiones(mediciones, linea_base: dict, tolerancia: float,
+                margen_memoria: int = 1024) -> list[str]:
+    """Compara contra la línea base y describe cada regresión mayor a la tolerancia.
+
+    Una medición regresiona si hace menos de (1 - tolerancia) de las operaciones
+    por segundo de la base, o si su pico de memoria supera (1 + tolerancia) de la
+    base más 'margen_memoria' bytes. Los casos sin base se ignoran.
+    """
+    problemas = []
+    for m in mediciones:
+        base = linea_base.get(m.nombre)
+        if base is None:
+            continue
+        minimo = base["ops_por_segundo"] * (1 - tolerancia)
+        if m.ops_por_segundo < minimo:
+            problemas.append(
+                f"{m.nombre}: {m.ops_por_segundo:,.0f} ops/s < {minimo:,.0f} "
+                f"(base {base['ops_por_segundo']:,.0f})"
+            )
+        maximo = base["memoria_pico_bytes"] * (1 + tolerancia) + margen_memoria
+        if m.memoria_pico_bytes > maximo:
+            problemas.append(
+                f"{m.nombre}: {m.memoria_pico_bytes:,.0f} B por operación > {maximo:,.0f} "
+                f"(base {base['memoria_pico_bytes']:,.0f})"
+            )
+    return problemas
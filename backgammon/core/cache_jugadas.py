@@ -0,0 +1,138 @@
+"""Caché LRU de jugadas legales, compartida por todo el proceso.
+
+La misma posición con la misma tirada aparece una y otra vez: en los rollouts,
+en las búsquedas y en cada cuadro de la interfaz de Pygame, que vuelve a
+pedir los movimientos legales 60 veces por segundo para dibujar las pistas.
+`Juego.jugadas_legales()` y `Juego.movimientos_legales()` consultan primero
+esta caché.
+
+La clave es el hash Zobrist de la posición vista desde el lado que mueve y
+los dados restantes en su orden; con la misma clave el generador devuelve
+exactamente lo mismo, así que usar la caché no cambia ningún resultado. Los
+valores se guardan como tuplas inmutables y se devuelven como listas nuevas,
+así que quien las modifique no altera la caché.
+
+El tamaño se acota por memoria estimada (`sys.getsizeof` de cada resultado) y
+al pasarse se descartan las entradas usadas hace más tiempo. Las operaciones
+toman un lock, así que se puede usar desde varios hilos (por ejemplo la
+interfaz y un bot pensando en segundo plano).
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+# Presupuesto por defecto de la caché de cada proceso.
+MEMORIA_POR_DEFECTO = 32 * 1024 * 1024
+# Costo fijo aproximado de cada entrada: clave, nodo del OrderedDict y tupla.
+_COSTO_ENTRADA = 200
+
+
+def _tamanio(valor: tuple) -> int:
+    """Bytes aproximados de un resultado: la tupla, sus elementos y sus pares."""
+    total = sys.getsizeof(valor)
+    for elemento in valor:
+        total += sys.getsizeof(elemento)
+        for par in elemento:
+            if isinstance(par, tuple):
+                total += sys.getsizeof(par)
+    return total
+
+
+class CacheJugadas:
+    """Caché LRU con presupuesto de memoria y contadores de aciertos y fallos."""
+
+    def __init__(self, memoria_maxima: int = MEMORIA_POR_DEFECTO):
+        """Crea una caché vacía; con memoria_maxima 0 no guarda nada."""
+        self.memoria_maxima = memoria_maxima
+        self.__entradas__ = OrderedDict()
+        self.__lock__ = threading.Lock()
+        self.memoria = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def __len__(self) -> int:
+        """Cantidad de entradas guardadas."""
+        return len(self.__entradas__)
+
+    def obtener(self, clave, calcular) -> list:
+        """Devuelve el resultado guardado para la clave o lo calcula y lo guarda.
+
+        Recibe:
+            clave (Hashable): clave de la posición (ver `Juego._clave_cache`).
+            calcular (Callable[[], list]): genera el resultado si no está guardado.
+        Devuelve:
+            list: una lista nueva con el resultado.
+        """
+        with self.__lock__:
+            entrada = self.__entradas__.get(clave)
+            if entrada is not None:
+                self.__entradas__.move_to_end(clave)
+                self.aciertos += 1
+                return list(entrada[0])
+            self.fallos += 1
+        # El generador corre fuera del lock: otro hilo puede calcular lo mismo a la vez.
+        valor = tuple(calcular())
+        tamanio = _tamanio(valor) + _COSTO_ENTRADA
+        with self.__lock__:
+            if tamanio <= self.memoria_maxima and clave not in self.__entradas__:
+                self.__entradas__[clave] = (valor, tamanio)
+                self.memoria += tamanio
+                self._desalojar()
+        return list(valor)
+
+    def _desalojar(self):
+        """Descarta las entradas menos usadas hasta entrar en el presupuesto (con el lock)."""
+        while self.memoria > self.memoria_maxima and self.__entradas__:
+            _, (_, tamanio) = self.__entradas__.popitem(last=False)
+            self.memoria -= tamanio
+            self.desalojos += 1
+
+    def configurar(self, memoria_maxima: int):
+        """Cambia el presupuesto de memoria, descartando lo que sobre."""
+        with self.__lock__:
+            self.memoria_maxima = memoria_maxima
+            self._desalojar()
+
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores."""
+        with self.__lock__:
+            self.__entradas__.clear()
+            self.memoria = 0
+            self.aciertos = 0
+            self.fallos = 0
+            self.desalojos = 0
+
+    def estadisticas(self) -> dict:
+        """Devuelve entradas, memoria usada y máxima, aciertos, fallos, desalojos y tasa.
+
+        La tasa de aciertos es aciertos / (aciertos + fallos), o 0.0 sin consultas.
+        """
+        with self.__lock__:
+            consultas = self.aciertos + self.fallos
+            return {
+                "entradas": len(self.__entradas__),
+                "memoria": self.memoria,
+                "memoria_maxima": self.memoria_maxima,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            }
+
+    def __getstate__(self):
+        """Serializa sólo el presupuesto: cada proceso arma su propia caché."""
+        return {"memoria_maxima": self.memoria_maxima}
+
+    def __setstate__(self, estado):
+        """Recrea una caché vacía con el presupuesto serializado."""
+        self.__init__(estado["memoria_maxima"])
+
+
+# Caché del proceso que usa Juego (cada proceso de un pool tiene la suya).
+CACHE = CacheJugadas()
+
+
+def configurar_cache(memoria_maxima: int):
+    """Cambia el presupuesto de la caché del proceso (0 la desactiva)."""
+    CACHE.configurar(memoria_maxima)
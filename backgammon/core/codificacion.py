@@ -0,0 +1,152 @@
+"""Codificación de posiciones como filas de NumPy para evaluarlas en lote.
+
+Cada fila tiene `ANCHO` enteros int8 con el mismo orden que `TableroCompacto.celdas()`:
+puntos 0..23 con signo (+ J1, - J2), barra de J1 y J2, salidas de J1 y J2, y al
+final el lado que mueve (0 para J1, 1 para J2). Así una lista de posiciones, o
+todas las jugadas candidatas de una tirada, se convierten en una matriz (N, ANCHO)
+que un evaluador procesa con una sola operación.
+"""
+import numpy as np
+from backgammon.core.tablero import PUNTOS
+from backgammon.core.tablero_compacto import TableroCompacto, BARRA, SALIDA, CELDAS
+
+COLUMNA_LADO = CELDAS
+ANCHO = CELDAS + 1
+
+
+def codificar(tablero, lado: int) -> np.ndarray:
+    """Codifica un tablero (Tablero o TableroCompacto) y el lado que mueve.
+
+    Recibe:
+        tablero: cualquier backend con `celdas()`.
+        lado (int): 0 si mueve J1 (id impar), 1 si mueve J2 (id par).
+    Devuelve:
+        np.ndarray: fila de forma (ANCHO,) y tipo int8.
+    """
+    fila = np.empty(ANCHO, dtype=np.int8)
+    fila[:CELDAS] = tablero.celdas()
+    fila[COLUMNA_LADO] = lado
+    return fila
+
+
+def codificar_lote(celdas, lados) -> np.ndarray:
+    """Codifica muchas posiciones en una matriz (N, ANCHO) de una sola vez.
+
+    Recibe:
+        celdas (Sequence[list[int]] | np.ndarray): arreglos planos de N posiciones.
+        lados (int | Sequence[int]): lado que mueve en cada posición (o uno para todas).
+    Devuelve:
+        np.ndarray: matriz (N, ANCHO) de int8.
+    """
+    celdas = np.asarray(celdas, dtype=np.int8).reshape(-1, CELDAS)
+    filas = np.empty((len(celdas), ANCHO), dtype=np.int8)
+    filas[:, :CELDAS] = celdas
+    filas[:, COLUMNA_LADO] = lados
+    return filas
+
+
+def codificar_jugadas(celdas, lado: int, jugadas) -> np.ndarray:
+    """Codifica la posición resultante de cada jugada candidata.
+
+    Aplica las jugadas de `generar_jugadas` a la vez: en cada paso k mueve la
+    k-ésima ficha de todas las jugadas con operaciones vectorizadas (reingreso,
+    hit y bearing off incluidos). El lado que mueve de las filas resultantes es
+    el rival, que es quien mueve a continuación.
+
+    Recibe:
+        celdas (list[int]): posición de partida en formato plano.
+        lado (int): lado que juega las jugadas.
+        jugadas (Sequence[tuple[tuple[int, int], ...]]): jugadas candidatas.
+    Devuelve:
+        np.ndarray: matriz (len(jugadas), ANCHO) de int8.
+    """
+    cantidad = len(jugadas)
+    filas = np.empty((cantidad, ANCHO), dtype=np.int8)
+    filas[:, :CELDAS] = np.asarray(celdas, dtype=np.int8)
+    filas[:, COLUMNA_LADO] = 1 - lado
+    if cantidad == 0:
+        return filas
+
+    pasos = max(len(jugada) for jugada in jugadas)
+    # desde/hasta por (jugada, paso); -1 marca jugadas más cortas.
+    movimientos = np.full((cantidad, pasos, 2), -1, dtype=np.intp)
+    for i, jugada in enumerate(jugadas):
+        if jugada:
+            movimientos[i, :len(jugada)] = jugada
+    return aplicar_movimientos(filas, movimientos, lado)
+
+
+def aplicar_movimientos(filas: np.ndarray, movimientos: np.ndarray, lado: int) -> np.ndarray:
+    """Aplica en el lugar una jugada distinta a cada fila, paso por paso.
+
+    Recibe:
+        filas (np.ndarray): matriz (N, ANCHO) o (N, CELDAS) de int8.
+        movimientos (np.ndarray): (N, pasos, 2) con (desde, hasta); -1 marca los
+            pasos que sobran en jugadas más cortas (o vacías).
+        lado (int): lado que mueve en todas las filas.
+    Devuelve:
+        np.ndarray: las mismas 'filas', ya modificadas.
+    """
+    pasos = movimientos.shape[1]
+    signo = 1 if lado == 0 else -1
+    barra_propia = BARRA + lado
+    barra_rival = BARRA + 1 - lado
+    for paso in range(pasos):
+        filas_paso = np.nonzero(movimientos[:, paso, 0] >= 0)[0]
+        desde = movimientos[filas_paso, paso, 0]
+        hasta = movimientos[filas_paso, paso, 1]
+
+        # Con fichas en la barra, el movimiento es un reingreso.
+        desde_barra = filas[filas_paso, barra_propia] > 0
+        filas[filas_paso[desde_barra], barra_propia] -= 1
+        filas[filas_paso[~desde_barra], desde[~desde_barra]] -= signo
+
+        saca = hasta == PUNTOS
+        filas[filas_paso[saca], SALIDA + lado] += 1
+
+        en_tablero = filas_paso[~saca]
+        destino = hasta[~saca]
+        golpe = filas[en_tablero, destino] == -signo
+        filas[en_tablero[golpe], destino[golpe]] = 0
+        filas[en_tablero[golpe], barra_rival] += 1
+        filas[en_tablero, destino] += signo
+    return filas
+
+
+def espejar_filas(filas) -> np.ndarray:
+    """Versión en lote de `perspectiva.espejar_celdas`: cada fila vista desde el otro lado.
+
+    Recibe:
+        filas (np.ndarray): matriz (N, ANCHO) o (N, CELDAS).
+    Devuelve:
+        np.ndarray: matriz nueva; con la columna del lado, también la invierte.
+    """
+    filas = np.asarray(filas)
+    espejo = np.empty_like(filas)
+    espejo[:, :PUNTOS] = -filas[:, PUNTOS - 1::-1]
+    espejo[:, [BARRA, BARRA + 1, SALIDA, SALIDA + 1]] = (
+        filas[:, [BARRA + 1, BARRA, SALIDA + 1, SALIDA]]
+    )
+    if filas.shape[1] > COLUMNA_LADO:
+        espejo[:, COLUMNA_LADO] = 1 - filas[:, COLUMNA_LADO]
+    return espejo
+
+
+def decodificar(fila) -> tuple[list[int], int]:
+    """Devuelve (celdas, lado que mueve) a partir de una fila codificada."""
+    fila = np.asarray(fila)
+    return fila[:CELDAS].astype(int).tolist(), int(fila[COLUMNA_LADO])
+
+
+def a_tablero(fila, j1_id: int, j2_id: int) -> TableroCompacto:
+    """Reconstruye un TableroCompacto con los ids dados a partir de una fila.
+
+    Recibe:
+        fila (np.ndarray): fila codificada.
+        j1_id (int): id impar del jugador que mueve 23→0.
+        j2_id (int): id par del jugador que mueve 0→23.
+    Devuelve:
+        TableroCompacto: tablero con las mismas celdas (y su hash incremental).
+    """
+    celdas, _ = decodificar(fila)
+    return TableroCompacto.desde_celdas(celdas, j1_id, j2_id)
@@ -1,17 +1,66 @@
 """Módulo de dados del juego."""
 import random
+import numpy as np
+
+# Las 36 tiradas posibles, creadas una sola vez: TIRADAS[6 * (d1 - 1) + (d2 - 1)]
+# es (d1, d2, movimientos) con los movimientos como tupla inmutable.
+TIRADAS = tuple(
+    (d1, d2, (d1,) * 4 if d1 == d2 else (d1, d2))
+    for d1 in range(1, 7)
+    for d2 in range(1, 7)
+)
+
+# Las 21 tiradas distintas para los nodos de azar de una búsqueda: (movimientos,
+# probabilidad), con 1/36 para cada doble y 2/36 para cada tirada no doble.
+TIRADAS_DISTINTAS = tuple(
+    (movimientos, (1 if d1 == d2 else 2) / 36)
+    for d1, d2, movimientos in TIRADAS
+    if d1 <= d2
+)
+
+
+def semilla_derivada(semilla_maestra: int, *indices: int) -> np.random.SeedSequence:
+    """Deriva una semilla independiente y reproducible a partir de una semilla maestra.
+
+    Es la misma semilla que daría `SeedSequence(semilla_maestra).spawn(n)[i]`,
+    pero se puede calcular directamente a partir del índice. Si cada partida usa
+    `semilla_derivada(maestra, indice_partida)`, sus dados son los mismos sin
+    importar cuántos procesos se usen ni qué proceso juegue cada partida.
+
+    Recibe:
+        semilla_maestra (int): semilla de toda la simulación.
+        indices (int): camino de derivación (por ejemplo el índice de partida).
+    Devuelve:
+        np.random.SeedSequence: semilla para `Dados` o `Juego.usar_semilla`.
+    """
+    return np.random.SeedSequence(semilla_maestra, spawn_key=tuple(indices))
+
+
+def semillas_derivadas(semilla_maestra: int, cantidad: int, inicio: int = 0) -> list:
+    """Devuelve las semillas derivadas de las partidas inicio..inicio+cantidad-1."""
+    return [semilla_derivada(semilla_maestra, i) for i in range(inicio, inicio + cantidad)]
 
 
 class Dados:
     """Maneja tiradas de dados y genera los movimientos disponibles.
     Permite fijar la semilla para tiradas determinísticas.
+
+    Con 'bloque' se usa el modo de alto rendimiento: las tiradas se generan
+    de a bloques con NumPy (PCG64) y se entregan como tuplas de `TIRADAS`,
+    sin crear listas nuevas. La secuencia depende sólo de la semilla, no del
+    tamaño del bloque ni de si se consume con `tirar` o con `tirar_lote`.
     """
 
-    def __init__(self, semilla=None):
-        """Inicializa el generador de números aleatorios."""
-        self.__semilla__ = semilla
-        self.__rng__ = random.Random(semilla)
-        self.__ultimo_tiro__ = None
+    def __init__(self, semilla=None, bloque=None):
+        """Inicializa el generador de números aleatorios.
+
+        Recibe:
+            semilla (int | SeedSequence | None): semilla para tiradas reproducibles
+                (ver `semilla_derivada` para simulaciones en paralelo).
+            bloque (int | None): tamaño de bloque del modo NumPy; None usa `random`.
+        """
+        self.__bloque__ = bloque
+        self.fijar_semilla(semilla)
 
     def tirar(self):
         """Tira dos dados y calcula los movimientos disponibles.
@@ -19,8 +68,17 @@ class Dados:
         Recibe:
             None
         Devuelve:
-            tuple[int, int, list[int]]: d1, d2 y lista de movimientos.
+            tuple[int, int, list[int]]: d1, d2 y lista de movimientos. En modo
+            bloque los movimientos son la tupla compartida de `TIRADAS`.
         """
+        if self.__bloque__ is not None:
+            if self.__pos__ >= len(self.__buffer__):
+                self._rellenar()
+            tirada = TIRADAS[self.__buffer__[self.__pos__]]
+            self.__pos__ += 1
+            self.__ultimo_tiro__ = tirada
+            return tirada
+
         d1 = self.__rng__.randint(1, 6)
         d2 = self.__rng__.randint(1, 6)
         if d1 == d2:
@@ -30,6 +88,48 @@ class Dados:
         self.__ultimo_tiro__ = (d1, d2, movimientos)
         return d1, d2, movimientos
 
+    def tirar_lote(self, cantidad: int) -> np.ndarray:
+        """Tira 'cantidad' veces de una sola vez (sólo en modo bloque).
+
+        Consume la misma secuencia que llamar a `tirar` 'cantidad' veces.
+
+        Recibe:
+            cantidad (int): número de tiradas.
+        Devuelve:
+            np.ndarray: arreglo (cantidad, 2) de int8 con los dos dados de cada tirada.
+        """
+        if self.__bloque__ is None:
+            raise ValueError("tirar_lote requiere el modo bloque (Dados(bloque=...))")
+        disponibles = len(self.__buffer__) - self.__pos__
+        if cantidad <= disponibles:
+            indices = np.asarray(
+                self.__buffer__[self.__pos__:self.__pos__ + cantidad], dtype=np.intp
+            )
+            self.__pos__ += cantidad
+        else:
+            pendientes = np.asarray(self.__buffer__[self.__pos__:], dtype=np.intp)
+            indices = np.concatenate((pendientes, self._generar(cantidad - disponibles)))
+            self.__pos__ = len(self.__buffer__)
+        lote = np.empty((cantidad, 2), dtype=np.int8)
+        np.floor_divide(indices, 6, out=lote[:, 0], casting="unsafe")
+        np.remainder(indices, 6, out=lote[:, 1], casting="unsafe")
+        lote += 1
+        if cantidad:
+            self.__ultimo_tiro__ = TIRADAS[indices[-1]]
+        return lote
+
+    def _generar(self, cantidad: int) -> np.ndarray:
+        """Genera los índices (0..35) de las próximas 'cantidad' tiradas."""
+        # Una salida de 64 bits por tirada: usar random_raw (y no integers) hace
+        # que la secuencia no dependa de cómo se agrupen los pedidos.
+        crudos = self.__generador__.bit_generator.random_raw(cantidad)
+        return (((crudos >> np.uint64(32)) * np.uint64(36)) >> np.uint64(32)).astype(np.intp)
+
+    def _rellenar(self):
+        """Genera un bloque nuevo de tiradas."""
+        self.__buffer__ = self._generar(self.__bloque__).tolist()
+        self.__pos__ = 0
+
     def ultimo_tiro(self):
         """Devuelve el último tiro registrado (o None si no hubo)."""
         return self.__ultimo_tiro__
@@ -38,10 +138,18 @@ class Dados:
         """Fija la semilla para el generador de números aleatorios.
 
         Recibe:
-            semilla (int): Valor para inicializar el generador.
+            semilla (int | SeedSequence): Valor para inicializar el generador.
         Devuelve:
             None
         """
         self.__semilla__ = semilla
-        self.__rng__ = random.Random(semilla)
-        self.__ultimo_tiro__ = None
\ No newline at end of file
+        self.__ultimo_tiro__ = None
+        if self.__bloque__ is not None:
+            self.__generador__ = np.random.Generator(np.random.PCG64(semilla))
+            self.__buffer__ = []
+            self.__pos__ = 0
+        else:
+            if isinstance(semilla, np.random.SeedSequence):
+                # random.Random sólo acepta enteros: se usan 128 bits de la secuencia.
+                semilla = int.from_bytes(semilla.generate_state(4).tobytes(), "little")
+            self.__rng__ = random.Random(semilla)
@@ -0,0 +1,58 @@
+"""Tablas precalculadas de destinos por lado, origen y dado.
+
+`DESTINOS[lado][origen][dado]` es el punto al que llega una ficha del lado que
+sale de 'origen' (un punto 0..23 o `ORIGEN_BARRA`) con ese dado, o `FUERA`
+si el dado la saca del tablero. Es la única fuente de la aritmética de
+dirección: J1 (lado 0) avanza de 23 a 0 y reingresa desde la barra en 24-dado,
+dentro de la casa de J2; J2 (lado 1) avanza de 0 a 23 y reingresa en dado-1.
+
+La tabla sólo resuelve la geometría. Si el destino está bloqueado o si se
+puede sacar la ficha (todas en casa, dado exacto u over-bearing con la más
+lejana) lo decide quien la consulta, por ejemplo `core.jugadas`.
+"""
+from backgammon.core.perspectiva import espejar_punto, punto_relativo
+from backgammon.core.tablero import PUNTOS
+
+# Origen que representa a la barra en la tabla (no es un punto del tablero).
+ORIGEN_BARRA = PUNTOS
+# Destino que representa sacar la ficha; es el mismo 'hasta' que usa Juego.
+FUERA = PUNTOS
+DADOS = range(1, 7)
+
+
+def _destino(lado: int, origen: int, dado: int) -> int:
+    """Calcula un destino visto desde J1 y lo devuelve en la orientación del lado."""
+    desde = PUNTOS if origen == ORIGEN_BARRA else punto_relativo(origen, lado)
+    hasta = desde - dado
+    if hasta < 0:
+        return FUERA
+    return hasta if lado == 0 else espejar_punto(hasta)
+
+
+# El índice 0 de cada fila queda en None para indexar directamente con el dado.
+DESTINOS = tuple(
+    tuple(
+        (None,) + tuple(_destino(lado, origen, dado) for dado in DADOS)
+        for origen in range(PUNTOS + 1)
+    )
+    for lado in (0, 1)
+)
+
+# Punto que se usa como 'desde' de un reingreso: el primero del recorrido de
+# cada lado (23 para J1, 0 para J2), así que sigue siendo un punto del tablero.
+PUNTO_DE_ENTRADA = (PUNTOS - 1, 0)
+
+
+def destino(lado: int, origen: int, dado: int) -> int:
+    """Devuelve el destino de DESTINOS (ver el docstring del módulo)."""
+    return DESTINOS[lado][origen][dado]
+
+
+def dado_de_entrada(lado: int, hasta: int) -> int:
+    """Dado con el que una ficha del lado reingresa en 'hasta' (puede ser mayor que 6)."""
+    return PUNTOS - punto_relativo(hasta, lado)
+
+
+def puntos_de_entrada(lado: int, dados) -> list[int]:
+    """Puntos donde el lado puede reingresar con los dados dados, sin mirar bloqueos."""
+    return sorted({DESTINOS[lado][ORIGEN_BARRA][dado] for dado in dados})
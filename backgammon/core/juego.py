@@ -1,16 +1,45 @@
 """Módulo que coordina el estado del juego, los dados y el turno actual."""
-from backgammon.core.tablero import Tablero, PUNTOS
+from typing import NamedTuple
+from backgammon.core.tablero import Tablero, PUNTOS, RegistroMovimiento
 from backgammon.core.dados import Dados
+from backgammon.core.jugador import crear_jugadores
+from backgammon.core.zobrist import CLAVES_TURNO, clave_dados
+from backgammon.core.jugadas import generar_jugadas, primeros_movimientos
+from backgammon.core.cache_jugadas import CACHE
+from backgammon.core.destinos import PUNTO_DE_ENTRADA, dado_de_entrada
+from backgammon.core.perspectiva import (
+    lado_de, punto_relativo, distancia_para_salir, celdas_canonicas, espejar_jugada,
+    espejar_movimientos,
+)
+from backgammon.core.mascaras import CASA, hay_fichas_detras
+
+
+class RegistroJugada(NamedTuple):
+    """Registro para deshacer un movimiento aplicado con `Juego.hacer_movimiento`.
+
+    Guarda el registro del tablero, el dado consumido con su posición en la
+    lista de movimientos restantes y el estado previo del juego.
+    """
+    tablero: RegistroMovimiento
+    dado: int
+    indice_dado: int
+    estado: str
 
 
 class Juego:
     """Coordina el estado del juego, los dados y el turno actual."""
 
-    def __init__(self, jugador1, jugador2, indice_inicial=0):
-        """Inicializa el juego con 2 jugadores."""
-        self.__tablero__ = Tablero()
+    def __init__(self, jugador1, jugador2, indice_inicial=0, tablero=None, dados=None):
+        """Inicializa el juego con 2 jugadores.
+
+        'tablero' permite usar otro backend con la API de Tablero
+        (por ejemplo TableroCompacto); por defecto se crea un Tablero vacío.
+        'dados' permite pasar unos Dados ya configurados (por ejemplo en modo
+        bloque para simulaciones); por defecto se crean Dados sin semilla.
+        """
+        self.__tablero__ = tablero if tablero is not None else Tablero()
         self.__jugadores__ = [jugador1, jugador2]
-        self.__dados__ = Dados()
+        self.__dados__ = dados if dados is not None else Dados()
         idx = 0 if indice_inicial not in (0, 1) else indice_inicial
         self.__indice_jugador_actual__ = idx
         self.__barra__ = {jugador1.id: 0, jugador2.id: 0}
@@ -38,6 +67,10 @@ class Juego:
         """Devuelve la lista de instancias de Jugador."""
         return self.__jugadores__
 
+    def lado_actual(self) -> int:
+        """Lado del jugador actual: 0 para J1 (id impar), 1 para J2 (id par)."""
+        return lado_de(self.jugador_actual.id)
+
     def ultimo_error(self):
         """Devuelve el mensaje del último error de movimiento."""
         return self.__ultimo_error__
@@ -46,8 +79,12 @@ class Juego:
         """Establece el mensaje del último error."""
         self.__ultimo_error__ = msg
 
-    def usar_semilla(self, semilla: int):
-        """Fija la semilla para el generador de dados (para reproducibilidad)."""
+    def usar_semilla(self, semilla):
+        """Fija la semilla para el generador de dados (para reproducibilidad).
+
+        Acepta un entero o una SeedSequence de `semilla_derivada` para que cada
+        partida de una simulación en paralelo tenga su propio flujo reproducible.
+        """
         self.__dados__.fijar_semilla(semilla)
 
     def tirar(self):
@@ -60,6 +97,16 @@ class Juego:
         self._actualizar_estado()
         return d1, d2, movimientos
 
+    def fijar_movimientos(self, movimientos):
+        """Reemplaza los dados restantes sin tirar, para búsquedas y análisis.
+
+        Recibe:
+            movimientos (Iterable[int]): dados a usar (por ejemplo de TIRADAS_DISTINTAS).
+        """
+        self.__movs_restantes__ = list(movimientos)
+        self._set_error(None)
+        self._actualizar_estado()
+
     def movimientos_disponibles(self):
         """Devuelve una copia de la lista de movimientos de dados restantes."""
         return list(self.__movs_restantes__)
@@ -72,25 +119,18 @@ class Juego:
 
     def es_ficha_mas_lejana(self, jugador_id: int, punto: int) -> bool:
         """Verifica si la ficha en 'punto' es la más lejana del home board."""
-        # J1 (impar) mueve de 23→0, home en 0-5
-        # J2 (par) mueve de 0→23, home en 18-23
-        if jugador_id % 2 != 0:  # J1
-            # Para J1, la más lejana es la de mayor número
-            for i in range(punto + 1, PUNTOS):
-                if any(f.owner_id == jugador_id for f in self.__tablero__.punto(i)):
-                    return False
-            return True
-        else:  # J2
-            # Para J2, la más lejana es la de menor número
-            for i in range(0, punto):
-                if any(f.owner_id == jugador_id for f in self.__tablero__.punto(i)):
-                    return False
-            return True
+        # J1 (impar) mueve de 23→0 y J2 (par) de 0→23: "más lejos" depende del lado.
+        lado = lado_de(jugador_id)
+        propios, _, _ = self.__tablero__.mascaras(jugador_id)
+        return not hay_fichas_detras(propios, punto, lado)
 
     def _entrada_para(self, pid: int) -> int:
-        """Punto de entrada (desde la barra) para el jugador."""
-        j1_id = self.__jugadores__[0].id
-        return 0 if pid == j1_id else 23
+        """Punto que se usa como origen al reingresar desde la barra (23 para J1, 0 para J2).
+
+        La ficha entra en la casa del rival: J1 en 24-dado y J2 en dado-1
+        (ver core.destinos).
+        """
+        return PUNTO_DE_ENTRADA[lado_de(pid)]
 
     def _en_barra(self, pid: int) -> bool:
         """Verifica si el jugador tiene fichas en la barra."""
@@ -107,10 +147,7 @@ class Juego:
 
         # J1 (impar): home en 0-5, mueve hacia 0
         # J2 (par): home en 18-23, mueve hacia 23
-        if pid % 2 != 0:  # J1
-            distancia = desde + 1
-        else:  # J2
-            distancia = PUNTOS - desde
+        distancia = distancia_para_salir(desde, lado_de(pid))
 
         if distancia in self.__movs_restantes__:
             return True, distancia
@@ -141,11 +178,11 @@ class Juego:
 
         if self._en_barra(pid):
             entrada = self._entrada_para(pid)
-            if desde != entrada:
+            if desde != entrada or hasta == PUNTOS:
                 self._set_error("tenés fichas en la barra: reingresá primero")
                 return False, 0
 
-            distancia = abs(hasta - entrada)
+            distancia = dado_de_entrada(lado_de(pid), hasta)
 
             if self.__tablero__._bloqueado_por_oponente(pid, hasta):
                 self._set_error("destino bloqueado por el oponente")
@@ -156,15 +193,12 @@ class Juego:
 
         else:
             distancia = abs(hasta - desde)
-            # CORRECCIÓN: J1 (impar) debe DECREMENTAR, J2 (par) debe INCREMENTAR
-            if pid % 2 != 0:  # J1 - mueve de mayor a menor (23→0)
-                if hasta >= desde:
-                    self._set_error("el jugador debe moverse hacia adelante")
-                    return False, distancia
-            else:  # J2 - mueve de menor a mayor (0→23)
-                if hasta <= desde:
-                    self._set_error("el jugador debe moverse hacia adelante")
-                    return False, distancia
+            # Visto desde su lado, cada jugador avanza hacia el punto 0
+            # (J1 de 23→0 y J2 de 0→23 en el tablero real).
+            lado = lado_de(pid)
+            if punto_relativo(hasta, lado) >= punto_relativo(desde, lado):
+                self._set_error("el jugador debe moverse hacia adelante")
+                return False, distancia
 
             if not self.__tablero__._jugador_en_punto(pid, desde):
                 self._set_error("no hay ficha del jugador en el origen")
@@ -184,48 +218,96 @@ class Juego:
         self._set_error(None)
         return True, distancia
 
-    def aplicar_movimiento(self, desde: int, hasta: int) -> bool:
-        """Aplica el movimiento (mover, reingresar o sacar) y consume el dado."""
-        ok_pre, distancia = self._validar_movimiento(desde, hasta)
+    def _clave_cache(self, tipo: str) -> tuple:
+        """Clave de `CACHE` para la posición canónica, los dados y el tipo de consulta.
+
+        La posición se toma desde el lado que mueve (ver core.perspectiva), así que
+        una posición y su espejo con el otro jugador al turno comparten la entrada.
+        Los dados van en su orden (el generador los recorre así).
+        """
+        return (
+            self.__tablero__.hash_canonico(self.lado_actual()),
+            tuple(self.__movs_restantes__),
+            tipo,
+        )
+
+    def _argumentos_canonicos(self) -> tuple:
+        """(celdas, lado, dados, entrada) del generador vistos desde el lado que mueve."""
+        return (
+            celdas_canonicas(self.__tablero__.celdas(), self.lado_actual()), 0,
+            self.__movs_restantes__, PUNTO_DE_ENTRADA[0],
+        )
+
+    def jugadas_legales(self) -> list[tuple]:
+        """Enumera las jugadas completas legales para los dados restantes.
+
+        Cada jugada es una tupla de (desde, hasta) que se puede aplicar en orden con
+        mover_ficha. Usa la mayor cantidad posible de dados, el dado mayor cuando
+        sólo se puede usar uno, y no repite jugadas que llegan a la misma posición.
+        Devuelve una lista vacía si no hay dados o ningún movimiento es posible.
+        El resultado pasa por la caché del proceso (`core.cache_jugadas`), que
+        guarda las jugadas en la orientación canónica.
+        """
+        if not self.__movs_restantes__:
+            return []
+        jugadas = CACHE.obtener(
+            self._clave_cache("jugadas"),
+            lambda: generar_jugadas(*self._argumentos_canonicos()),
+        )
+        if self.lado_actual() == 1:
+            return [espejar_jugada(jugada) for jugada in jugadas]
+        return jugadas
+
+    def movimientos_legales(self) -> list[tuple[int, int, int]]:
+        """Devuelve (desde, hasta, dado) de cada movimiento que inicia una jugada legal."""
+        if not self.__movs_restantes__:
+            return []
+        movimientos = CACHE.obtener(
+            self._clave_cache("movimientos"),
+            lambda: primeros_movimientos(*self._argumentos_canonicos()),
+        )
+        if self.lado_actual() == 1:
+            return espejar_movimientos(movimientos)
+        return movimientos
+
+    def hacer_movimiento(self, desde: int, hasta: int) -> RegistroJugada | None:
+        """Aplica el movimiento como aplicar_movimiento y devuelve cómo deshacerlo.
+
+        No cambia el turno aunque se agoten los dados, así que una búsqueda puede
+        encadenar movimientos y volver atrás con deshacer_movimiento sobre el
+        mismo objeto. Devuelve None si el movimiento no es válido.
+        """
+        ok_pre, dado = self._validar_movimiento(desde, hasta)
         if not ok_pre:
-            return False
+            return None
 
         pid = self.jugador_actual.id
-        ok = False
-        dado_consumido = distancia
-
-        if hasta == PUNTOS:
-            ok = self.__tablero__.sacar_ficha(pid, desde)
-            if ok:
-                if pid % 2 != 0:  # J1
-                    distancia_a_salida = desde + 1
-                else:  # J2
-                    distancia_a_salida = PUNTOS - desde
-
-                if distancia not in self.__movs_restantes__:
-                    dado_consumido = self._dado_mayor_que(distancia_a_salida)
-
-                if dado_consumido in self.__movs_restantes__:
-                    self.__movs_restantes__.remove(dado_consumido)
-                else:
-                    ok = False
-
-        elif self._en_barra(pid):
-            ok = self.__tablero__.reingresar_desde_barra(pid, hasta)
-            if ok:
-                self.__movs_restantes__.remove(distancia)
-        else:
-            ok = self.__tablero__.mover_ficha_seguro(pid, desde, hasta)
-            if ok:
-                self.__movs_restantes__.remove(distancia)
+        estado_previo = self.__estado__
+        if hasta != PUNTOS and self._en_barra(pid):
+            desde = None
+        registro = self.__tablero__.hacer_movimiento(pid, desde, hasta)
 
-        if ok:
-            self._set_error(None)
-        else:
+        if registro is None:
             self._set_error(self.__ultimo_error__ or "movimiento inválido")
+            self._actualizar_estado()
+            return None
 
+        indice = self.__movs_restantes__.index(dado)
+        self.__movs_restantes__.pop(indice)
+        self._set_error(None)
         self._actualizar_estado()
-        return ok
+        return RegistroJugada(registro, dado, indice, estado_previo)
+
+    def deshacer_movimiento(self, registro: RegistroJugada):
+        """Revierte un movimiento de hacer_movimiento: tablero, dado y estado."""
+        self.__tablero__.deshacer_movimiento(registro.tablero)
+        self.__movs_restantes__.insert(registro.indice_dado, registro.dado)
+        self.__estado__ = registro.estado
+        self._set_error(None)
+
+    def aplicar_movimiento(self, desde: int, hasta: int) -> bool:
+        """Aplica el movimiento (mover, reingresar o sacar) y consume el dado."""
+        return self.hacer_movimiento(desde, hasta) is not None
 
     def mover_ficha(self, desde: int, hasta: int) -> bool:
         """Aplica el movimiento y si se consumen todos los dados, cambia el turno."""
@@ -269,6 +351,25 @@ class Juego:
                 return j
         return None
 
+    def puntos_victoria(self) -> int:
+        """Puntos de la partida: 1 simple, 2 gammon, 3 backgammon, 0 si no terminó.
+
+        Gammon: el perdedor no sacó ninguna ficha. Backgammon: además tiene
+        fichas en la barra o en el home board del ganador.
+        """
+        ganador = self.ganador()
+        if ganador is None:
+            return 0
+        j1, j2 = self.__jugadores__
+        perdedor = j2 if ganador is j1 else j1
+        if self.__tablero__.fichas_salidas(perdedor.id) > 0:
+            return 1
+        lado_ganador = lado_de(ganador.id)
+        propios, _, _ = self.__tablero__.mascaras(perdedor.id)
+        if self.__tablero__.fichas_en_barra(perdedor.id) > 0 or propios & CASA[lado_ganador]:
+            return 3
+        return 2
+
     def estado_dict(self) -> dict:
         """Devuelve un diccionario con el estado completo del juego."""
         puntos = [self.__tablero__.punto(i)[:] for i in range(PUNTOS)]
@@ -285,6 +386,29 @@ class Juego:
             "salidas": salidas,
         }
 
+    def clave_posicion(self) -> int:
+        """Hash de 64 bits de la posición, el lado que mueve y los dados restantes.
+
+        Combina el hash incremental del tablero con las claves Zobrist del turno
+        y de los dados, por lo que sirve como clave de caché sin recorrer el estado.
+        """
+        return (
+            self.__tablero__.hash_posicion
+            ^ CLAVES_TURNO[self.lado_actual()]
+            ^ clave_dados(self.__movs_restantes__)
+        )
+
+    def clave_canonica(self) -> int:
+        """Como `clave_posicion`, pero con la posición vista desde el lado que mueve.
+
+        Una posición y su espejo con el otro jugador al turno tienen la misma
+        clave, así que sirve para cachés cuyos valores son relativos a quien mueve.
+        """
+        return (
+            self.__tablero__.hash_canonico(self.lado_actual())
+            ^ clave_dados(self.__movs_restantes__)
+        )
+
     def resumen_estado(self) -> str:
         """Devuelve una cadena de texto con el resumen del estado actual."""
         e = self.estado_dict()
@@ -311,4 +435,25 @@ class Juego:
         if self.__tablero__.hay_ganador():
             self.__estado__ = "terminado"
         elif self.__movs_restantes__:
-            self.__estado__ = "en_curso"
\ No newline at end of file
+            self.__estado__ = "en_curso"
+
+
+def juego_inicial(movimientos=None, lado: int = 0, tablero=None,
+                  nombres=("J1", "J2")) -> Juego:
+    """Crea un Juego en la posición inicial estándar, listo para consultar o mover.
+
+    Recibe:
+        movimientos (Sequence[int] | None): dados a fijar; None deja el turno sin tirar.
+        lado (int): lado al turno (0 = J1 con id impar, 1 = J2 con id par).
+        tablero: backend del tablero (por defecto un `Tablero`).
+        nombres (Sequence[str]): nombres de J1 y J2.
+    Devuelve:
+        Juego
+    """
+    juego = Juego(*crear_jugadores(nombres), tablero=tablero)
+    juego.reiniciar()
+    if lado == 1:
+        juego.cambiar_turno()
+    if movimientos is not None:
+        juego.fijar_movimientos(movimientos)
+    return juego
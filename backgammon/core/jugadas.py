@@ -0,0 +1,254 @@
+"""Generador de jugadas legales completas para una tirada.
+
+Trabaja sobre el arreglo plano de `TableroCompacto.celdas()` (o `Tablero.celdas()`),
+modificándolo en el lugar y revirtiendo cada movimiento, así que no crea tableros
+ni fichas durante la búsqueda. Respeta las mismas reglas que
+`Juego._validar_movimiento`: reingreso obligatorio desde la barra, bearing off
+exacto u "over-bearing" con la ficha más lejana. Los destinos de cada dado salen
+de la tabla de `core.destinos`.
+
+Sobre eso aplica las reglas de jugada completa:
+- hay que usar la mayor cantidad posible de dados (4 en dobles);
+- si sólo se puede usar un dado de una tirada no doble, tiene que ser el mayor
+  cuando exista una jugada que lo use;
+- las jugadas que terminan en la misma posición se cuentan una sola vez.
+
+En los dobles los cuatro movimientos usan el mismo dado, así que cualquier
+orden de una jugada lleva a la misma posición. Toda jugada legal se puede
+reordenar moviendo primero las fichas más lejanas (la barra antes que
+todo), y ese orden sigue siendo legal: las llegadas a un punto vienen de
+puntos más lejanos y las fichas de fuera de casa entran antes de sacar.
+Por eso `generar_jugadas` sólo explora los órdenes de origen no creciente
+en la distancia a la salida y descarta los demás apenas aparecen.
+"""
+from backgammon.core.destinos import (
+    DESTINOS, FUERA, ORIGEN_BARRA, PUNTO_DE_ENTRADA,
+)
+from backgammon.core.perspectiva import PIPS_PARA_SALIR
+from backgammon.core.tablero import PUNTOS
+from backgammon.core.tablero_compacto import BARRA, SALIDA
+
+
+def entrada_por_defecto(lado: int) -> int:
+    """Punto que se usa como 'desde' de los reingresos de cada lado (23 para J1, 0 para J2)."""
+    return PUNTO_DE_ENTRADA[lado]
+
+
+def movimientos_simples(celdas, lado: int, dados, entrada: int,
+                        lejania: int = PUNTOS) -> list[tuple]:
+    """Lista los movimientos de UNA ficha posibles con los dados restantes.
+
+    Recibe:
+        celdas (list[int]): arreglo plano del tablero.
+        lado (int): 0 para J1 (id impar), 1 para J2 (id par).
+        dados (Iterable[int]): dados que quedan por usar.
+        entrada (int): 'desde' de los reingresos (ver `entrada_por_defecto`).
+        lejania (int): sólo mueve fichas a esa distancia de la salida o menos
+            (ver `PIPS_PARA_SALIR`); no limita los reingresos.
+    Devuelve:
+        list[tuple[int, int, int]]: (desde, hasta, dado). 'hasta' vale PUNTOS para
+        sacar una ficha y 'desde' es el punto de entrada cuando hay fichas en la barra.
+    """
+    signo = 1 if lado == 0 else -1
+    valores = set(dados)
+    movimientos = []
+    destinos = DESTINOS[lado]
+
+    if celdas[BARRA + lado] > 0:
+        desde_barra = destinos[ORIGEN_BARRA]
+        for dado in valores:
+            hasta = desde_barra[dado]
+            if celdas[hasta] * signo >= -1:
+                movimientos.append((entrada, hasta, dado))
+        return movimientos
+
+    if lado == 0:
+        puede_sacar = max(celdas[6:PUNTOS]) <= 0
+        propios = [p for p in range(min(lejania, PUNTOS)) if celdas[p] > 0]
+        if puede_sacar:
+            mas_lejana = max((p for p in range(6) if celdas[p] > 0), default=None)
+    else:
+        puede_sacar = min(celdas[0:18]) >= 0
+        propios = [p for p in range(max(PUNTOS - lejania, 0), PUNTOS) if celdas[p] < 0]
+        if puede_sacar:
+            mas_lejana = min((p for p in range(18, PUNTOS) if celdas[p] < 0), default=None)
+
+    for desde in propios:
+        fila = destinos[desde]
+        for dado in valores:
+            hasta = fila[dado]
+            if hasta != FUERA and celdas[hasta] * signo >= -1:
+                movimientos.append((desde, hasta, dado))
+
+        if puede_sacar:
+            distancia = PIPS_PARA_SALIR[lado][desde]
+            if distancia in valores:
+                movimientos.append((desde, PUNTOS, distancia))
+            elif desde == mas_lejana:
+                # Over-bearing: sólo la ficha más lejana, con el menor dado que alcance.
+                mayores = [d for d in valores if d > distancia]
+                if mayores:
+                    movimientos.append((desde, PUNTOS, min(mayores)))
+
+    return movimientos
+
+
+def _aplicar(celdas, lado: int, desde: int, hasta: int, desde_barra: bool) -> bool:
+    """Aplica un movimiento ya validado sobre 'celdas'. Devuelve True si hubo hit."""
+    signo = 1 if lado == 0 else -1
+    if desde_barra:
+        celdas[BARRA + lado] -= 1
+    else:
+        celdas[desde] -= signo
+
+    if hasta == PUNTOS:
+        celdas[SALIDA + lado] += 1
+        return False
+    if celdas[hasta] * signo == -1:
+        celdas[hasta] = signo
+        celdas[BARRA + 1 - lado] += 1
+        return True
+    celdas[hasta] += signo
+    return False
+
+
+def _revertir(celdas, lado: int, desde: int, hasta: int, desde_barra: bool, hit: bool):
+    """Deshace exactamente un movimiento aplicado con _aplicar."""
+    signo = 1 if lado == 0 else -1
+    if hasta == PUNTOS:
+        celdas[SALIDA + lado] -= 1
+    elif hit:
+        celdas[hasta] = -signo
+        celdas[BARRA + 1 - lado] -= 1
+    else:
+        celdas[hasta] -= signo
+
+    if desde_barra:
+        celdas[BARRA + lado] += 1
+    else:
+        celdas[desde] += signo
+
+
+class _Busqueda:
+    """Recorrido en profundidad de todas las secuencias de movimientos de una tirada."""
+
+    def __init__(self, celdas, lado: int, dados, entrada: int, podar_dobles: bool = True):
+        self.celdas = list(celdas)
+        self.lado = lado
+        self.entrada = entrada
+        self.dados = tuple(sorted(dados))
+        # En dobles sólo se siguen los órdenes con las fichas más lejanas primero.
+        self.podar = podar_dobles and len(self.dados) > 2
+        # posición final -> (movimientos, dados usados)
+        self.finales = {}
+        # (posición, dados restantes, tope) -> cantidad máxima de dados que se pueden usar
+        self.memo = {}
+        self.camino = []
+        self.usados = []
+        # primer movimiento -> cantidad máxima de dados usando ese primer movimiento
+        self.primeros = {}
+
+    def ejecutar(self):
+        """Explora todas las secuencias y devuelve la cantidad máxima de dados usable."""
+        return self._explorar(self.dados, raiz=True)
+
+    def _explorar(self, dados: tuple, raiz: bool = False, tope: int = PUNTOS) -> int:
+        celdas = self.celdas
+        posicion = tuple(celdas)
+        clave = (posicion, dados, tope)
+        if clave in self.memo:
+            return self.memo[clave]
+
+        movimientos = movimientos_simples(celdas, self.lado, dados, self.entrada, tope)
+        if not movimientos:
+            # Con la poda de dobles también terminan acá órdenes que no siguen con
+            # las fichas más cercanas; usan menos dados que el máximo y se descartan.
+            previo = self.finales.get(posicion)
+            if previo is None or len(previo[0]) < len(self.camino):
+                self.finales[posicion] = (tuple(self.camino), tuple(self.usados))
+            self.memo[clave] = 0
+            return 0
+
+        desde_barra = celdas[BARRA + self.lado] > 0
+        distancias = PIPS_PARA_SALIR[self.lado]
+        mejor = 0
+        for desde, hasta, dado in movimientos:
+            hit = _aplicar(celdas, self.lado, desde, hasta, desde_barra)
+            self.camino.append((desde, hasta))
+            self.usados.append(dado)
+            resto = list(dados)
+            resto.remove(dado)
+            tope_siguiente = distancias[desde] if self.podar and not desde_barra else PUNTOS
+            profundidad = 1 + self._explorar(tuple(resto), tope=tope_siguiente)
+            self.usados.pop()
+            self.camino.pop()
+            _revertir(celdas, self.lado, desde, hasta, desde_barra, hit)
+            if raiz:
+                self.primeros[(desde, hasta, dado)] = profundidad
+            mejor = max(mejor, profundidad)
+
+        self.memo[clave] = mejor
+        return mejor
+
+    def dado_obligatorio(self, maximo: int) -> int | None:
+        """Con un solo dado usable en tirada no doble, devuelve el mayor si se puede usar."""
+        if maximo != 1 or len(set(self.dados)) != 2:
+            return None
+        mayor = self.dados[-1]
+        if any(dado == mayor for (_, _, dado), prof in self.primeros.items() if prof == 1):
+            return mayor
+        return None
+
+
+def generar_jugadas(celdas, lado: int, dados, entrada: int | None = None) -> list[tuple]:
+    """Enumera todas las jugadas completas legales para los dados dados.
+
+    Recibe:
+        celdas (list[int]): arreglo plano del tablero (ver TableroCompacto).
+        lado (int): 0 para J1 (id impar), 1 para J2 (id par).
+        dados (Iterable[int]): dados disponibles (2, o 4 si es doble).
+        entrada (int | None): 'desde' de los reingresos; por defecto 23 para J1 y 0 para J2.
+    Devuelve:
+        list[tuple[tuple[int, int], ...]]: cada jugada es una secuencia de
+        (desde, hasta) aplicable con `Juego.mover_ficha`. Lista vacía si no hay
+        ningún movimiento posible (se pierde el turno).
+    """
+    if entrada is None:
+        entrada = entrada_por_defecto(lado)
+    busqueda = _Busqueda(celdas, lado, dados, entrada)
+    maximo = busqueda.ejecutar()
+    if maximo == 0:
+        return []
+
+    obligatorio = busqueda.dado_obligatorio(maximo)
+    return [
+        movimientos
+        for movimientos, usados in busqueda.finales.values()
+        if len(movimientos) == maximo and (obligatorio is None or usados[0] == obligatorio)
+    ]
+
+
+def primeros_movimientos(celdas, lado: int, dados, entrada: int | None = None) -> list[tuple]:
+    """Devuelve los movimientos que pueden iniciar alguna jugada completa legal.
+
+    A diferencia de `generar_jugadas`, no descarta órdenes equivalentes: si dos
+    movimientos llevan a la misma posición final en distinto orden, ambos
+    aparecen como primer movimiento válido. Es lo que necesitan las interfaces
+    para marcar orígenes y destinos.
+
+    Devuelve:
+        list[tuple[int, int, int]]: (desde, hasta, dado) ordenados.
+    """
+    if entrada is None:
+        entrada = entrada_por_defecto(lado)
+    busqueda = _Busqueda(celdas, lado, dados, entrada, podar_dobles=False)
+    maximo = busqueda.ejecutar()
+    if maximo == 0:
+        return []
+
+    obligatorio = busqueda.dado_obligatorio(maximo)
+    return sorted(
+        movimiento
+        for movimiento, profundidad in busqueda.primeros.items()
+        if profundidad == maximo and (obligatorio is None or movimiento[2] == obligatorio)
+    )
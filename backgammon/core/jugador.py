@@ -26,4 +26,19 @@ class Jugador:
     @property
     def id(self):
         """Devuelve el ID único del jugador."""
-        return self.__id__
\ No newline at end of file
+        return self.__id__
+
+
+def crear_jugadores(nombres) -> tuple[Jugador, Jugador]:
+    """Crea dos jugadores donde el primero tiene id impar (J1) y el segundo par (J2).
+
+    Recibe:
+        nombres (Sequence[str]): nombre de J1 y de J2.
+    Devuelve:
+        tuple[Jugador, Jugador]: (J1, J2), listos para `Juego(j1, j2)`.
+    """
+    primero = Jugador(nombres[0])
+    if primero.id % 2 == 0:
+        # Los ids son globales: si el contador quedó par, se descarta ese id.
+        primero = Jugador(nombres[0])
+    return primero, Jugador(nombres[1])
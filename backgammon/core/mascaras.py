@@ -0,0 +1,77 @@
+"""Máscaras de ocupación de 24 bits: el bit i encendido indica algo sobre el punto i.
+
+Cada tablero mantiene, por lado, tres máscaras:
+- propios: puntos con al menos una ficha del lado;
+- blots: puntos con exactamente una ficha del lado;
+- hechos: puntos con dos o más fichas del lado (bloquean al rival).
+
+Con ellas las preguntas de legalidad y de estructura se resuelven con una sola
+operación entera en lugar de recorrer puntos. El lado es 0 para J1 (id impar,
+mueve 23→0) y 1 para J2 (id par, mueve 0→23), igual que en el resto del core.
+"""
+_PUNTOS = 24
+
+TODOS = (1 << _PUNTOS) - 1
+# Home board de cada lado: J1 en 0-5, J2 en 18-23.
+CASA = (0b111111, 0b111111 << 18)
+FUERA_DE_CASA = (TODOS & ~CASA[0], TODOS & ~CASA[1])
+
+
+def mascaras_desde_celdas(celdas) -> tuple[list[int], list[int], list[int]]:
+    """Calcula las máscaras (propios, blots, hechos) de ambos lados desde el arreglo plano.
+
+    Recibe:
+        celdas (list[int]): arreglo plano de `TableroCompacto` (puntos con signo).
+    Devuelve:
+        tuple[list[int], list[int], list[int]]: cada elemento indexado por lado.
+    """
+    propios = [0, 0]
+    blots = [0, 0]
+    hechos = [0, 0]
+    for punto in range(_PUNTOS):
+        valor = celdas[punto]
+        if valor == 0:
+            continue
+        lado = 0 if valor > 0 else 1
+        bit = 1 << punto
+        propios[lado] |= bit
+        if valor in (1, -1):
+            blots[lado] |= bit
+        else:
+            hechos[lado] |= bit
+    return propios, blots, hechos
+
+
+def mas_lejano(propios: int, lado: int) -> int | None:
+    """Punto más atrasado de la máscara según la dirección del lado, o None si está vacía."""
+    if not propios:
+        return None
+    if lado == 0:
+        return propios.bit_length() - 1
+    return (propios & -propios).bit_length() - 1
+
+
+def hay_fichas_detras(propios: int, punto: int, lado: int) -> bool:
+    """Indica si el lado tiene fichas más lejos de su casa que 'punto'."""
+    if lado == 0:
+        return (propios >> (punto + 1)) != 0
+    return (propios & ((1 << punto) - 1)) != 0
+
+
+def prime_mas_largo(hechos: int) -> int:
+    """Largo de la secuencia más larga de puntos hechos consecutivos (prime)."""
+    largo = 0
+    while hechos:
+        hechos &= hechos >> 1
+        largo += 1
+    return largo
+
+
+def puntos_de(mascara: int) -> list[int]:
+    """Devuelve los índices de los bits encendidos, de menor a mayor."""
+    puntos = []
+    while mascara:
+        bajo = mascara & -mascara
+        puntos.append(bajo.bit_length() - 1)
+        mascara ^= bajo
+    return puntos
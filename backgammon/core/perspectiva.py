@@ -0,0 +1,74 @@
+"""Vista canónica del tablero desde el lado que mueve.
+
+Una posición con J2 al turno es la imagen espejo de una posición con J1 al
+turno: el punto p de un lado es el punto 23-p del otro, y la barra y las fichas
+sacadas se intercambian. Si todo lo que depende de la posición (cachés, tablas
+de transposición, bases de datos y evaluadores) la mira "como si moviera J1",
+las dos orientaciones comparten entradas.
+
+En la orientación canónica el jugador que mueve va de 23 a 0, tiene su casa en
+los puntos 0..5 y el punto p está a p+1 pips de salir. Las jugadas se pasan de
+una orientación a la otra con `espejar_jugada`; sacar una ficha (PUNTOS) queda
+igual.
+"""
+# Mismas dimensiones que core.tablero y core.tablero_compacto (no se importan
+# para evitar un import circular: los tableros usan `lado_de`).
+_PUNTOS = 24
+_BARRA = _PUNTOS
+_SALIDA = _PUNTOS + 2
+
+
+def lado_de(jugador_id: int) -> int:
+    """Lado del jugador: 0 para J1 (id impar, mueve 23→0), 1 para J2 (id par)."""
+    return 0 if jugador_id % 2 != 0 else 1
+
+
+def punto_relativo(punto: int, lado: int) -> int:
+    """Número del punto visto desde 'lado' (el mismo punto para J1, 23-p para J2)."""
+    return punto if lado == 0 else _PUNTOS - 1 - punto
+
+
+def distancia_para_salir(punto: int, lado: int) -> int:
+    """Pips que le faltan a una ficha del lado en 'punto' para salir del tablero."""
+    return punto_relativo(punto, lado) + 1
+
+
+# PIPS_PARA_SALIR[lado][punto] y FUERA_DE_CASA[lado][punto] precalculados: los
+# tableros los consultan en cada cambio de un punto para sus agregados.
+PIPS_PARA_SALIR = tuple(
+    tuple(distancia_para_salir(punto, lado) for punto in range(_PUNTOS)) for lado in (0, 1)
+)
+FUERA_DE_CASA = tuple(tuple(pips > 6 for pips in fila) for fila in PIPS_PARA_SALIR)
+
+
+def espejar_punto(punto: int) -> int:
+    """Punto equivalente en el tablero espejado; PUNTOS (fuera del tablero) no cambia."""
+    return punto if punto == _PUNTOS else _PUNTOS - 1 - punto
+
+
+def espejar_celdas(celdas) -> list[int]:
+    """Devuelve el arreglo plano de `celdas()` con los lados intercambiados.
+
+    Recibe:
+        celdas (Sequence[int]): puntos con signo (+ J1, - J2), barras y salidas.
+    Devuelve:
+        list[int]: la misma posición vista desde el otro lado.
+    """
+    espejo = [-c for c in celdas[_PUNTOS - 1::-1]]
+    espejo += (celdas[_BARRA + 1], celdas[_BARRA], celdas[_SALIDA + 1], celdas[_SALIDA])
+    return espejo
+
+
+def celdas_canonicas(celdas, lado: int) -> list[int]:
+    """Celdas vistas desde 'lado' como si fuera J1 (copia sin cambios para el lado 0)."""
+    return list(celdas) if lado == 0 else espejar_celdas(celdas)
+
+
+def espejar_jugada(jugada) -> tuple:
+    """Pasa una jugada ((desde, hasta), ...) a la otra orientación."""
+    return tuple((espejar_punto(desde), espejar_punto(hasta)) for desde, hasta in jugada)
+
+
+def espejar_movimientos(movimientos) -> list[tuple[int, int, int]]:
+    """Pasa movimientos (desde, hasta, dado) a la otra orientación, ordenados."""
+    return sorted((espejar_punto(d), espejar_punto(h), dado) for d, h, dado in movimientos)
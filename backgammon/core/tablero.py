@@ -1,5 +1,11 @@
 """Estructura del tablero: puntos, barra y salidas."""
+from typing import NamedTuple
 from backgammon.core.checker import Checker
+from backgammon.core.zobrist import (
+    CLAVES_PUNTO_DOBLES, CLAVES_BARRA_DOBLES, CLAVES_SALIDA_DOBLES, MASCARA_64,
+)
+from backgammon.core.mascaras import mas_lejano
+from backgammon.core.perspectiva import FUERA_DE_CASA, PIPS_PARA_SALIR, lado_de
 
 PUNTOS = 24
 FICHAS_POR_JUGADOR = 15
@@ -7,20 +13,168 @@ HOME_BOARD_J1 = range(18, 24)
 HOME_BOARD_J2 = range(0, 6)
 
 
+class RegistroMovimiento(NamedTuple):
+    """Datos necesarios para deshacer exactamente un movimiento del tablero.
+
+    'desde' es None si la ficha reingresó desde la barra y 'hasta' vale PUNTOS
+    si salió del tablero (bearing off). 'golpeado' es el id del rival enviado a
+    la barra por el movimiento, o None si no hubo hit.
+    """
+    jugador_id: int
+    desde: int | None
+    hasta: int
+    golpeado: int | None
+
+
+class _Agregados:
+    """Contadores incrementales de un jugador en `Tablero`.
+
+    'cuentas' son sus fichas en cada punto; 'pips' y 'fuera_de_casa' sólo
+    cuentan fichas en puntos (la barra se suma al consultar). 'blots' y
+    'hechos' son máscaras de 24 bits (ver core.mascaras); la de puntos propios
+    es blots | hechos.
+    """
+
+    __slots__ = ("lado", "cuentas", "pips", "fuera_de_casa", "blots", "hechos")
+
+    def __init__(self, lado: int):
+        self.lado = lado
+        self.cuentas = [0] * PUNTOS
+        self.pips = 0
+        self.fuera_de_casa = 0
+        self.blots = 0
+        self.hechos = 0
+
+
+# Agregados de un jugador que todavía no tiene fichas en el tablero (sólo lectura).
+_VACIOS = _Agregados(0)
+
+
+class _Puntos(list):
+    """Lista de los 24 puntos que avisa al tablero cuando se reemplaza un punto entero.
+
+    Permite asignar `tablero.__puntos__[i] = [...]` (como hacen los tests para
+    armar posiciones) sin desincronizar el hash, los agregados ni las máscaras.
+    """
+
+    def __init__(self, tablero):
+        super().__init__([] for _ in range(PUNTOS))
+        self.__tablero__ = tablero
+
+    def __setitem__(self, i, casilla):
+        anterior = self[i]
+        super().__setitem__(i, casilla)
+        self.__tablero__._resincronizar_punto(i, anterior)
+
+
 class Tablero:
     """Tablero con 24 puntos, barra y utilidades de movimiento y fin de juego."""
 
     def __init__(self):
         """Inicializa un tablero vacío."""
-        self.__puntos__ = [[] for _ in range(PUNTOS)]
+        self.__puntos__ = _Puntos(self)
         self.__salidas__ = {}
         self.__barra__ = {}
+        # Hash en los 64 bits bajos y hash espejado en los altos (ver core.zobrist).
+        self.__zobrist__ = 0
+        self._reiniciar_agregados()
 
     def preparar_posicion_inicial(self):
         """Limpia todos los puntos, la barra y las salidas del tablero."""
-        self.__puntos__ = [[] for _ in range(PUNTOS)]
+        self.__puntos__ = _Puntos(self)
         self.__salidas__ = {}
         self.__barra__ = {}
+        # Hash en los 64 bits bajos y hash espejado en los altos (ver core.zobrist).
+        self.__zobrist__ = 0
+        self._reiniciar_agregados()
+
+    @property
+    def hash_posicion(self) -> int:
+        """Hash Zobrist de 64 bits de puntos, barra y salidas (se mantiene incremental)."""
+        return self.__zobrist__ & MASCARA_64
+
+    def hash_canonico(self, lado: int) -> int:
+        """Hash de la posición vista desde 'lado' (ver core.perspectiva).
+
+        Para el lado 0 es `hash_posicion`; para el lado 1 es el hash del tablero
+        espejado, que también se mantiene incremental.
+        """
+        return self.__zobrist__ & MASCARA_64 if lado == 0 else self.__zobrist__ >> 64
+
+    def _actualizar_punto(self, jugador_id: int, punto: int, delta: int):
+        """Suma 'delta' a la cantidad del jugador en 'punto' y actualiza hash y agregados.
+
+        La lista del punto ya tiene que reflejar el cambio. Todo se actualiza a
+        partir de 'delta' y del contador por (jugador, punto), sin recorrer listas.
+        """
+        agregados = self.__agregados__.get(jugador_id)
+        if agregados is None:
+            agregados = self.__agregados__[jugador_id] = _Agregados(lado_de(jugador_id))
+        lado = agregados.lado
+        cuentas = agregados.cuentas
+        antes = cuentas[punto]
+        despues = antes + delta
+        cuentas[punto] = despues
+        claves = CLAVES_PUNTO_DOBLES[lado][punto]
+        self.__zobrist__ ^= claves[antes] ^ claves[despues]
+
+        agregados.pips += delta * PIPS_PARA_SALIR[lado][punto]
+        if FUERA_DE_CASA[lado][punto]:
+            agregados.fuera_de_casa += delta
+
+        # Las máscaras sólo cambian cuando el punto pasa por 0, 1 o 2 fichas.
+        if antes < 2 or despues < 2:
+            bit = 1 << punto
+            if despues == 0:
+                agregados.blots &= ~bit
+                agregados.hechos &= ~bit
+            elif despues == 1:
+                agregados.blots |= bit
+                agregados.hechos &= ~bit
+            else:
+                agregados.blots &= ~bit
+                agregados.hechos |= bit
+
+    def _resincronizar_punto(self, punto: int, anterior: list):
+        """Ajusta contadores, hash, agregados y máscaras tras reemplazar la lista de 'punto'."""
+        casilla = self.__puntos__[punto]
+        for pid in {f.owner_id for f in anterior} | {f.owner_id for f in casilla}:
+            cantidad = sum(1 for f in casilla if f.owner_id == pid)
+            actual = self.__agregados__.get(pid, _VACIOS).cuentas[punto]
+            if cantidad != actual:
+                self._actualizar_punto(pid, punto, cantidad - actual)
+
+    def _reiniciar_agregados(self):
+        """Pone en cero los agregados y las máscaras de ocupación de cada jugador."""
+        # Por id de jugador, igual que barra y salidas.
+        self.__agregados__ = {}
+
+    def mascaras(self, jugador_id: int) -> tuple[int, int, int]:
+        """Devuelve las máscaras de 24 bits (propios, blots, hechos) del jugador."""
+        agregados = self.__agregados__.get(jugador_id, _VACIOS)
+        return agregados.blots | agregados.hechos, agregados.blots, agregados.hechos
+
+    def pips(self, jugador_id: int) -> int:
+        """Pip count del jugador: distancia total para sacar todas sus fichas.
+
+        Cada ficha en la barra cuenta 25. Se mantiene incremental (O(1)).
+        """
+        pips = self.__agregados__.get(jugador_id, _VACIOS).pips
+        return pips + 25 * self.fichas_en_barra(jugador_id)
+
+    def fichas_fuera_de_casa(self, jugador_id: int) -> int:
+        """Cantidad de fichas del jugador fuera de su home board (incluye la barra)."""
+        fuera = self.__agregados__.get(jugador_id, _VACIOS).fuera_de_casa
+        return fuera + self.fichas_en_barra(jugador_id)
+
+    def punto_mas_lejano(self, jugador_id: int) -> int | None:
+        """Punto de la ficha más atrasada del jugador en el tablero, o None si no tiene.
+
+        Para J1 (impar) es el punto de mayor número; para J2 (par), el de menor.
+        No tiene en cuenta las fichas en la barra.
+        """
+        propios, _, _ = self.mascaras(jugador_id)
+        return mas_lejano(propios, lado_de(jugador_id))
 
     def posicion_inicial_estandar(self, j1_id: int, j2_id: int):
         """
@@ -47,11 +201,27 @@ class Tablero:
         self.validar_indice_punto(i)
         return self.__puntos__[i]
 
+    def celdas(self) -> list[int]:
+        """Devuelve el tablero en el formato plano de TableroCompacto.
+
+        Puntos 0..23 con signo (+ fichas de ids impares, - de ids pares), seguidos
+        de la barra (24, 25) y las salidas (26, 27) de cada lado.
+        """
+        celdas = [0] * (PUNTOS + 4)
+        for i, casilla in enumerate(self.__puntos__):
+            for ficha in casilla:
+                celdas[i] += 1 if lado_de(ficha.owner_id) == 0 else -1
+        for pid, cantidad in self.__barra__.items():
+            celdas[PUNTOS + lado_de(pid)] += cantidad
+        for pid, cantidad in self.__salidas__.items():
+            celdas[PUNTOS + 2 + lado_de(pid)] += cantidad
+        return celdas
+
     def colocar_ficha(self, jugador_id: int, punto: int):
         """Coloca una ficha de un jugador en un punto."""
         self.validar_indice_punto(punto)
-        ficha = Checker(jugador_id)
-        self.__puntos__[punto].append(ficha)
+        self.__puntos__[punto].append(Checker(jugador_id))
+        self._actualizar_punto(jugador_id, punto, 1)
         return True
 
     def quitar_ficha(self, jugador_id: int, punto: int):
@@ -62,6 +232,7 @@ class Tablero:
         for i, ficha in enumerate(casilla):
             if ficha.owner_id == jugador_id:
                 casilla.pop(i)
+                self._actualizar_punto(jugador_id, punto, -1)
                 return True
         return False
 
@@ -81,18 +252,32 @@ class Tablero:
 
     def enviar_a_barra(self, jugador_id):
         """Incrementa el contador de fichas en la barra para un jugador."""
-        self.__barra__[jugador_id] = self.fichas_en_barra(jugador_id) + 1
+        self._sumar_barra(jugador_id, 1)
         return self.__barra__[jugador_id]
 
+    def _sumar_barra(self, jugador_id: int, delta: int):
+        """Suma 'delta' fichas a la barra del jugador y actualiza el hash."""
+        antes = self.fichas_en_barra(jugador_id)
+        self.__barra__[jugador_id] = antes + delta
+        claves = CLAVES_BARRA_DOBLES[lado_de(jugador_id)]
+        self.__zobrist__ ^= claves[antes] ^ claves[antes + delta]
+
     def fichas_salidas(self, jugador_id):
         """Devuelve el número de fichas que el jugador ha sacado."""
         return self.__salidas__.get(jugador_id, 0)
 
     def registrar_salida(self, jugador_id):
         """Incrementa el contador de fichas fuera del tablero (Bearing Off)."""
-        self.__salidas__[jugador_id] = self.fichas_salidas(jugador_id) + 1
+        self._sumar_salida(jugador_id, 1)
         return self.__salidas__[jugador_id]
 
+    def _sumar_salida(self, jugador_id: int, delta: int):
+        """Suma 'delta' al contador de fichas sacadas del jugador y actualiza el hash."""
+        antes = self.fichas_salidas(jugador_id)
+        self.__salidas__[jugador_id] = antes + delta
+        claves = CLAVES_SALIDA_DOBLES[lado_de(jugador_id)]
+        self.__zobrist__ ^= claves[antes] ^ claves[antes + delta]
+
     def hay_ganador(self):
         """Retorna True si algún jugador ha sacado todas sus fichas."""
         for cantidad in self.__salidas__.values():
@@ -110,17 +295,15 @@ class Tablero:
     def _jugador_en_punto(self, jugador_id: int, punto: int):
         """Verifica si el jugador tiene fichas en el punto."""
         self.validar_indice_punto(punto)
-        return any(f.owner_id == jugador_id for f in self.__puntos__[punto])
+        return self.__agregados__.get(jugador_id, _VACIOS).cuentas[punto] > 0
 
     def _bloqueado_por_oponente(self, jugador_id: int, punto: int):
         """Verifica si el punto está bloqueado (dos o más fichas rivales)."""
         self.validar_indice_punto(punto)
-        destino = self.__puntos__[punto]
-        if not destino:
-            return False
-
-        rival = destino[0].owner_id != jugador_id
-        return rival and len(destino) >= 2
+        for pid, agregados in self.__agregados__.items():
+            if pid != jugador_id and agregados.cuentas[punto] >= 2:
+                return True
+        return False
 
     def mover_ficha_seguro(self, jugador_id: int, desde: int, hasta: int):
         """Mueve una ficha, aplicando reglas de hit/bloqueo, sin reingreso de barra."""
@@ -133,25 +316,28 @@ class Tablero:
         if self._bloqueado_por_oponente(jugador_id, hasta):
             return False
 
+        self._golpear_blot(jugador_id, hasta)
+
+        casilla = self.__puntos__[desde]
+        for i, f in enumerate(casilla):
+            if f.owner_id == jugador_id:
+                self.__puntos__[hasta].append(casilla.pop(i))
+                self._actualizar_punto(jugador_id, desde, -1)
+                self._actualizar_punto(jugador_id, hasta, 1)
+                return True
+
+        return False
+
+    def _golpear_blot(self, jugador_id: int, hasta: int):
+        """Si en 'hasta' hay una sola ficha rival, la envía a la barra (hit)."""
         destino = self.__puntos__[hasta]
 
         if destino and destino[0].owner_id != jugador_id and len(destino) == 1:
             rival_id = destino[0].owner_id
             destino.pop(0)
+            self._actualizar_punto(rival_id, hasta, -1)
             self.enviar_a_barra(rival_id)
 
-        ficha_a_mover = None
-        for i, f in enumerate(self.__puntos__[desde]):
-            if f.owner_id == jugador_id:
-                ficha_a_mover = self.__puntos__[desde].pop(i)
-                break
-
-        if ficha_a_mover:
-            self.__puntos__[hasta].append(ficha_a_mover)
-            return True
-
-        return False
-
     def reingresar_desde_barra(self, jugador_id: int, hasta: int) -> bool:
         """Intenta reingresar una ficha de la barra al punto 'hasta'."""
         self.validar_indice_punto(hasta)
@@ -161,35 +347,16 @@ class Tablero:
         if self._bloqueado_por_oponente(jugador_id, hasta):
             return False
 
-        destino = self.__puntos__[hasta]
+        self._golpear_blot(jugador_id, hasta)
 
-        if destino and destino[0].owner_id != jugador_id and len(destino) == 1:
-            rival_id = destino[0].owner_id
-            destino.pop(0)
-            self.enviar_a_barra(rival_id)
-
-        ficha_reingreso = Checker(jugador_id)
-        self.__barra__[jugador_id] = self.fichas_en_barra(jugador_id) - 1
-        self.__puntos__[hasta].append(ficha_reingreso)
+        self._sumar_barra(jugador_id, -1)
+        self.colocar_ficha(jugador_id, hasta)
         return True
 
     def puede_sacar_fichas(self, jugador_id: int) -> bool:
         """Verifica si el jugador tiene todas sus fichas restantes en su home board."""
-        # J1 (impar): home en 0-5, revisar 6-23
-        # J2 (par): home en 18-23, revisar 0-17
-        if jugador_id % 2 != 0:  # J1
-            puntos_a_revisar = range(6, 24)
-        else:  # J2
-            puntos_a_revisar = range(0, 18)
-
-        if self.fichas_en_barra(jugador_id) > 0:
-            return False
-
-        for i in puntos_a_revisar:
-            if any(f.owner_id == jugador_id for f in self.__puntos__[i]):
-                return False
-
-        return True
+        # J1 (impar): home en 0-5; J2 (par): home en 18-23.
+        return self.fichas_fuera_de_casa(jugador_id) == 0
 
     def sacar_ficha(self, jugador_id: int, desde: int) -> bool:
         """Intenta sacar una ficha (bearing off) desde 'desde'."""
@@ -200,4 +367,58 @@ class Tablero:
             self.registrar_salida(jugador_id)
             return True
 
-        return False
\ No newline at end of file
+        return False
+
+    def _blot_rival(self, jugador_id: int, punto: int) -> int | None:
+        """Devuelve el id del rival si en 'punto' hay un único blot suyo, o None."""
+        destino = self.__puntos__[punto]
+        if len(destino) == 1 and destino[0].owner_id != jugador_id:
+            return destino[0].owner_id
+        return None
+
+    def hacer_movimiento(self, jugador_id: int, desde: int | None, hasta: int):
+        """Aplica un movimiento y devuelve el registro para deshacerlo.
+
+        Recibe:
+            jugador_id (int): dueño de la ficha.
+            desde (int | None): punto de origen, o None para reingresar desde la barra.
+            hasta (int): punto de destino, o PUNTOS para sacar la ficha.
+        Devuelve:
+            RegistroMovimiento | None: None si el movimiento no se pudo aplicar
+            (en ese caso el tablero no cambia).
+        """
+        if hasta == PUNTOS:
+            if desde is None or not self.sacar_ficha(jugador_id, desde):
+                return None
+            return RegistroMovimiento(jugador_id, desde, hasta, None)
+
+        self.validar_indice_punto(hasta)
+        golpeado = self._blot_rival(jugador_id, hasta)
+        if desde is None:
+            ok = self.reingresar_desde_barra(jugador_id, hasta)
+        else:
+            ok = self.mover_ficha_seguro(jugador_id, desde, hasta)
+        if not ok:
+            return None
+        return RegistroMovimiento(jugador_id, desde, hasta, golpeado)
+
+    def deshacer_movimiento(self, registro: RegistroMovimiento):
+        """Revierte el movimiento descrito por 'registro' (el último aplicado).
+
+        Devuelve la ficha a su origen (o a la barra), reinstala el blot golpeado y
+        descuenta la salida, dejando también el hash como estaba.
+        """
+        jugador_id, desde, hasta, golpeado = registro
+        if hasta == PUNTOS:
+            self._sumar_salida(jugador_id, -1)
+            self.colocar_ficha(jugador_id, desde)
+            return
+
+        self.quitar_ficha(jugador_id, hasta)
+        if golpeado is not None:
+            self._sumar_barra(golpeado, -1)
+            self.colocar_ficha(golpeado, hasta)
+        if desde is None:
+            self._sumar_barra(jugador_id, 1)
+        else:
+            self.colocar_ficha(jugador_id, desde)
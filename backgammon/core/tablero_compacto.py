@@ -0,0 +1,420 @@
+"""Tablero compacto: cada punto es un entero con signo dentro de un arreglo plano.
+
+Alternativa a `Tablero` con la misma API pública pensada para bots y simulaciones
+sin interfaz: mover una ficha es sumar y restar enteros, sin crear objetos `Checker`
+ni recorrer listas.
+"""
+from backgammon.core.checker import Checker
+from backgammon.core.tablero import PUNTOS, FICHAS_POR_JUGADOR, RegistroMovimiento
+from backgammon.core.zobrist import (
+    CLAVES_PUNTO_DOBLES, CLAVES_BARRA_DOBLES, CLAVES_SALIDA_DOBLES, MASCARA_64,
+)
+from backgammon.core.mascaras import mas_lejano
+from backgammon.core.perspectiva import FUERA_DE_CASA, PIPS_PARA_SALIR, lado_de
+
+# Distribución de las celdas del arreglo:
+#   0..23 → puntos (positivo: fichas del lado impar/J1, negativo: lado par/J2)
+#   24, 25 → barra de J1 y de J2
+#   26, 27 → fichas sacadas (bearing off) de J1 y de J2
+BARRA = PUNTOS
+SALIDA = PUNTOS + 2
+CELDAS = PUNTOS + 4
+
+
+class TableroCompacto:
+    """Tablero respaldado por un arreglo de 28 enteros (puntos, barra y salidas).
+
+    El signo de cada punto indica el dueño (+ para J1, - para J2) y el valor
+    absoluto la cantidad de fichas. Cada lado queda asociado al primer id de
+    jugador con esa paridad que se usa para colocar, mover o enviar fichas.
+    """
+
+    def __init__(self):
+        """Inicializa un tablero vacío."""
+        self.__celdas__ = [0] * CELDAS
+        self.__ids__ = [None, None]
+        # Hash en los 64 bits bajos y hash espejado en los altos (ver core.zobrist).
+        self.__zobrist__ = 0
+        self._reiniciar_agregados()
+
+    @classmethod
+    def desde_celdas(cls, celdas, j1_id: int, j2_id: int) -> "TableroCompacto":
+        """Crea un tablero con las celdas dadas (formato de `celdas()`) y esos ids.
+
+        Recibe:
+            celdas (Sequence[int]): arreglo plano de CELDAS enteros.
+            j1_id (int): id impar del jugador que mueve 23→0.
+            j2_id (int): id par del jugador que mueve 0→23.
+        Devuelve:
+            TableroCompacto: tablero con hash y agregados calculados.
+        """
+        tablero = cls()
+        for punto in range(PUNTOS):
+            pid = j1_id if celdas[punto] > 0 else j2_id
+            for _ in range(abs(celdas[punto])):
+                tablero.colocar_ficha(pid, punto)
+        for lado, pid in enumerate((j1_id, j2_id)):
+            for _ in range(celdas[BARRA + lado]):
+                tablero.enviar_a_barra(pid)
+            for _ in range(celdas[SALIDA + lado]):
+                tablero.registrar_salida(pid)
+        return tablero
+
+    def preparar_posicion_inicial(self):
+        """Limpia todos los puntos, la barra y las salidas del tablero."""
+        self.__celdas__ = [0] * CELDAS
+        self.__ids__ = [None, None]
+        # Hash en los 64 bits bajos y hash espejado en los altos (ver core.zobrist).
+        self.__zobrist__ = 0
+        self._reiniciar_agregados()
+
+    def posicion_inicial_estandar(self, j1_id: int, j2_id: int):
+        """
+        Configura el tablero con la distribución de fichas inicial estándar de Backgammon.
+        """
+        self.preparar_posicion_inicial()
+
+        posiciones = [
+            (j1_id, 23, 2), (j1_id, 12, 5), (j1_id, 7, 3), (j1_id, 5, 5),
+            (j2_id, 0, 2), (j2_id, 11, 5), (j2_id, 16, 3), (j2_id, 18, 5)
+        ]
+
+        for pid, punto, cantidad in posiciones:
+            for _ in range(cantidad):
+                self.colocar_ficha(pid, punto)
+
+    def _reiniciar_agregados(self):
+        """Pone en cero los agregados y las máscaras de ocupación de cada lado."""
+        # Sólo cuentan las fichas en puntos: la barra se suma al consultar.
+        self.__pips__ = [0, 0]
+        self.__fuera_de_casa__ = [0, 0]
+        # Máscaras de 24 bits por lado (ver core.mascaras); la de puntos propios
+        # es blots | hechos y se arma al consultarla.
+        self.__blots__ = [0, 0]
+        self.__hechos__ = [0, 0]
+
+    def _lado(self, jugador_id: int, registrar: bool = False) -> int | None:
+        """Devuelve el lado (0/1) del jugador, o None si el lado es de otro id.
+
+        Con registrar=True asocia el id al lado libre; si el lado ya pertenece a
+        otro jugador con la misma paridad lanza ValueError.
+        """
+        lado = lado_de(jugador_id)
+        actual = self.__ids__[lado]
+        if actual == jugador_id:
+            return lado
+        if actual is None:
+            if registrar:
+                self.__ids__[lado] = jugador_id
+            return lado
+        if registrar:
+            raise ValueError(
+                f"el lado de {actual} ya está en uso: no se puede usar el id {jugador_id}"
+            )
+        return None
+
+    def validar_indice_punto(self, i):
+        """Valida si el índice de punto está dentro del rango 0..23."""
+        if not 0 <= i < PUNTOS:
+            raise ValueError("índice de punto inválido: " + str(i))
+
+    @property
+    def hash_posicion(self) -> int:
+        """Hash Zobrist de 64 bits de puntos, barra y salidas (se mantiene incremental)."""
+        return self.__zobrist__ & MASCARA_64
+
+    def hash_canonico(self, lado: int) -> int:
+        """Hash de la posición vista desde 'lado' (ver `Tablero.hash_canonico`)."""
+        return self.__zobrist__ & MASCARA_64 if lado == 0 else self.__zobrist__ >> 64
+
+    def _sumar_en_punto(self, lado: int, punto: int, delta: int):
+        """Suma 'delta' fichas del lado en 'punto' (el punto debe ser del lado o vacío).
+
+        Actualiza también el hash, los agregados (pips y fichas fuera de casa) y
+        las máscaras de ocupación del lado, sólo a partir de 'delta' y de las
+        cantidades antes y después.
+        """
+        celdas = self.__celdas__
+        if lado == 0:
+            antes = celdas[punto]
+            despues = antes + delta
+            celdas[punto] = despues
+        else:
+            antes = -celdas[punto]
+            despues = antes + delta
+            celdas[punto] = -despues
+        claves = CLAVES_PUNTO_DOBLES[lado][punto]
+        self.__zobrist__ ^= claves[antes] ^ claves[despues]
+
+        self.__pips__[lado] += delta * PIPS_PARA_SALIR[lado][punto]
+        if FUERA_DE_CASA[lado][punto]:
+            self.__fuera_de_casa__[lado] += delta
+
+        # Las máscaras sólo cambian cuando el punto pasa por 0, 1 o 2 fichas.
+        if antes < 2 or despues < 2:
+            bit = 1 << punto
+            if despues == 0:
+                self.__blots__[lado] &= ~bit
+                self.__hechos__[lado] &= ~bit
+            elif despues == 1:
+                self.__blots__[lado] |= bit
+                self.__hechos__[lado] &= ~bit
+            else:
+                self.__blots__[lado] &= ~bit
+                self.__hechos__[lado] |= bit
+
+    def mascaras(self, jugador_id: int) -> tuple[int, int, int]:
+        """Devuelve las máscaras de 24 bits (propios, blots, hechos) del jugador."""
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return 0, 0, 0
+        blots, hechos = self.__blots__[lado], self.__hechos__[lado]
+        return blots | hechos, blots, hechos
+
+    def pips(self, jugador_id: int) -> int:
+        """Pip count del jugador (cada ficha en la barra cuenta 25). O(1)."""
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return 0
+        return self.__pips__[lado] + 25 * self.__celdas__[BARRA + lado]
+
+    def fichas_fuera_de_casa(self, jugador_id: int) -> int:
+        """Cantidad de fichas del jugador fuera de su home board (incluye la barra)."""
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return 0
+        return self.__fuera_de_casa__[lado] + self.__celdas__[BARRA + lado]
+
+    def punto_mas_lejano(self, jugador_id: int) -> int | None:
+        """Punto de la ficha más atrasada del jugador en el tablero, o None si no tiene."""
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return None
+        return mas_lejano(self.__blots__[lado] | self.__hechos__[lado], lado)
+
+    def _sumar_contador(self, celda: int, delta: int):
+        """Suma 'delta' a una celda de barra o salida y actualiza los dos hashes."""
+        antes = self.__celdas__[celda]
+        self.__celdas__[celda] = antes + delta
+        tabla = CLAVES_BARRA_DOBLES if celda < SALIDA else CLAVES_SALIDA_DOBLES
+        claves = tabla[(celda - BARRA) % 2]
+        self.__zobrist__ ^= claves[antes] ^ claves[antes + delta]
+
+    def celdas(self) -> list[int]:
+        """Devuelve una copia del arreglo plano (puntos, barra y salidas)."""
+        return self.__celdas__[:]
+
+    def punto(self, i):
+        """Devuelve una lista NUEVA de fichas (objetos Checker) en un punto.
+
+        A diferencia de `Tablero.punto`, modificar la lista no altera el tablero.
+        """
+        self.validar_indice_punto(i)
+        valor = self.__celdas__[i]
+        if valor == 0:
+            return []
+        pid = self.__ids__[0 if valor > 0 else 1]
+        return [Checker(pid) for _ in range(abs(valor))]
+
+    def colocar_ficha(self, jugador_id: int, punto: int):
+        """Coloca una ficha de un jugador en un punto.
+
+        Devuelve False si el punto está ocupado por el rival (la representación
+        con signo no admite fichas de ambos jugadores en un mismo punto).
+        """
+        self.validar_indice_punto(punto)
+        lado = self._lado(jugador_id, registrar=True)
+        signo = 1 if lado == 0 else -1
+        if self.__celdas__[punto] * signo < 0:
+            return False
+        self._sumar_en_punto(lado, punto, 1)
+        return True
+
+    def quitar_ficha(self, jugador_id: int, punto: int):
+        """Quita UNA ficha de un jugador de un punto."""
+        self.validar_indice_punto(punto)
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return False
+        signo = 1 if lado == 0 else -1
+        if self.__celdas__[punto] * signo <= 0:
+            return False
+        self._sumar_en_punto(lado, punto, -1)
+        return True
+
+    def mover_ficha(self, jugador_id, desde, hasta):
+        """Mueve una ficha SIN validación de bloqueo ni de hit. Usar mover_ficha_seguro."""
+        self.validar_indice_punto(desde)
+        self.validar_indice_punto(hasta)
+
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return False
+        signo = 1 if lado == 0 else -1
+        celdas = self.__celdas__
+        if celdas[desde] * signo <= 0 or celdas[hasta] * signo < 0:
+            return False
+        self._sumar_en_punto(lado, desde, -1)
+        self._sumar_en_punto(lado, hasta, 1)
+        return True
+
+    def fichas_en_barra(self, jugador_id):
+        """Devuelve el número de fichas del jugador en la barra."""
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return 0
+        return self.__celdas__[BARRA + lado]
+
+    def enviar_a_barra(self, jugador_id):
+        """Incrementa el contador de fichas en la barra para un jugador."""
+        lado = self._lado(jugador_id, registrar=True)
+        self._sumar_contador(BARRA + lado, 1)
+        return self.__celdas__[BARRA + lado]
+
+    def fichas_salidas(self, jugador_id):
+        """Devuelve el número de fichas que el jugador ha sacado."""
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return 0
+        return self.__celdas__[SALIDA + lado]
+
+    def registrar_salida(self, jugador_id):
+        """Incrementa el contador de fichas fuera del tablero (Bearing Off)."""
+        lado = self._lado(jugador_id, registrar=True)
+        self._sumar_contador(SALIDA + lado, 1)
+        return self.__celdas__[SALIDA + lado]
+
+    def hay_ganador(self):
+        """Retorna True si algún jugador ha sacado todas sus fichas."""
+        return self.id_ganador() is not None
+
+    def id_ganador(self):
+        """Retorna el ID del jugador que ha sacado todas sus fichas, o None."""
+        for lado in (0, 1):
+            if self.__celdas__[SALIDA + lado] == FICHAS_POR_JUGADOR:
+                return self.__ids__[lado]
+        return None
+
+    def _jugador_en_punto(self, jugador_id: int, punto: int):
+        """Verifica si el jugador tiene fichas en el punto."""
+        self.validar_indice_punto(punto)
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return False
+        return self.__celdas__[punto] * (1 if lado == 0 else -1) > 0
+
+    def _bloqueado_por_oponente(self, jugador_id: int, punto: int):
+        """Verifica si el punto está bloqueado (dos o más fichas rivales)."""
+        self.validar_indice_punto(punto)
+        rival = 1 - lado_de(jugador_id)
+        return (self.__hechos__[rival] >> punto) & 1 == 1
+
+    def _ocupar_destino(self, lado: int, hasta: int) -> bool:
+        """Ocupa 'hasta' con una ficha del lado, golpeando un blot rival.
+
+        Devuelve False (sin modificar nada) si el destino está bloqueado.
+        """
+        valor = self.__celdas__[hasta]
+        if lado == 1:
+            valor = -valor
+        if valor <= -2:
+            return False
+        if valor == -1:
+            # Hit: la ficha rival va a su barra y el punto pasa a ser propio.
+            rival = 1 - lado
+            self._sumar_en_punto(rival, hasta, -1)
+            self._sumar_contador(BARRA + rival, 1)
+        self._sumar_en_punto(lado, hasta, 1)
+        return True
+
+    def mover_ficha_seguro(self, jugador_id: int, desde: int, hasta: int):
+        """Mueve una ficha, aplicando reglas de hit/bloqueo, sin reingreso de barra."""
+        self.validar_indice_punto(desde)
+        self.validar_indice_punto(hasta)
+
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return False
+        signo = 1 if lado == 0 else -1
+        if self.__celdas__[desde] * signo <= 0:
+            return False
+        if not self._ocupar_destino(lado, hasta):
+            return False
+        self._sumar_en_punto(lado, desde, -1)
+        return True
+
+    def reingresar_desde_barra(self, jugador_id: int, hasta: int) -> bool:
+        """Intenta reingresar una ficha de la barra al punto 'hasta'."""
+        self.validar_indice_punto(hasta)
+        lado = self._lado(jugador_id)
+        if lado is None or self.__celdas__[BARRA + lado] <= 0:
+            return False
+
+        if not self._ocupar_destino(lado, hasta):
+            return False
+        self._sumar_contador(BARRA + lado, -1)
+        return True
+
+    def puede_sacar_fichas(self, jugador_id: int) -> bool:
+        """Verifica si el jugador tiene todas sus fichas restantes en su home board."""
+        # J1 (impar): home en 0-5; J2 (par): home en 18-23.
+        if self._lado(jugador_id) is None:
+            return False
+        return self.fichas_fuera_de_casa(jugador_id) == 0
+
+    def sacar_ficha(self, jugador_id: int, desde: int) -> bool:
+        """Intenta sacar una ficha (bearing off) desde 'desde'."""
+        if not self.puede_sacar_fichas(jugador_id):
+            return False
+
+        if self.quitar_ficha(jugador_id, desde):
+            self.registrar_salida(jugador_id)
+            return True
+
+        return False
+
+    def hacer_movimiento(self, jugador_id: int, desde: int | None, hasta: int):
+        """Aplica un movimiento y devuelve el registro para deshacerlo.
+
+        Misma semántica que `Tablero.hacer_movimiento`: 'desde' None reingresa
+        desde la barra y 'hasta' == PUNTOS saca la ficha. Devuelve None (sin
+        modificar el tablero) si el movimiento no se puede aplicar.
+        """
+        if hasta == PUNTOS:
+            if desde is None or not self.sacar_ficha(jugador_id, desde):
+                return None
+            return RegistroMovimiento(jugador_id, desde, hasta, None)
+
+        self.validar_indice_punto(hasta)
+        lado = self._lado(jugador_id)
+        if lado is None:
+            return None
+        valor = self.__celdas__[hasta]
+        hit = valor == (-1 if lado == 0 else 1)
+        if desde is None:
+            ok = self.reingresar_desde_barra(jugador_id, hasta)
+        else:
+            ok = self.mover_ficha_seguro(jugador_id, desde, hasta)
+        if not ok:
+            return None
+        golpeado = self.__ids__[1 - lado] if hit else None
+        return RegistroMovimiento(jugador_id, desde, hasta, golpeado)
+
+    def deshacer_movimiento(self, registro: RegistroMovimiento):
+        """Revierte el movimiento descrito por 'registro' (el último aplicado)."""
+        jugador_id, desde, hasta, golpeado = registro
+        lado = self._lado(jugador_id)
+        if hasta == PUNTOS:
+            self._sumar_contador(SALIDA + lado, -1)
+            self._sumar_en_punto(lado, desde, 1)
+            return
+
+        self._sumar_en_punto(lado, hasta, -1)
+        if golpeado is not None:
+            rival = 1 - lado
+            self._sumar_contador(BARRA + rival, -1)
+            self._sumar_en_punto(rival, hasta, 1)
+        if desde is None:
+            self._sumar_contador(BARRA + lado, 1)
+        else:
+            self._sumar_en_punto(lado, desde, 1)
@@ -0,0 +1,93 @@
+"""Claves Zobrist de 64 bits para identificar posiciones de forma incremental.
+
+Cada combinación (lado, punto, cantidad de fichas) tiene una clave aleatoria fija;
+el hash de una posición es el XOR de las claves de su contenido. Al mover una
+ficha sólo hay que "sacar" la clave vieja y "poner" la nueva de cada celda tocada.
+
+El lado es 0 para J1 (id impar) y 1 para J2 (id par), igual que en el resto del core.
+"""
+import random
+from itertools import combinations_with_replacement
+
+# Mismas dimensiones que core.tablero (no se importa para evitar un import circular).
+_PUNTOS = 24
+_FICHAS = 15
+
+# Semilla fija: las claves tienen que ser idénticas en todos los procesos y corridas.
+_rng = random.Random(0x5EED_BAC6)
+
+
+def _claves(cantidad: int) -> list[int]:
+    """Genera una tabla de claves donde la cantidad 0 vale 0 (celda vacía)."""
+    return [0] + [_rng.getrandbits(64) for _ in range(cantidad)]
+
+
+# CLAVES_PUNTO[lado][punto][cantidad]
+CLAVES_PUNTO = [[_claves(_FICHAS) for _ in range(_PUNTOS)] for _ in range(2)]
+# CLAVES_BARRA[lado][cantidad] y CLAVES_SALIDA[lado][cantidad]
+CLAVES_BARRA = [_claves(_FICHAS) for _ in range(2)]
+CLAVES_SALIDA = [_claves(_FICHAS) for _ in range(2)]
+# Lado al que le toca mover.
+CLAVES_TURNO = [_rng.getrandbits(64) for _ in range(2)]
+
+# Los tableros guardan en un solo entero el hash (64 bits bajos) y el hash del
+# tablero espejado (64 bits altos, ver core.perspectiva). Las tablas *_DOBLES
+# juntan la clave de cada celda con la de su espejo: un XOR actualiza los dos.
+MASCARA_64 = (1 << 64) - 1
+CLAVES_PUNTO_DOBLES = [
+    [
+        [clave | (espejo << 64) for clave, espejo in
+         zip(CLAVES_PUNTO[lado][punto], CLAVES_PUNTO[1 - lado][_PUNTOS - 1 - punto])]
+        for punto in range(_PUNTOS)
+    ]
+    for lado in range(2)
+]
+CLAVES_BARRA_DOBLES = [
+    [clave | (espejo << 64) for clave, espejo in zip(CLAVES_BARRA[lado], CLAVES_BARRA[1 - lado])]
+    for lado in range(2)
+]
+CLAVES_SALIDA_DOBLES = [
+    [clave | (espejo << 64) for clave, espejo in zip(CLAVES_SALIDA[lado], CLAVES_SALIDA[1 - lado])]
+    for lado in range(2)
+]
+
+
+def _tabla_dados() -> dict[tuple[int, ...], int]:
+    """Precalcula una clave por cada multiconjunto de dados restantes (0 a 4 dados)."""
+    por_valor = {(v, n): _rng.getrandbits(64) for v in range(1, 7) for n in range(1, 5)}
+    tabla = {}
+    for largo in range(5):
+        for dados in combinations_with_replacement(range(1, 7), largo):
+            clave = 0
+            for valor in set(dados):
+                clave ^= por_valor[(valor, dados.count(valor))]
+            tabla[dados] = clave
+    return tabla
+
+
+CLAVES_DADOS = _tabla_dados()
+
+
+def clave_dados(movimientos) -> int:
+    """Devuelve la clave de los dados restantes (el orden no importa)."""
+    return CLAVES_DADOS[tuple(sorted(movimientos))]
+
+
+def hash_desde_cero(tablero, ids) -> int:
+    """Calcula el hash de un tablero recorriéndolo entero (para verificar el incremental).
+
+    Recibe:
+        tablero: Tablero o TableroCompacto.
+        ids (Iterable[int]): IDs de los dos jugadores.
+    Devuelve:
+        int: hash de 64 bits equivalente a `tablero.hash_posicion`.
+    """
+    valor = 0
+    for pid in ids:
+        lado = 0 if pid % 2 != 0 else 1
+        for punto in range(_PUNTOS):
+            cantidad = sum(1 for f in tablero.punto(punto) if f.owner_id == pid)
+            valor ^= CLAVES_PUNTO[lado][punto][cantidad]
+        valor ^= CLAVES_BARRA[lado][tablero.fichas_en_barra(pid)]
+        valor ^= CLAVES_SALIDA[lado][tablero.fichas_salidas(pid)]
+    return valor
@@ -0,0 +1,181 @@
+"""Libro de aperturas: mejores jugadas precalculadas para el comienzo de la partida.
+
+La primera jugada después de cada tirada de apertura desde la posición inicial
+estándar es siempre la misma, así que se calcula una vez con la búsqueda y se
+guarda. El libro también puede guardar las respuestas del rival a cada
+apertura, para las 21 tiradas distintas.
+
+Cada entrada está indexada por la clave de la posición vista desde el lado que
+mueve (el hash Zobrist canónico de `core.perspectiva`, que no depende de los
+ids de los jugadores) y por la tirada ("6-5", con el dado mayor primero). Las
+jugadas se guardan en esa misma orientación, así que las aperturas y
+respuestas de J1 sirven también para J2. El archivo es un JSON chico
+(`datos/aperturas.json`) que se lee en la primera consulta; se regenera con
+`python -m backgammon.ia.aperturas`.
+"""
+import argparse
+import json
+import os
+import time
+from backgammon.core.dados import TIRADAS, TIRADAS_DISTINTAS
+from backgammon.core.juego import juego_inicial
+from backgammon.core.perspectiva import espejar_jugada
+from backgammon.ia.busqueda import BotExpectiminimax, aplicar_jugada, deshacer_jugada
+
+VERSION = 2
+RUTA_POR_DEFECTO = os.path.join(os.path.dirname(__file__), "datos", "aperturas.json")
+# Las 15 tiradas de apertura: no hay dobles porque cada jugador tira un dado.
+TIRADAS_APERTURA = tuple(movimientos for d1, d2, movimientos in TIRADAS if d1 > d2)
+
+
+def clave_libro(juego) -> str:
+    """Clave de la posición vista desde el lado que mueve, en hexadecimal."""
+    return format(juego.tablero.hash_canonico(juego.lado_actual()), "016x")
+
+
+def _orientar(juego, jugada) -> tuple:
+    """Pasa una jugada entre la orientación del libro y la del juego (son simétricas)."""
+    return espejar_jugada(jugada) if juego.lado_actual() == 1 else tuple(jugada)
+
+
+def nombre_tirada(movimientos) -> str | None:
+    """Nombre de la tirada ("6-5", "3-3") o None si los dados no son una tirada completa."""
+    movimientos = sorted(movimientos, reverse=True)
+    if len(movimientos) == 2 and movimientos[0] != movimientos[1]:
+        return f"{movimientos[0]}-{movimientos[1]}"
+    if len(movimientos) == 4 and len(set(movimientos)) == 1:
+        return f"{movimientos[0]}-{movimientos[0]}"
+    return None
+
+
+class LibroAperturas:
+    """Consultas sobre el archivo del libro, que se lee en el primer uso."""
+
+    def __init__(self, ruta: str = RUTA_POR_DEFECTO):
+        """Recibe la ruta del archivo generado con `generar`."""
+        self.ruta = ruta
+        self.__entradas__ = None
+
+    def _entradas(self) -> dict:
+        """Lee el archivo una sola vez; un libro faltante queda vacío."""
+        if self.__entradas__ is None:
+            if not os.path.exists(self.ruta):
+                self.__entradas__ = {}
+            else:
+                with open(self.ruta, encoding="utf-8") as archivo:
+                    datos = json.load(archivo)
+                if datos.get("version") != VERSION:
+                    raise ValueError(f"{self.ruta} no es un libro de aperturas válido")
+                self.__entradas__ = datos["entradas"]
+        return self.__entradas__
+
+    def __len__(self) -> int:
+        """Cantidad de jugadas guardadas."""
+        return sum(len(tiradas) for tiradas in self._entradas().values())
+
+    def __getstate__(self):
+        """Envía el libro sin las entradas leídas: el JSON se relee en la primera consulta."""
+        return {"ruta": self.ruta, "__entradas__": None}
+
+    def buscar(self, juego, jugadas=None) -> tuple[tuple, float] | None:
+        """Devuelve (jugada, valor) del libro para los dados de 'juego', o None.
+
+        Sólo responde al comienzo del turno (con la tirada completa). Si se pasan
+        las jugadas legales, descarta una jugada del libro que no esté entre
+        ellas (por ejemplo si el archivo quedó de otra versión de las reglas).
+        """
+        tirada = nombre_tirada(juego.movimientos_disponibles())
+        if tirada is None:
+            return None
+        entrada = self._entradas().get(clave_libro(juego), {}).get(tirada)
+        if entrada is None:
+            return None
+        jugada = _orientar(juego, (tuple(movimiento) for movimiento in entrada["jugada"]))
+        if jugadas is not None and jugada not in jugadas:
+            return None
+        return jugada, entrada["valor"]
+
+
+def _agregar(entradas: dict, juego, bot) -> tuple:
+    """Analiza los dados fijados de 'juego', guarda la entrada y devuelve la jugada."""
+    jugada, valor = bot.analizar(juego)
+    tirada = nombre_tirada(juego.movimientos_disponibles())
+    entradas.setdefault(clave_libro(juego), {})[tirada] = {
+        "jugada": [list(movimiento) for movimiento in _orientar(juego, jugada)],
+        "valor": round(valor, 4),
+    }
+    return jugada
+
+
+def calcular(bot=None, respuestas: bool = True, al_avanzar=None) -> dict:
+    """Calcula las entradas del libro.
+
+    Alcanza con las aperturas de J1 y las respuestas de J2: las de la otra
+    orientación son las mismas posiciones espejadas.
+
+    Recibe:
+        bot (BotExpectiminimax | None): búsqueda a usar (por defecto profundidad 2).
+        respuestas (bool): agregar la respuesta a cada apertura con las 21 tiradas.
+        al_avanzar (Callable[[int], None] | None): se llama con cada apertura terminada.
+    Devuelve:
+        dict: entradas {clave: {tirada: {"jugada": ..., "valor": ...}}}.
+    """
+    bot = bot or BotExpectiminimax(profundidad=2)
+    entradas = {}
+    juego = juego_inicial()
+    for hechas, apertura in enumerate(TIRADAS_APERTURA, 1):
+        juego.fijar_movimientos(apertura)
+        jugada = _agregar(entradas, juego, bot)
+        if respuestas:
+            registros = aplicar_jugada(juego, jugada)
+            juego.cambiar_turno()
+            for movimientos, _ in TIRADAS_DISTINTAS:
+                juego.fijar_movimientos(movimientos)
+                if juego.jugadas_legales():
+                    _agregar(entradas, juego, bot)
+            juego.cambiar_turno()
+            deshacer_jugada(juego, registros)
+        juego.fijar_movimientos(())
+        if al_avanzar is not None:
+            al_avanzar(hechas)
+    return entradas
+
+
+def generar(ruta: str = RUTA_POR_DEFECTO, bot=None, respuestas: bool = True,
+            al_avanzar=None) -> str:
+    """Calcula el libro y lo escribe en 'ruta' (crea la carpeta si falta)."""
+    bot = bot or BotExpectiminimax(profundidad=2)
+    datos = {
+        "version": VERSION,
+        "profundidad": bot.profundidad,
+        "entradas": calcular(bot, respuestas, al_avanzar),
+    }
+    carpeta = os.path.dirname(ruta)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    with open(ruta + ".tmp", "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, sort_keys=True, separators=(",", ":"))
+    os.replace(ruta + ".tmp", ruta)
+    return ruta
+
+
+def main(argv=None):
+    """Genera el libro: python -m backgammon.ia.aperturas [--profundidad N]."""
+    parser = argparse.ArgumentParser(description="Genera el libro de aperturas.")
+    parser.add_argument("--salida", default=RUTA_POR_DEFECTO)
+    parser.add_argument("--profundidad", type=int, default=2)
+    parser.add_argument("--sin-respuestas", action="store_true",
+                        help="sólo las 15 jugadas de apertura")
+    args = parser.parse_args(argv)
+    inicio = time.perf_counter()
+    total = len(TIRADAS_APERTURA)
+    ruta = generar(
+        args.salida, BotExpectiminimax(profundidad=args.profundidad),
+        respuestas=not args.sin_respuestas,
+        al_avanzar=lambda hechas: print(f"apertura {hechas}/{total}", flush=True),
+    )
+    print(f"Libro de aperturas guardado en {ruta} ({time.perf_counter() - inicio:.0f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""Base de datos de bearing off de un lado (one-sided) en un archivo mapeado en memoria.
+
+Una posición de bearing off es la cantidad de fichas en cada punto del home
+board contada desde el punto más cercano a la salida: (fichas a 1 pip, ...,
+fichas a 6 pips), con hasta 15 fichas en total. Hay C(21, 6) = 54.264
+posiciones y cada una tiene un índice fijo (`indice_posicion`), así que el
+archivo es un arreglo de registros sin tabla de búsqueda. Las posiciones con
+hasta n fichas ocupan los primeros `cantidad_posiciones(n)` índices, así que una
+base generada con menos fichas es un prefijo de la completa.
+
+Cada registro guarda la cantidad esperada de tiradas para sacar todas las
+fichas jugando para minimizarla y la distribución de esa cantidad de tiradas.
+El archivo se genera una vez (`python -m backgammon.ia.bearing_off`) y se abre
+con `np.memmap`: abrirlo no lee nada del disco, y los procesos que lo usan
+comparten las mismas páginas del sistema operativo.
+"""
+import argparse
+import os
+import struct
+from itertools import product
+from math import comb
+import numpy as np
+from backgammon.core.dados import TIRADAS_DISTINTAS
+from backgammon.core.perspectiva import celdas_canonicas, lado_de
+
+PUNTOS_CASA = 6
+MAX_FICHAS = 15
+POSICIONES = comb(MAX_FICHAS + PUNTOS_CASA, PUNTOS_CASA)
+# Largo de la distribución: P(sacar todo en exactamente n tiradas), n = 0..31.
+MAX_TIRADAS = 32
+# La distribución se guarda en enteros de 16 bits: probabilidad * ESCALA.
+ESCALA = 65535
+
+MAGIA = b"BGBO1LAD"
+VERSION = 1
+_CABECERA = struct.Struct("<8sIIII")
+REGISTRO = np.dtype([("esperadas", "<f4"), ("distribucion", "<u2", (MAX_TIRADAS,))])
+
+RUTA_POR_DEFECTO = os.path.join(os.path.dirname(__file__), "datos", "bearing_off_1.bin")
+
+
+def cantidad_posiciones(max_fichas: int = MAX_FICHAS) -> int:
+    """Cantidad de posiciones con hasta 'max_fichas' fichas en los 6 puntos."""
+    return comb(max_fichas + PUNTOS_CASA, PUNTOS_CASA)
+
+
+def indice_posicion(posicion) -> int:
+    """Índice de la posición en la base (sistema combinatorio).
+
+    Las fichas y los separadores de los 6 puntos forman una cadena de 21
+    símbolos; el índice es el rango del conjunto de posiciones de los separadores.
+
+    Recibe:
+        posicion (Sequence[int]): fichas a 1..6 pips de la salida (total <= 15).
+    Devuelve:
+        int: índice entre 0 y POSICIONES - 1 (0 es la posición sin fichas).
+    """
+    indice = 0
+    acumulado = 0
+    for i, fichas in enumerate(posicion):
+        acumulado += fichas
+        indice += comb(acumulado + i, i + 1)
+    return indice
+
+
+def todas_las_posiciones(max_fichas: int = MAX_FICHAS) -> list[tuple]:
+    """Devuelve las posiciones con hasta 'max_fichas' fichas ordenadas por índice."""
+    posiciones = [None] * cantidad_posiciones(max_fichas)
+    for posicion in product(range(max_fichas + 1), repeat=PUNTOS_CASA):
+        if sum(posicion) <= max_fichas:
+            posiciones[indice_posicion(posicion)] = posicion
+    return posiciones
+
+
+def posicion_en_tablero(tablero, jugador_id: int) -> tuple | None:
+    """Posición de bearing off del jugador, o None si tiene fichas fuera de casa.
+
+    J1 (id impar) tiene su casa en los puntos 0..5 (el punto p está a p+1 pips)
+    y J2 (id par) en 18..23 (el punto p está a 24-p pips).
+    """
+    if tablero.fichas_fuera_de_casa(jugador_id) > 0:
+        return None
+    celdas = celdas_canonicas(tablero.celdas(), lado_de(jugador_id))
+    return tuple(max(c, 0) for c in celdas[:PUNTOS_CASA])
+
+
+def _movimientos_simples(posicion) -> list[list[tuple]]:
+    """Posiciones alcanzables con un solo dado, para cada dado 1..6 (índice 0..5)."""
+    mas_alto = max((i for i, fichas in enumerate(posicion) if fichas), default=-1)
+    por_dado = []
+    for dado in range(1, PUNTOS_CASA + 1):
+        destinos = set()
+        for i in range(mas_alto + 1):
+            if not posicion[i]:
+                continue
+            distancia = i + 1
+            if distancia < dado and i != mas_alto:
+                continue
+            nueva = list(posicion)
+            nueva[i] -= 1
+            if distancia > dado:
+                nueva[i - dado] += 1
+            destinos.add(tuple(nueva))
+        por_dado.append(sorted(destinos))
+    return por_dado
+
+
+def calcular(max_fichas: int = MAX_FICHAS) -> tuple[np.ndarray, np.ndarray]:
+    """Calcula tiradas esperadas y distribución de todas las posiciones.
+
+    Recorre las posiciones de menor a mayor pip count: cualquier movimiento
+    baja el pip count, así que los sucesores ya están resueltos. Para cada dado
+    y cantidad de movimientos pendientes se memoriza la mejor posición final
+    (la de menos tiradas esperadas), y la distribución se arma con la jugada
+    elegida en cada tirada.
+
+    Recibe:
+        max_fichas (int): fichas como máximo (15 para la base completa).
+    Devuelve:
+        tuple[np.ndarray, np.ndarray]: esperadas (N,) y distribucion
+        (N, MAX_TIRADAS) en float64, con N = cantidad_posiciones(max_fichas).
+    """
+    posiciones = todas_las_posiciones(max_fichas)
+    total = len(posiciones)
+    sucesores = [
+        [[indice_posicion(d) for d in destinos] for destinos in _movimientos_simples(p)]
+        for p in posiciones
+    ]
+    esperadas = [0.0] * total
+    # mejor[k][d][i]: índice final tras jugar k veces el dado d+1 desde i (k = 1..4).
+    mejor = [[[None] * total for _ in range(PUNTOS_CASA)] for _ in range(5)]
+
+    def final(indice: int, dado: int, veces: int) -> int:
+        """Mejor índice final de jugar 'veces' el dado desde 'indice' (memorizado)."""
+        if veces == 0 or indice == 0:
+            return indice
+        guardado = mejor[veces][dado][indice]
+        if guardado is None:
+            guardado = min(
+                (final(s, dado, veces - 1) for s in sucesores[indice][dado]),
+                key=esperadas.__getitem__,
+            )
+            mejor[veces][dado][indice] = guardado
+        return guardado
+
+    pips = [sum((i + 1) * n for i, n in enumerate(p)) for p in posiciones]
+    orden = sorted(range(1, total), key=pips.__getitem__)
+    siguientes = np.zeros((total, len(TIRADAS_DISTINTAS)), dtype=np.int32)
+    probabilidades = np.array([p for _, p in TIRADAS_DISTINTAS])
+    for indice in orden:
+        valor = 1.0
+        for r, (movimientos, probabilidad) in enumerate(TIRADAS_DISTINTAS):
+            if len(movimientos) == 4:
+                elegido = final(indice, movimientos[0] - 1, 4)
+            else:
+                d1, d2 = movimientos[0] - 1, movimientos[1] - 1
+                opciones = [final(s, d2, 1) for s in sucesores[indice][d1]]
+                opciones += [final(s, d1, 1) for s in sucesores[indice][d2]]
+                elegido = min(opciones, key=esperadas.__getitem__)
+            siguientes[indice, r] = elegido
+            valor += probabilidad * esperadas[elegido]
+        esperadas[indice] = valor
+
+    # Distribución por niveles de pip count: cada nivel sólo depende de los anteriores.
+    distribucion = np.zeros((total, MAX_TIRADAS))
+    distribucion[0, 0] = 1.0
+    pips = np.array(pips)
+    niveles = np.unique(pips[1:])
+    for nivel in niveles:
+        indices = np.nonzero(pips == nivel)[0]
+        previa = distribucion[siguientes[indices]]  # (n, 21, MAX_TIRADAS)
+        distribucion[indices, 1:] = np.einsum("r,nrt->nt", probabilidades, previa[:, :, :-1])
+    return np.array(esperadas), distribucion
+
+
+def generar(ruta: str = RUTA_POR_DEFECTO, max_fichas: int = MAX_FICHAS) -> str:
+    """Calcula la base y la escribe en 'ruta' (crea la carpeta si falta)."""
+    esperadas, distribucion = calcular(max_fichas)
+    registros = np.zeros(len(esperadas), dtype=REGISTRO)
+    registros["esperadas"] = esperadas
+    registros["distribucion"] = np.rint(distribucion * ESCALA)
+    carpeta = os.path.dirname(ruta)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(
+            _CABECERA.pack(MAGIA, VERSION, max_fichas, len(registros), MAX_TIRADAS)
+        )
+        archivo.write(registros.tobytes())
+    os.replace(temporal, ruta)
+    return ruta
+
+
+class BaseBearingOff:
+    """Consultas sobre el archivo de la base, abierto con mmap en el primer uso."""
+
+    def __init__(self, ruta: str = RUTA_POR_DEFECTO):
+        """Recibe la ruta del archivo generado con `generar`."""
+        self.ruta = ruta
+        self.max_fichas = None
+        self.__registros__ = None
+
+    def _registros(self) -> np.ndarray:
+        """Mapea el archivo en memoria (sólo lectura) y valida la cabecera."""
+        if self.__registros__ is None:
+            if not os.path.exists(self.ruta):
+                raise FileNotFoundError(
+                    f"no existe la base de bearing off {self.ruta}; "
+                    "generala con: python -m backgammon.ia.bearing_off"
+                )
+            with open(self.ruta, "rb") as archivo:
+                magia, version, max_fichas, posiciones, largo = _CABECERA.unpack(
+                    archivo.read(_CABECERA.size)
+                )
+            if (
+                (magia, version, largo) != (MAGIA, VERSION, MAX_TIRADAS)
+                or not 0 <= max_fichas <= MAX_FICHAS
+                or posiciones != cantidad_posiciones(max_fichas)
+            ):
+                raise ValueError(f"{self.ruta} no es una base de bearing off válida")
+            self.max_fichas = max_fichas
+            self.__registros__ = np.memmap(
+                self.ruta, dtype=REGISTRO, mode="r", offset=_CABECERA.size, shape=(posiciones,)
+            )
+        return self.__registros__
+
+    def __getstate__(self):
+        """Deja afuera el memmap de registros (no se puede enviar a otro proceso).
+
+        La copia vuelve a validar la cabecera y mapear el archivo en `_registros`.
+        """
+        return {"ruta": self.ruta, "max_fichas": None, "__registros__": None}
+
+    def cerrar(self):
+        """Libera el mapeo del archivo."""
+        self.__registros__ = None
+
+    def _registro(self, posicion):
+        """Registro de la posición; ValueError si tiene más fichas que la base."""
+        registros = self._registros()
+        if sum(posicion) > self.max_fichas:
+            raise ValueError(f"la base sólo cubre hasta {self.max_fichas} fichas")
+        return registros[indice_posicion(posicion)]
+
+    def tiradas_esperadas(self, posicion) -> float:
+        """Cantidad esperada de tiradas para sacar todas las fichas de la posición."""
+        return float(self._registro(posicion)["esperadas"])
+
+    def distribucion(self, posicion) -> np.ndarray:
+        """P(sacar todas las fichas en exactamente n tiradas), n = 0..MAX_TIRADAS-1."""
+        return self._registro(posicion)["distribucion"] / ESCALA
+
+    def probabilidad_ganar(self, al_turno, rival) -> float:
+        """Probabilidad aproximada de ganar la carrera para el lado que tira.
+
+        Supone distribuciones independientes: gana quien tira si saca todo en n
+        tiradas y el rival necesita n o más.
+        """
+        propia = self.distribucion(al_turno)
+        rival_restante = np.cumsum(self.distribucion(rival)[::-1])[::-1]
+        return float(np.clip(propia @ rival_restante, 0.0, 1.0))
+
+
+def main(argv=None):
+    """Genera el archivo de la base: python -m backgammon.ia.bearing_off [--salida RUTA]."""
+    parser = argparse.ArgumentParser(description="Genera la base de bearing off de un lado.")
+    parser.add_argument("--salida", default=RUTA_POR_DEFECTO)
+    parser.add_argument("--max-fichas", type=int, default=MAX_FICHAS)
+    args = parser.parse_args(argv)
+    ruta = generar(args.salida, args.max_fichas)
+    print(
+        f"Base de bearing off ({cantidad_posiciones(args.max_fichas)} posiciones) "
+        f"guardada en {ruta}"
+    )
+
+
+if __name__ == "__main__":
+    main()
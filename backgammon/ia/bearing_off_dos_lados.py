@@ -0,0 +1,287 @@
+"""Tabla exacta de bearing off de dos lados en un archivo mapeado en memoria.
+
+Para cada par de posiciones de bearing off (ver `backgammon.ia.bearing_off`)
+con hasta 'max_fichas' fichas por lado, la tabla guarda la probabilidad de
+ganar del lado que va a tirar cuando los dos juegan para maximizarla. A
+diferencia de `BaseBearingOff.probabilidad_ganar`, no supone que las carreras
+son independientes: en cada tirada se elige la jugada que deja al rival con la
+menor probabilidad de ganar.
+
+El valor de (i, j) depende de los de (j, m) con m alcanzable desde i, que
+tienen menos pips en total; por eso la tabla se calcula por niveles de pips
+totales. Los bloques de un nivel son independientes y se reparten en un pool
+de procesos que escriben sobre el mismo archivo de trabajo mapeado en memoria.
+
+Con N = cantidad_posiciones(max_fichas) el archivo es una cabecera y una
+matriz N x N de enteros de 16 bits (fila: lado que tira; columna: rival), o
+sea 1,7 MB para 6 fichas y 128 MB para 10. Con menos de 15 fichas por lado no
+puede haber gammons, así que la probabilidad da el valor exacto de la posición;
+`TablaBearingOff.valor` no responde si algún lado tiene las 15 en el tablero.
+"""
+import argparse
+import os
+import struct
+import tempfile
+from multiprocessing import Pool
+import numpy as np
+from backgammon.core.dados import TIRADAS_DISTINTAS
+from backgammon.core.tablero import FICHAS_POR_JUGADOR
+from backgammon.ia.bearing_off import (
+    ESCALA, MAX_FICHAS as MAX_FICHAS_POR_LADO, _movimientos_simples,
+    cantidad_posiciones, indice_posicion, posicion_en_tablero, todas_las_posiciones,
+)
+
+MAX_FICHAS = 6
+MAGIA = b"BGBO2LAD"
+VERSION = 1
+_CABECERA = struct.Struct("<8sIII")
+# Elementos de la matriz intermedia de cada bloque (acota la memoria por proceso).
+_ELEMENTOS_POR_BLOQUE = 1 << 22
+
+RUTA_POR_DEFECTO = os.path.join(os.path.dirname(__file__), "datos", "bearing_off_2.bin")
+
+
+def _finales(posicion, movimientos) -> set:
+    """Posiciones finales distintas de jugar todos los dados de 'movimientos'.
+
+    Sin contacto cualquier dado se puede jugar mientras quede alguna ficha, así
+    que toda jugada usa todos los dados o termina de sacar las fichas.
+    """
+    resultado = set()
+    for orden in {tuple(movimientos), tuple(reversed(movimientos))}:
+        actuales = {tuple(posicion)}
+        for dado in orden:
+            siguientes = set()
+            for actual in actuales:
+                if any(actual):
+                    siguientes.update(_movimientos_simples(actual)[dado - 1])
+                else:
+                    siguientes.add(actual)
+            actuales = siguientes
+        resultado |= actuales
+    return resultado
+
+
+def _tabla_de_finales(posiciones) -> np.ndarray:
+    """Índices finales de cada posición y tirada, (N, 21, K) rellenado con repeticiones."""
+    finales = [
+        [sorted(indice_posicion(f) for f in _finales(p, movimientos))
+         for movimientos, _ in TIRADAS_DISTINTAS]
+        for p in posiciones
+    ]
+    ancho = max(len(f) for por_tirada in finales for f in por_tirada)
+    tabla = np.zeros((len(posiciones), len(TIRADAS_DISTINTAS), ancho), dtype=np.int32)
+    for i, por_tirada in enumerate(finales):
+        for r, indices in enumerate(por_tirada):
+            tabla[i, r, :len(indices)] = indices
+            tabla[i, r, len(indices):] = indices[0]
+    return tabla
+
+
+# Matriz de trabajo, finales y grupos de pips: `calcular` los carga en cada
+# proceso (también en el actual con procesos=1) antes de repartir los bloques.
+_ESTADO = {}
+
+
+def _inicializar_proceso(ruta_trabajo, total, finales, grupos):
+    """Mapea la matriz de trabajo y guarda los datos del cálculo en el proceso."""
+    _ESTADO["matriz"] = np.memmap(ruta_trabajo, dtype=np.float32, mode="r+",
+                                  shape=(total, total))
+    _ESTADO["finales"] = finales
+    _ESTADO["grupos"] = grupos
+    _ESTADO["probabilidades"] = np.array([p for _, p in TIRADAS_DISTINTAS],
+                                         dtype=np.float32)
+
+
+def _calcular_bloque(bloque):
+    """Calcula P[i, j] para las filas i del bloque y las columnas de pips 'b'.
+
+    P[i, j] = 1 - sum_r p_r * min_m P[j, m], con m entre los finales de i con r.
+    """
+    pips_a, desde, hasta, pips_b = bloque
+    matriz = _ESTADO["matriz"]
+    filas = _ESTADO["grupos"][pips_a][desde:hasta]
+    columnas = _ESTADO["grupos"][pips_b]
+    finales = _ESTADO["finales"][filas]  # (nf, 21, K)
+    rival = matriz[np.ix_(columnas, finales.ravel())].reshape(len(columnas), *finales.shape)
+    perdida = rival.min(axis=3) @ _ESTADO["probabilidades"]  # (nc, nf)
+    matriz[np.ix_(filas, columnas)] = 1.0 - perdida.T
+
+
+def _bloques_del_nivel(nivel: int, grupos, ancho: int) -> list[tuple]:
+    """Bloques (pips_a, desde, hasta, pips_b) con pips_a + pips_b == nivel."""
+    bloques = []
+    for pips_a in range(max(1, nivel - len(grupos) + 1), min(nivel, len(grupos))):
+        pips_b = nivel - pips_a
+        filas = len(grupos[pips_a])
+        paso = max(1, _ELEMENTOS_POR_BLOQUE // (len(grupos[pips_b]) * ancho))
+        bloques.extend(
+            (pips_a, desde, min(desde + paso, filas), pips_b) for desde in range(0, filas, paso)
+        )
+    return bloques
+
+
+def calcular(ruta_trabajo: str, max_fichas: int = MAX_FICHAS,
+             procesos: int | None = None) -> np.memmap:
+    """Calcula la tabla en un archivo de trabajo float32 y la devuelve mapeada.
+
+    La fila 0 (el lado que tira ya sacó todo) vale 1 y la columna 0 (el rival
+    ya sacó todo) vale 0. El resto se calcula por niveles de pips totales; los
+    bloques de cada nivel se reparten entre los procesos.
+
+    Recibe:
+        ruta_trabajo (str): archivo temporal para la matriz float32 (N x N).
+        max_fichas (int): fichas como máximo por lado.
+        procesos (int | None): procesos del pool; 1 calcula en el proceso actual
+            y None usa todos los núcleos.
+    Devuelve:
+        np.memmap: la matriz (N, N) de probabilidades de ganar del lado que tira.
+    """
+    if not 0 <= max_fichas <= MAX_FICHAS_POR_LADO:
+        raise ValueError(f"max_fichas debe estar entre 0 y {MAX_FICHAS_POR_LADO}")
+    posiciones = todas_las_posiciones(max_fichas)
+    total = len(posiciones)
+    pips = np.array([sum((i + 1) * n for i, n in enumerate(p)) for p in posiciones])
+    grupos = [np.nonzero(pips == nivel)[0] for nivel in range(pips.max() + 1)]
+    finales = _tabla_de_finales(posiciones)
+
+    matriz = np.memmap(ruta_trabajo, dtype=np.float32, mode="w+", shape=(total, total))
+    matriz[0, :] = 1.0
+    matriz[1:, 0] = 0.0
+    matriz.flush()
+    ancho = finales.shape[1] * finales.shape[2]
+    niveles = [_bloques_del_nivel(n, grupos, ancho) for n in range(2, 2 * len(grupos) - 1)]
+    args = (ruta_trabajo, total, finales, grupos)
+    if procesos == 1:
+        _inicializar_proceso(*args)
+        for bloques in niveles:
+            for bloque in bloques:
+                _calcular_bloque(bloque)
+        _ESTADO.clear()
+    else:
+        with Pool(procesos or os.cpu_count() or 1, _inicializar_proceso, args) as pool:
+            for bloques in niveles:
+                # Cada nivel necesita los anteriores completos: map espera a todos.
+                pool.map(_calcular_bloque, bloques)
+    return matriz
+
+
+def generar(ruta: str = RUTA_POR_DEFECTO, max_fichas: int = MAX_FICHAS,
+            procesos: int | None = None) -> str:
+    """Calcula la tabla y la escribe en 'ruta' (crea la carpeta si falta)."""
+    carpeta = os.path.dirname(ruta)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    descriptor, trabajo = tempfile.mkstemp(suffix=".f32", dir=carpeta or None)
+    os.close(descriptor)
+    try:
+        matriz = calcular(trabajo, max_fichas, procesos)
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(_CABECERA.pack(MAGIA, VERSION, max_fichas, len(matriz)))
+            for fila in matriz:
+                archivo.write(np.rint(fila * ESCALA).astype("<u2").tobytes())
+        del matriz
+        os.replace(temporal, ruta)
+    finally:
+        os.remove(trabajo)
+    return ruta
+
+
+class TablaBearingOff:
+    """Consultas sobre el archivo de la tabla, abierto con mmap en el primer uso."""
+
+    def __init__(self, ruta: str = RUTA_POR_DEFECTO):
+        """Recibe la ruta del archivo generado con `generar`."""
+        self.ruta = ruta
+        self.max_fichas = None
+        self.__matriz__ = None
+
+    def _matriz(self) -> np.ndarray:
+        """Mapea el archivo en memoria (sólo lectura) y valida la cabecera."""
+        if self.__matriz__ is None:
+            if not os.path.exists(self.ruta):
+                raise FileNotFoundError(
+                    f"no existe la tabla de bearing off {self.ruta}; "
+                    "generala con: python -m backgammon.ia.bearing_off_dos_lados"
+                )
+            with open(self.ruta, "rb") as archivo:
+                magia, version, max_fichas, posiciones = _CABECERA.unpack(
+                    archivo.read(_CABECERA.size)
+                )
+            if (
+                (magia, version) != (MAGIA, VERSION)
+                or not 0 <= max_fichas <= MAX_FICHAS_POR_LADO
+                or posiciones != cantidad_posiciones(max_fichas)
+            ):
+                raise ValueError(f"{self.ruta} no es una tabla de bearing off válida")
+            self.max_fichas = max_fichas
+            self.__matriz__ = np.memmap(
+                self.ruta, dtype="<u2", mode="r", offset=_CABECERA.size,
+                shape=(posiciones, posiciones),
+            )
+        return self.__matriz__
+
+    def __getstate__(self):
+        """Quita la matriz mapeada y el 'max_fichas' de la cabecera; `_matriz` los recupera."""
+        return {"ruta": self.ruta, "max_fichas": None, "__matriz__": None}
+
+    def cerrar(self):
+        """Libera el mapeo del archivo."""
+        self.__matriz__ = None
+
+    def cubre(self, al_turno, rival) -> bool:
+        """Indica si la tabla tiene el par de posiciones (ninguna con más fichas)."""
+        self._matriz()
+        return sum(al_turno) <= self.max_fichas and sum(rival) <= self.max_fichas
+
+    def probabilidad_ganar(self, al_turno, rival) -> float:
+        """Probabilidad exacta de ganar del lado que va a tirar.
+
+        Recibe:
+            al_turno (Sequence[int]): posición de bearing off del lado que tira.
+            rival (Sequence[int]): posición de bearing off del rival.
+        Devuelve:
+            float: entre 0 y 1; ValueError si alguna posición excede la tabla.
+        """
+        matriz = self._matriz()
+        if not self.cubre(al_turno, rival):
+            raise ValueError(f"la tabla sólo cubre hasta {self.max_fichas} fichas por lado")
+        return float(matriz[indice_posicion(al_turno), indice_posicion(rival)]) / ESCALA
+
+    def valor(self, juego) -> float | None:
+        """Valor exacto de la partida para el jugador que va a tirar, o None.
+
+        Devuelve 2p - 1 (p la probabilidad de ganar) si los dos jugadores están
+        en bearing off dentro de la tabla, y None si todavía hay contacto,
+        alguno tiene más fichas de las que cubre o no sacó ninguna (ahí el
+        valor depende también de los gammons, que la tabla no distingue).
+        """
+        j1, j2 = juego.jugadores
+        actual = juego.jugador_actual
+        rival = j2 if actual is j1 else j1
+        propia = posicion_en_tablero(juego.tablero, actual.id)
+        if propia is None:
+            return None
+        ajena = posicion_en_tablero(juego.tablero, rival.id)
+        if ajena is None or FICHAS_POR_JUGADOR in (sum(propia), sum(ajena)):
+            return None
+        if not self.cubre(propia, ajena):
+            return None
+        return 2.0 * self.probabilidad_ganar(propia, ajena) - 1.0
+
+
+def main(argv=None):
+    """Genera el archivo de la tabla: python -m backgammon.ia.bearing_off_dos_lados."""
+    parser = argparse.ArgumentParser(description="Genera la tabla de bearing off de dos lados.")
+    parser.add_argument("--salida", default=RUTA_POR_DEFECTO)
+    parser.add_argument("--max-fichas", type=int, default=MAX_FICHAS)
+    parser.add_argument("--procesos", type=int, default=None)
+    args = parser.parse_args(argv)
+    ruta = generar(args.salida, args.max_fichas, args.procesos)
+    posiciones = cantidad_posiciones(args.max_fichas)
+    print(f"Tabla de bearing off ({posiciones} x {posiciones}) guardada en {ruta}")
+
+
+if __name__ == "__main__":
+    main()
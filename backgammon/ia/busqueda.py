@@ -0,0 +1,486 @@
+"""Búsqueda expectiminimax sobre `Juego` con nodos de azar y tabla de transposición.
+
+Los nodos de decisión recorren `Juego.jugadas_legales()` aplicando cada jugada
+con `hacer_movimiento` y revirtiéndola con `deshacer_movimiento`, así que la
+búsqueda trabaja sobre el mismo `Juego` sin copiarlo. Los nodos de azar
+promedian las 21 tiradas distintas (`TIRADAS_DISTINTAS`) con su probabilidad.
+
+Los valores siempre están del lado del jugador que mueve en el nodo, en puntos
+de partida: entre -3 y 3 para posiciones terminadas y entre -1 y 1 para las
+hojas del evaluador. Como el rango está acotado, los nodos de azar pueden
+cortar con ventanas alfa-beta (Star1) y sondear una jugada por tirada antes de
+la búsqueda completa (Star2).
+"""
+import time
+from typing import NamedTuple
+import numpy as np
+from backgammon.core.dados import TIRADAS_DISTINTAS
+from backgammon.core.juego import Juego
+from backgammon.core.tablero_compacto import TableroCompacto
+from backgammon.ia.evaluacion import evaluar_heuristica, puntuar_jugadas
+
+# Cotas de cualquier valor de la búsqueda: un backgammon perdido o ganado.
+VALOR_MINIMO = -3.0
+VALOR_MAXIMO = 3.0
+
+# Tipo de valor guardado en la tabla de transposición.
+EXACTO = 0
+COTA_INFERIOR = 1  # el valor real es >= al guardado (corte por beta)
+COTA_SUPERIOR = 2  # el valor real es <= al guardado (corte por alfa)
+
+
+class ResultadoBusqueda(NamedTuple):
+    """Resultado de `BotExpectiminimax.buscar`.
+
+    'profundidad' es la de la búsqueda que dio la jugada (0 si el plazo venció
+    antes de evaluar ninguna, y entonces la jugada es la primera del orden
+    estático y 'valor' es None; también 0, con el valor guardado y sin nodos,
+    si la jugada salió del libro de aperturas). 'completa' es False si venció el plazo; si
+    además la última profundidad quedó a medias, la jugada es la mejor entre las
+    ya buscadas, que siempre incluyen la mejor de la profundidad anterior.
+    """
+    jugada: tuple
+    valor: float | None
+    profundidad: int
+    completa: bool
+    nodos: int
+    segundos: float
+
+
+class _TiempoAgotado(Exception):
+    """Corta la búsqueda cuando vence el plazo; los finally deshacen las jugadas."""
+
+
+class TablaTransposicion:
+    """Tabla de transposición de tamaño fijo indexada por el hash de la posición.
+
+    Cada clave cae en una sola ranura (los bits bajos del hash). Al guardar, la
+    entrada nueva reemplaza a la de la ranura si es la misma posición, si la
+    anterior quedó de una búsqueda previa o si la nueva se calculó con igual o
+    mayor profundidad; así las hojas no desplazan a los resultados más caros.
+    """
+
+    def __init__(self, ranuras_log2: int = 16):
+        """Crea una tabla con 2**ranuras_log2 ranuras vacías."""
+        ranuras = 1 << ranuras_log2
+        self.__mascara__ = ranuras - 1
+        self.__claves__ = [None] * ranuras
+        self.__valores__ = [0.0] * ranuras
+        self.__tipos__ = [EXACTO] * ranuras
+        self.__profundidades__ = [0] * ranuras
+        self.__generaciones__ = [0] * ranuras
+        self.__generacion__ = 0
+        self.consultas = 0
+        self.aciertos = 0
+
+    def __len__(self) -> int:
+        """Cantidad de ranuras ocupadas."""
+        return sum(1 for clave in self.__claves__ if clave is not None)
+
+    @property
+    def ranuras(self) -> int:
+        """Cantidad total de ranuras (el tope de entradas)."""
+        return len(self.__claves__)
+
+    def nueva_busqueda(self):
+        """Marca el comienzo de una búsqueda: las entradas anteriores pasan a ser reemplazables."""
+        self.__generacion__ += 1
+
+    def limpiar(self):
+        """Vacía la tabla y reinicia los contadores."""
+        self.__claves__ = [None] * len(self.__claves__)
+        self.consultas = 0
+        self.aciertos = 0
+
+    def buscar(self, clave: int, profundidad: int,
+               alfa: float = VALOR_MINIMO, beta: float = VALOR_MAXIMO) -> float | None:
+        """Devuelve el valor guardado si sirve para esa profundidad y ventana.
+
+        Un valor exacto siempre sirve; una cota inferior sólo si ya es >= beta y
+        una cota superior sólo si ya es <= alfa. Devuelve None en otro caso.
+        """
+        self.consultas += 1
+        ranura = clave & self.__mascara__
+        if self.__claves__[ranura] != clave or self.__profundidades__[ranura] < profundidad:
+            return None
+        valor = self.__valores__[ranura]
+        tipo = self.__tipos__[ranura]
+        if (
+            tipo == EXACTO
+            or (tipo == COTA_INFERIOR and valor >= beta)
+            or (tipo == COTA_SUPERIOR and valor <= alfa)
+        ):
+            self.aciertos += 1
+            return valor
+        return None
+
+    def guardar(self, clave: int, profundidad: int, valor: float, tipo: int = EXACTO):
+        """Guarda el valor de la clave según la política de reemplazo de la tabla."""
+        ranura = clave & self.__mascara__
+        anterior = self.__claves__[ranura]
+        if (
+            anterior is not None
+            and anterior != clave
+            and self.__generaciones__[ranura] == self.__generacion__
+            and self.__profundidades__[ranura] > profundidad
+        ):
+            return
+        self.__claves__[ranura] = clave
+        self.__valores__[ranura] = valor
+        self.__tipos__[ranura] = tipo
+        self.__profundidades__[ranura] = profundidad
+        self.__generaciones__[ranura] = self.__generacion__
+
+
+def juego_de_busqueda(juego) -> Juego:
+    """Devuelve un Juego equivalente sobre TableroCompacto para buscar más rápido.
+
+    Copia posición, turno y dados restantes. Si el juego ya usa TableroCompacto,
+    o sus jugadores no tienen ids de paridad distinta (J1 impar, J2 par), se
+    busca directamente sobre el mismo juego.
+    """
+    j1, j2 = juego.jugadores
+    if isinstance(juego.tablero, TableroCompacto) or j1.id % 2 == j2.id % 2:
+        return juego
+    if j1.id % 2 == 0:
+        j1, j2 = j2, j1
+    copia = Juego(
+        *juego.jugadores,
+        indice_inicial=juego.jugadores.index(juego.jugador_actual),
+        tablero=TableroCompacto.desde_celdas(juego.tablero.celdas(), j1.id, j2.id),
+    )
+    copia.fijar_movimientos(juego.movimientos_disponibles())
+    return copia
+
+
+def aplicar_jugada(juego, jugada) -> list:
+    """Aplica una jugada completa con hacer_movimiento y devuelve sus registros."""
+    registros = []
+    for desde, hasta in jugada:
+        registro = juego.hacer_movimiento(desde, hasta)
+        if registro is None:
+            deshacer_jugada(juego, registros)
+            raise ValueError(f"jugada ilegal {jugada}: {juego.ultimo_error()}")
+        registros.append(registro)
+    return registros
+
+
+def deshacer_jugada(juego, registros):
+    """Revierte los registros de aplicar_jugada en orden inverso."""
+    for registro in reversed(registros):
+        juego.deshacer_movimiento(registro)
+
+
+class BotExpectiminimax:
+    """Jugador automático que elige la jugada con mejor valor esperado.
+
+    Con profundidad 1 puntúa cada jugada con el evaluador; cada nivel extra
+    agrega un nodo de azar sobre las 21 tiradas del rival y su mejor respuesta.
+    Cumple el protocolo de `backgammon.ia.estrategias`, así que se puede usar
+    en el simulador.
+
+    Las podas Star1/Star2 no cambian el valor de la mejor jugada. La poda hacia
+    adelante ('poda_k') sí es aproximada: en cada nodo de decisión con nodos de
+    azar debajo sólo busca las k jugadas con mejor `puntuar_jugadas`.
+
+    Con 'tiempo' la búsqueda es "anytime": profundiza de a un ply hasta
+    'profundidad' y, al vencer el plazo, devuelve la mejor jugada encontrada.
+
+    Con una `TablaBearingOff` ('bearing_off') los nodos de azar donde los dos
+    jugadores están en bearing off dentro de la tabla toman su valor exacto en
+    lugar de seguir buscando. Con un `LibroAperturas` ('libro') las posiciones
+    que están en el libro se responden sin buscar.
+    """
+
+    nombre = "expectiminimax"
+
+    def __init__(self, profundidad: int = 2, evaluador=evaluar_heuristica,
+                 ranuras_log2: int = 16, star2: bool = True, ordenar: bool = True,
+                 poda_k: int | None = None, tiempo: float | None = None,
+                 bearing_off=None, libro=None):
+        """Configura la búsqueda.
+
+        Recibe:
+            profundidad (int): plies de decisión a buscar (1 = sólo evaluar cada jugada).
+            evaluador (Callable[[Juego], float]): evaluación estática de las hojas.
+            ranuras_log2 (int): log2 del tamaño de la tabla de transposición.
+            star2 (bool): sondear una jugada por tirada antes de la búsqueda completa.
+            ordenar (bool): buscar primero las jugadas con mejor `puntuar_jugadas`.
+            poda_k (int | None): jugadas que se buscan por tirada; None las busca todas.
+            tiempo (float | None): segundos por jugada; con plazo 'profundidad' es
+                la profundidad máxima de la profundización iterativa.
+            bearing_off (TablaBearingOff | None): tabla exacta para los finales sin contacto.
+            libro (LibroAperturas | None): jugadas precalculadas de la apertura.
+        """
+        if profundidad < 1:
+            raise ValueError("la profundidad debe ser al menos 1")
+        if poda_k is not None and poda_k < 1:
+            raise ValueError("poda_k debe ser al menos 1")
+        self.profundidad = profundidad
+        self.evaluador = evaluador
+        self.star2 = star2
+        self.ordenar = ordenar
+        self.poda_k = poda_k
+        self.tiempo = tiempo
+        self.bearing_off = bearing_off
+        self.libro = libro
+        self.__ranuras_log2__ = ranuras_log2
+        self.__tabla__ = None
+        self.__limite__ = None
+        self.nodos = 0
+        self.ultimo_resultado = None
+
+    def __getstate__(self):
+        """Serializa el bot sin su tabla de transposición (se recrea en cada proceso)."""
+        estado = self.__dict__.copy()
+        estado["__tabla__"] = None
+        return estado
+
+    @property
+    def tabla(self) -> TablaTransposicion:
+        """Tabla de transposición del bot (se crea en el primer uso)."""
+        if self.__tabla__ is None:
+            self.__tabla__ = TablaTransposicion(self.__ranuras_log2__)
+        return self.__tabla__
+
+    def elegir_jugada(self, juego, jugadas, rng):
+        """Devuelve la mejor jugada según la búsqueda (rng no se usa)."""
+        return self.buscar(juego, jugadas).jugada
+
+    def analizar(self, juego, jugadas=None) -> tuple[tuple, float | None]:
+        """Busca la mejor jugada y devuelve (jugada, valor); ver `buscar`."""
+        resultado = self.buscar(juego, jugadas)
+        return resultado.jugada, resultado.valor
+
+    def buscar(self, juego, jugadas=None, tiempo: float | None = None) -> ResultadoBusqueda:
+        """Busca la mejor jugada para los dados ya tirados de 'juego'.
+
+        Sin plazo busca directamente a 'profundidad'. Con plazo empieza en 1 ply
+        y profundiza mientras quede tiempo, buscando primero en la raíz las
+        jugadas que mejor salieron en la iteración anterior. La búsqueda corre
+        sobre `juego_de_busqueda(juego)`, así que un Juego con Tablero de
+        objetos se copia una vez a TableroCompacto.
+
+        Recibe:
+            juego (Juego): partida con los dados tirados; se deja como estaba.
+            jugadas (list | None): jugadas candidatas (por defecto jugadas_legales()).
+            tiempo (float | None): segundos disponibles; por defecto self.tiempo.
+        Devuelve:
+            ResultadoBusqueda: jugada, valor, profundidad alcanzada, nodos y segundos.
+        """
+        if jugadas is None:
+            jugadas = juego.jugadas_legales()
+        if not jugadas:
+            raise ValueError("no hay jugadas legales para analizar")
+        inicio = time.perf_counter()
+        if self.libro is not None:
+            del_libro = self.libro.buscar(juego, jugadas)
+            if del_libro is not None:
+                self.nodos = 0
+                self.ultimo_resultado = ResultadoBusqueda(
+                    *del_libro, 0, True, 0, time.perf_counter() - inicio
+                )
+                return self.ultimo_resultado
+        tiempo = self.tiempo if tiempo is None else tiempo
+        juego = juego_de_busqueda(juego)
+        self.nodos = 0
+        self.tabla.nueva_busqueda()
+
+        candidatas = self._candidatas(juego, jugadas, self.profundidad)
+        mejor, valor, alcanzada, completa = candidatas[0], None, 0, True
+        # Con plazo y una sola jugada posible no hace falta buscar.
+        if len(candidatas) > 1 or tiempo is None:
+            primera = self.profundidad
+            if tiempo is not None:
+                self.__limite__ = inicio + tiempo
+                primera = 1
+            try:
+                for profundidad in range(primera, self.profundidad + 1):
+                    mejor, valor, candidatas = self._raiz(juego, candidatas, profundidad)
+                    alcanzada = profundidad
+                    if candidatas is None:
+                        completa = False
+                        break
+            except _TiempoAgotado:
+                completa = False
+            finally:
+                self.__limite__ = None
+
+        self.ultimo_resultado = ResultadoBusqueda(
+            mejor, valor, alcanzada, completa, self.nodos, time.perf_counter() - inicio
+        )
+        return self.ultimo_resultado
+
+    def _raiz(self, juego, candidatas, profundidad: int):
+        """Busca las jugadas de la raíz a una profundidad.
+
+        Devuelve (mejor, valor, candidatas reordenadas por valor). Si el plazo
+        vence después de buscar la primera jugada, devuelve la mejor hasta ahí
+        con candidatas None; si vence antes, deja pasar _TiempoAgotado.
+        """
+        mejor, mejor_valor = None, float("-inf")
+        valores = {}
+        try:
+            for jugada in candidatas:
+                valor = self.valor_jugada(
+                    juego, jugada, profundidad, max(mejor_valor, VALOR_MINIMO), VALOR_MAXIMO
+                )
+                valores[jugada] = valor
+                if valor > mejor_valor:
+                    mejor, mejor_valor = jugada, valor
+        except _TiempoAgotado:
+            if mejor is None:
+                raise
+            return mejor, mejor_valor, None
+        return mejor, mejor_valor, sorted(candidatas, key=valores.__getitem__, reverse=True)
+
+    def _contar_nodo(self):
+        """Cuenta un nodo y corta la búsqueda si venció el plazo."""
+        self.nodos += 1
+        if self.__limite__ is not None and time.perf_counter() > self.__limite__:
+            raise _TiempoAgotado()
+
+    def valor_jugada(self, juego, jugada, profundidad: int,
+                     alfa: float = VALOR_MINIMO, beta: float = VALOR_MAXIMO) -> float:
+        """Valor esperado de aplicar 'jugada' para el jugador que mueve.
+
+        Fuera de la ventana (alfa, beta) el resultado es sólo una cota: <= alfa
+        si la jugada es peor y >= beta si es mejor.
+        """
+        registros = aplicar_jugada(juego, jugada)
+        try:
+            return self._valor_tras_jugar(juego, profundidad, alfa, beta)
+        finally:
+            deshacer_jugada(juego, registros)
+
+    def _candidatas(self, juego, jugadas, profundidad: int) -> list:
+        """Ordena las jugadas por `puntuar_jugadas` y aplica la poda hacia adelante.
+
+        La poda sólo se aplica cuando quedan nodos de azar por debajo: a
+        profundidad 1 las jugadas son hojas y el orden sólo adelanta los cortes.
+        """
+        if profundidad <= 1 or len(jugadas) < 2 or not (self.ordenar or self.poda_k):
+            return jugadas
+        puntajes = puntuar_jugadas(juego.tablero.celdas(), juego.lado_actual(), jugadas)
+        orden = np.argsort(-puntajes, kind="stable")
+        if self.poda_k and profundidad > 1:
+            orden = orden[:self.poda_k]
+        return [jugadas[i] for i in orden]
+
+    def _valor_tras_jugar(self, juego, profundidad: int, alfa: float, beta: float) -> float:
+        """Valor para quien acaba de mover: final de partida o el turno del rival."""
+        if juego.termino():
+            return float(juego.puntos_victoria())
+        restantes = juego.movimientos_disponibles()
+        juego.cambiar_turno()
+        try:
+            return -self._nodo_azar(juego, profundidad - 1, -beta, -alfa)
+        finally:
+            juego.cambiar_turno()
+            juego.fijar_movimientos(restantes)
+
+    def _nodo_azar(self, juego, profundidad: int,
+                   alfa: float = VALOR_MINIMO, beta: float = VALOR_MAXIMO) -> float:
+        """Valor esperado antes de tirar: evaluador en las hojas o promedio de las 21 tiradas.
+
+        Si la tabla de bearing off cubre la posición devuelve su valor exacto.
+        """
+        clave = juego.clave_canonica()
+        valor = self.tabla.buscar(clave, profundidad, alfa, beta)
+        if valor is not None:
+            return valor
+        self._contar_nodo()
+        if self.bearing_off is not None:
+            valor = self.bearing_off.valor(juego)
+            if valor is not None:
+                return valor
+        if profundidad == 0:
+            valor = self.evaluador(juego)
+            self.tabla.guardar(clave, 0, valor)
+            return valor
+        try:
+            valor = self._promedio_tiradas(juego, profundidad, alfa, beta)
+        finally:
+            juego.fijar_movimientos(())
+        if valor <= alfa:
+            tipo = COTA_SUPERIOR
+        elif valor >= beta:
+            tipo = COTA_INFERIOR
+        else:
+            tipo = EXACTO
+        self.tabla.guardar(clave, profundidad, valor, tipo)
+        return valor
+
+    def _promedio_tiradas(self, juego, profundidad: int, alfa: float, beta: float) -> float:
+        """Promedia las tiradas con cortes Star1 y, si está activo, sondeo Star2.
+
+        'inferiores' guarda una cota inferior del valor de cada tirada (VALOR_MINIMO
+        sin sondeo, o el valor de su primera jugada con Star2). En la tirada i, con
+        'suma' acumulando las tiradas ya buscadas, la ventana del hijo se elige para
+        que un valor fuera de ella ya decida el corte del nodo de azar completo.
+        """
+        inferiores = [VALOR_MINIMO] * len(TIRADAS_DISTINTAS)
+        # Jugadas ordenadas de cada tirada, calculadas una vez en el sondeo.
+        candidatas = [None] * len(TIRADAS_DISTINTAS)
+        if self.star2:
+            sondeo = 0.0
+            for i, (movimientos, probabilidad) in enumerate(TIRADAS_DISTINTAS):
+                juego.fijar_movimientos(movimientos)
+                candidatas[i] = self._jugadas_ordenadas(juego, profundidad)
+                inferiores[i] = self._sondear(juego, profundidad, candidatas[i])
+                sondeo += probabilidad * inferiores[i]
+            if sondeo >= beta:
+                return sondeo
+
+        suma = 0.0
+        resto_inferior = sum(p * c for (_, p), c in zip(TIRADAS_DISTINTAS, inferiores))
+        resto_superior = VALOR_MAXIMO
+        for i, (movimientos, probabilidad) in enumerate(TIRADAS_DISTINTAS):
+            resto_inferior -= probabilidad * inferiores[i]
+            resto_superior -= probabilidad * VALOR_MAXIMO
+            minimo = (alfa - suma - resto_superior) / probabilidad
+            maximo = (beta - suma - resto_inferior) / probabilidad
+            juego.fijar_movimientos(movimientos)
+            valor = self._nodo_decision(
+                juego, profundidad, max(minimo, VALOR_MINIMO), min(maximo, VALOR_MAXIMO),
+                candidatas[i],
+            )
+            if valor <= minimo:
+                return suma + probabilidad * valor + resto_superior
+            if valor >= maximo:
+                return suma + probabilidad * valor + resto_inferior
+            suma += probabilidad * valor
+        return suma
+
+    def _jugadas_ordenadas(self, juego, profundidad: int) -> list:
+        """Jugadas legales de los dados fijados, ya ordenadas y podadas."""
+        jugadas = juego.jugadas_legales()
+        return self._candidatas(juego, jugadas, profundidad) if jugadas else jugadas
+
+    def _sondear(self, juego, profundidad: int, candidatas: list) -> float:
+        """Cota inferior de la tirada fijada: el valor exacto de su primera jugada."""
+        if not candidatas:
+            return self._valor_tras_jugar(juego, profundidad, VALOR_MINIMO, VALOR_MAXIMO)
+        return self.valor_jugada(juego, candidatas[0], profundidad)
+
+    def _nodo_decision(self, juego, profundidad: int, alfa: float = VALOR_MINIMO,
+                       beta: float = VALOR_MAXIMO, candidatas: list | None = None) -> float:
+        """Mejor valor entre las jugadas legales de los dados fijados (pasa si no hay).
+
+        Corta en cuanto una jugada alcanza beta; el resultado fuera de la
+        ventana es una cota, como en valor_jugada. 'candidatas' evita volver a
+        generar y ordenar las jugadas si ya se hizo en el sondeo.
+        """
+        self._contar_nodo()
+        if candidatas is None:
+            candidatas = self._jugadas_ordenadas(juego, profundidad)
+        if not candidatas:
+            return self._valor_tras_jugar(juego, profundidad, alfa, beta)
+        mejor = float("-inf")
+        for jugada in candidatas:
+            valor = self.valor_jugada(juego, jugada, profundidad, max(alfa, mejor), beta)
+            if valor > mejor:
+                mejor = valor
+                if mejor >= beta:
+                    break
+        return mejor
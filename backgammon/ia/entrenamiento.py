@@ -0,0 +1,350 @@
+"""Entrenamiento por diferencias temporales (TD(λ)) de la red con autojuego.
+
+Los trabajadores juegan partidas de la red contra sí misma (con una fracción
+de jugadas al azar para explorar) y devuelven la trayectoria: la fila de
+`codificacion` de cada posición antes de tirar y el resultado final. El proceso
+aprendiz ajusta los pesos con cada trayectoria y guarda un punto de control
+cada 'cada' partidas, del que se puede retomar después de una interrupción.
+
+El aprendizaje usa la forma "hacia adelante" de TD(λ): con los pesos actuales
+calcula el λ-retorno de cada posición de la partida,
+
+    G_t = (1 - λ) V(s_{t+1}) + λ G_{t+1},   G_{T-1} = resultado,
+
+y hace un paso de gradiente de todas las posiciones juntas hacia sus G_t (con
+entropía cruzada sobre las salidas sigmoides). Con la actualización al final de
+la partida es equivalente a las trazas de elegibilidad de TD-Gammon, pero se
+calcula con una pasada de la red por capa para toda la trayectoria. Como cada
+posición se evalúa desde el lado que mueve, V(s_{t+1}) se pasa al punto de
+vista de s_t con `invertir_salidas`.
+
+Las partidas se juegan por rondas con los pesos del comienzo de la ronda, así
+que el resultado depende de la semilla y del tamaño de ronda pero no de la
+cantidad de procesos. Con 'cada' múltiplo de 'ronda', retomar desde un punto de
+control da los mismos pesos que no haberse interrumpido.
+"""
+import argparse
+import json
+import os
+import time
+from multiprocessing import Pool
+from typing import NamedTuple
+import numpy as np
+from backgammon.core.codificacion import COLUMNA_LADO, codificar
+from backgammon.core.perspectiva import lado_de
+from backgammon.ia.red_neuronal import (
+    BACKGAMMON, BACKGAMMON_PERDIDO, GAMMON, GAMMON_PERDIDO, GANAR, SALIDAS,
+    EvaluadorRed, RedNeuronal, entradas_td,
+)
+from backgammon.simulacion.autojuego import MAX_TURNOS, jugar_desde
+
+ARCHIVO_PESOS = "red.npz"
+ARCHIVO_ESTADO = "estado.json"
+
+# Hiperparámetros por defecto (se guardan en el punto de control).
+CONFIGURACION = {
+    "ocultas": [80],
+    "alfa": 0.1,
+    "lam": 0.7,
+    "exploracion": 0.0,
+    "semilla": 0,
+    "ronda": 16,
+    "max_turnos": MAX_TURNOS,
+}
+
+
+class Trayectoria(NamedTuple):
+    """Partida de autojuego para el aprendiz.
+
+    'filas' tiene una fila de `codificacion` (int8) por cada posición antes de
+    tirar, con el lado que mueve en `COLUMNA_LADO`. 'ganador' es el lado que
+    ganó (None si se alcanzó el tope de turnos) y 'puntos' vale 1, 2 o 3.
+    """
+    indice: int
+    filas: np.ndarray
+    ganador: int | None
+    puntos: int
+
+
+class _EstrategiaExploracion:
+    """Juega con la red y, con probabilidad 'exploracion', una jugada al azar."""
+
+    def __init__(self, evaluador: EvaluadorRed, exploracion: float):
+        """Recibe el evaluador de la red y la probabilidad de explorar."""
+        self.evaluador = evaluador
+        self.exploracion = exploracion
+
+    def elegir_jugada(self, juego, jugadas, rng):
+        """Devuelve una jugada al azar al explorar o la mejor según la red."""
+        if self.exploracion and rng.random() < self.exploracion:
+            return jugadas[rng.randrange(len(jugadas))]
+        return self.evaluador.elegir_jugada(juego, jugadas, rng)
+
+
+def jugar_autoentrenamiento(indice: int, red: RedNeuronal, semilla: int = 0,
+                            exploracion: float = 0.0,
+                            max_turnos: int = MAX_TURNOS) -> Trayectoria:
+    """Juega una partida de la red contra sí misma y devuelve su trayectoria.
+
+    Recibe:
+        indice (int): número de partida; define dados y jugadas de exploración.
+        red (RedNeuronal): red que elige las jugadas de los dos lados.
+        semilla (int): semilla maestra del entrenamiento.
+        exploracion (float): probabilidad de jugar una jugada al azar.
+        max_turnos (int): tope de turnos antes de abandonar la partida.
+    Devuelve:
+        Trayectoria
+    """
+    estrategia = _EstrategiaExploracion(EvaluadorRed(red), exploracion)
+    filas = []
+    juego, _ = jugar_desde(
+        indice, (estrategia, estrategia), semilla, max_turnos=max_turnos,
+        antes_de_tirar=lambda juego: filas.append(codificar(juego.tablero, juego.lado_actual())),
+    )
+    filas = np.array(filas, dtype=np.int8)
+    ganador = juego.ganador()
+    if ganador is None:
+        return Trayectoria(indice, filas, None, 0)
+    return Trayectoria(indice, filas, lado_de(ganador.id), juego.puntos_victoria())
+
+
+def invertir_salidas(salidas) -> np.ndarray:
+    """Pasa salidas (N, 5) al punto de vista del otro lado."""
+    salidas = np.atleast_2d(salidas)
+    invertidas = np.empty_like(salidas)
+    invertidas[:, GANAR] = 1 - salidas[:, GANAR]
+    invertidas[:, GAMMON] = salidas[:, GAMMON_PERDIDO]
+    invertidas[:, BACKGAMMON] = salidas[:, BACKGAMMON_PERDIDO]
+    invertidas[:, GAMMON_PERDIDO] = salidas[:, GAMMON]
+    invertidas[:, BACKGAMMON_PERDIDO] = salidas[:, BACKGAMMON]
+    return invertidas
+
+
+def resultado_para(lado: int, ganador: int, puntos: int) -> np.ndarray:
+    """Salidas exactas (5,) del resultado final desde el punto de vista de 'lado'."""
+    resultado = np.zeros(SALIDAS, dtype=np.float32)
+    resultado[[GANAR, GAMMON, BACKGAMMON]] = (1, puntos >= 2, puntos >= 3)
+    return resultado if lado == ganador else invertir_salidas(resultado)[0]
+
+
+def objetivos_td(salidas, lados, ganador: int, puntos: int, lam: float) -> np.ndarray:
+    """λ-retornos (T, 5) de una trayectoria, cada uno desde el lado que mueve en t.
+
+    Recibe:
+        salidas (np.ndarray): salidas (T, 5) de la red en cada posición.
+        lados (Sequence[int]): lado que mueve en cada posición.
+        ganador (int): lado ganador.
+        puntos (int): 1, 2 o 3.
+        lam (float): λ de TD(λ) (0 = TD(0), 1 = Monte Carlo).
+    Devuelve:
+        np.ndarray: objetivos (T, 5) en float32.
+    """
+    total = len(salidas)
+    objetivos = np.empty((total, SALIDAS), dtype=np.float32)
+    objetivos[-1] = resultado_para(lados[-1], ganador, puntos)
+    for t in range(total - 2, -1, -1):
+        siguiente = (1 - lam) * salidas[t + 1] + lam * objetivos[t + 1]
+        objetivos[t] = siguiente if lados[t + 1] == lados[t] else invertir_salidas(siguiente)
+    return objetivos
+
+
+def actualizar(red: RedNeuronal, entradas, objetivos, alfa: float) -> float:
+    """Un paso de gradiente de la red hacia los objetivos, promediado en el lote.
+
+    Con salidas sigmoides y entropía cruzada, el error de la última capa es
+    simplemente salida - objetivo. Devuelve el error cuadrático medio previo.
+    """
+    activaciones = red.activaciones(entradas)
+    delta = activaciones[-1] - objetivos
+    error = float(np.mean(delta * delta))
+    escala = alfa / len(delta)
+    for capa in range(len(red.pesos) - 1, -1, -1):
+        anterior = activaciones[capa]
+        gradiente = anterior.T @ delta
+        sesgo = delta.sum(axis=0)
+        if capa:
+            delta = (delta @ red.pesos[capa].T) * anterior * (1 - anterior)
+        red.pesos[capa] -= escala * gradiente
+        red.sesgos[capa] -= escala * sesgo
+    return error
+
+
+def aprender(red: RedNeuronal, trayectoria: Trayectoria, alfa: float, lam: float) -> float | None:
+    """Ajusta la red con una trayectoria terminada; devuelve el error o None si no terminó."""
+    if trayectoria.ganador is None or len(trayectoria.filas) == 0:
+        return None
+    entradas = entradas_td(trayectoria.filas)
+    salidas = red.evaluar_lote(entradas)
+    objetivos = objetivos_td(
+        salidas, trayectoria.filas[:, COLUMNA_LADO], trayectoria.ganador,
+        trayectoria.puntos, lam,
+    )
+    return actualizar(red, entradas, objetivos, alfa)
+
+
+def _jugar_lote(tarea) -> list[Trayectoria]:
+    """Juega un lote de partidas con los pesos recibidos (trabajador del pool)."""
+    pesos, sesgos, indices, semilla, exploracion, max_turnos = tarea
+    red = RedNeuronal(pesos, sesgos)
+    return [
+        jugar_autoentrenamiento(indice, red, semilla, exploracion, max_turnos)
+        for indice in indices
+    ]
+
+
+def cargar_punto_de_control(carpeta: str) -> tuple[RedNeuronal, dict] | None:
+    """Devuelve (red, estado) del punto de control de la carpeta, o None si no hay."""
+    ruta_estado = os.path.join(carpeta, ARCHIVO_ESTADO)
+    if not os.path.exists(ruta_estado):
+        return None
+    with open(ruta_estado, encoding="utf-8") as archivo:
+        estado = json.load(archivo)
+    return RedNeuronal.cargar(os.path.join(carpeta, ARCHIVO_PESOS)), estado
+
+
+def guardar_punto_de_control(carpeta: str, red: RedNeuronal, estado: dict):
+    """Guarda pesos y estado; cada archivo se reemplaza entero o no se toca."""
+    os.makedirs(carpeta, exist_ok=True)
+    ruta_pesos = os.path.join(carpeta, ARCHIVO_PESOS)
+    temporal = os.path.join(carpeta, "red.tmp.npz")
+    red.guardar(temporal)
+    os.replace(temporal, ruta_pesos)
+    ruta_estado = os.path.join(carpeta, ARCHIVO_ESTADO)
+    with open(ruta_estado + ".tmp", "w", encoding="utf-8") as archivo:
+        json.dump(estado, archivo, indent=2)
+    os.replace(ruta_estado + ".tmp", ruta_estado)
+
+
+def entrenar(carpeta: str, partidas: int, procesos: int | None = None, cada: int = 500,
+             al_guardar=None, **configuracion) -> dict:
+    """Entrena (o retoma el entrenamiento) hasta completar 'partidas' partidas.
+
+    Si la carpeta ya tiene un punto de control, sigue desde ahí con su misma
+    configuración; si no, crea una red nueva con 'configuracion' (ver
+    CONFIGURACION). Guarda un punto de control cada 'cada' partidas y al final.
+
+    Recibe:
+        carpeta (str): carpeta de los puntos de control.
+        partidas (int): total de partidas a completar (contando las ya hechas).
+        procesos (int | None): procesos del pool; 1 juega en el proceso actual y
+            None usa todos los núcleos.
+        cada (int): partidas entre puntos de control.
+        al_guardar (Callable[[dict], None] | None): se llama con el estado al guardar.
+        **configuracion: hiperparámetros de CONFIGURACION para un entrenamiento nuevo.
+    Devuelve:
+        dict: el estado final (configuración, partidas, errores y tiempos).
+    """
+    desconocidos = set(configuracion) - set(CONFIGURACION)
+    if desconocidos:
+        raise ValueError(f"parámetros desconocidos: {sorted(desconocidos)}")
+    guardado = cargar_punto_de_control(carpeta)
+    if guardado is None:
+        config = {**CONFIGURACION, **configuracion}
+        red = RedNeuronal.aleatoria(config["ocultas"], semilla=config["semilla"])
+        estado = {"configuracion": config, "partidas": 0, "segundos": 0.0, "historial": []}
+    else:
+        red, estado = guardado
+        config = estado["configuracion"]
+
+    inicio = time.perf_counter()
+    segundos_previos = estado["segundos"]
+    errores, turnos, sin_terminar = [], [], 0
+
+    def guardar():
+        """Agrega una entrada al historial y escribe el punto de control."""
+        nonlocal errores, turnos, sin_terminar
+        estado["segundos"] = segundos_previos + time.perf_counter() - inicio
+        estado["historial"].append({
+            "partidas": estado["partidas"],
+            "error_td": float(np.mean(errores)) if errores else None,
+            "turnos_promedio": float(np.mean(turnos)) if turnos else None,
+            "sin_terminar": sin_terminar,
+            "segundos": estado["segundos"],
+        })
+        errores, turnos, sin_terminar = [], [], 0
+        guardar_punto_de_control(carpeta, red, estado)
+        if al_guardar is not None:
+            al_guardar(estado)
+
+    def rondas():
+        """Índices de partida de cada ronda hasta completar el total.
+
+        Las rondas terminan en múltiplos de 'ronda', así que retomar desde un
+        punto de control en el borde de una ronda reproduce el entrenamiento
+        sin cortes.
+        """
+        desde = estado["partidas"]
+        while desde < partidas:
+            hasta = min((desde // config["ronda"] + 1) * config["ronda"], partidas)
+            yield range(desde, hasta)
+            desde = hasta
+
+    def tareas(indices, cantidad):
+        """Reparte los índices de una ronda en 'cantidad' lotes con los pesos actuales."""
+        pesos = [w.copy() for w in red.pesos]
+        sesgos = [b.copy() for b in red.sesgos]
+        return [
+            (pesos, sesgos, indices[i::cantidad], config["semilla"], config["exploracion"],
+             config["max_turnos"])
+            for i in range(min(cantidad, len(indices)))
+        ]
+
+    def procesar(trayectorias):
+        """Aprende de las trayectorias de una ronda en orden de índice."""
+        nonlocal sin_terminar
+        for trayectoria in sorted(trayectorias, key=lambda t: t.indice):
+            error = aprender(red, trayectoria, config["alfa"], config["lam"])
+            if error is None:
+                sin_terminar += 1
+            else:
+                errores.append(error)
+                turnos.append(len(trayectoria.filas))
+            estado["partidas"] = trayectoria.indice + 1
+            if estado["partidas"] % cada == 0:
+                guardar()
+
+    if procesos == 1:
+        for indices in rondas():
+            procesar(t for lote in tareas(indices, 1) for t in _jugar_lote(lote))
+    else:
+        procesos = procesos or os.cpu_count() or 1
+        with Pool(procesos) as pool:
+            for indices in rondas():
+                procesar(t for lote in pool.map(_jugar_lote, tareas(indices, procesos))
+                         for t in lote)
+    if not estado["historial"] or estado["historial"][-1]["partidas"] != estado["partidas"]:
+        guardar()
+    return estado
+
+
+def main(argv=None):
+    """Entrena la red: python -m backgammon.ia.entrenamiento --carpeta DIR --partidas N."""
+    parser = argparse.ArgumentParser(description="Entrenamiento TD(λ) por autojuego.")
+    parser.add_argument("--carpeta", required=True,
+                        help="puntos de control; si ya tiene uno, se retoma desde ahí")
+    parser.add_argument("--partidas", type=int, required=True,
+                        help="total de partidas a completar")
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--cada", type=int, default=500)
+    parser.add_argument("--ocultas", type=int, nargs="+", default=CONFIGURACION["ocultas"])
+    parser.add_argument("--alfa", type=float, default=CONFIGURACION["alfa"])
+    parser.add_argument("--lam", type=float, default=CONFIGURACION["lam"])
+    parser.add_argument("--exploracion", type=float, default=CONFIGURACION["exploracion"])
+    parser.add_argument("--semilla", type=int, default=CONFIGURACION["semilla"])
+    parser.add_argument("--ronda", type=int, default=CONFIGURACION["ronda"])
+    args = parser.parse_args(argv)
+
+    def mostrar(estado):
+        ultimo = estado["historial"][-1]
+        print(f"{ultimo['partidas']} partidas, error TD {ultimo['error_td']}, "
+              f"{ultimo['turnos_promedio']} turnos por partida, {ultimo['segundos']:.0f} s")
+
+    return entrenar(
+        args.carpeta, args.partidas, args.procesos, args.cada, al_guardar=mostrar,
+        ocultas=args.ocultas, alfa=args.alfa, lam=args.lam,
+        exploracion=args.exploracion, semilla=args.semilla, ronda=args.ronda,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Estrategias para jugar sin intervención humana.
+
+Una estrategia es cualquier objeto con el método
+`elegir_jugada(juego, jugadas, rng)` que recibe el `Juego` (ya con los dados
+tirados), la lista de `Juego.jugadas_legales()` (no vacía) y un `random.Random`
+propio de la partida, y devuelve una de esas jugadas. Las estrategias deben ser
+serializables con pickle para poder enviarlas a otros procesos.
+"""
+import numpy as np
+from backgammon.core.codificacion import codificar_jugadas
+from backgammon.ia.busqueda import BotExpectiminimax
+from backgammon.ia.evaluacion import pips_de_filas
+
+
+class EstrategiaAleatoria:
+    """Elige una jugada legal al azar."""
+
+    nombre = "aleatoria"
+
+    def elegir_jugada(self, juego, jugadas, rng):
+        """Devuelve una jugada elegida con el generador de la partida."""
+        return jugadas[rng.randrange(len(jugadas))]
+
+
+class EstrategiaCarrera:
+    """Elige la jugada que deja la mayor ventaja de pips.
+
+    Evalúa todas las jugadas candidatas juntas con `codificar_jugadas`: golpear
+    suma pips al rival y avanzar resta pips propios.
+    """
+
+    nombre = "carrera"
+
+    def elegir_jugada(self, juego, jugadas, rng):
+        """Devuelve la jugada que maximiza pips del rival menos pips propios."""
+        lado = juego.lado_actual()
+        filas = codificar_jugadas(juego.tablero.celdas(), lado, jugadas)
+        ventaja = pips_de_filas(filas, 1 - lado) - pips_de_filas(filas, lado)
+        return jugadas[int(np.argmax(ventaja))]
+
+
+ESTRATEGIAS = {
+    EstrategiaAleatoria.nombre: EstrategiaAleatoria,
+    EstrategiaCarrera.nombre: EstrategiaCarrera,
+    BotExpectiminimax.nombre: BotExpectiminimax,
+}
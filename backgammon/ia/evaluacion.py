@@ -0,0 +1,96 @@
+"""Evaluación estática de posiciones para las búsquedas.
+
+Un evaluador es una función `evaluador(juego) -> float` que puntúa la posición
+desde el punto de vista de `juego.jugador_actual` antes de tirar los dados. El
+valor está en unidades de puntos de partida y acotado a [-3, 3] (la heurística de
+este módulo, a [-1, 1]); las posiciones terminadas las puntúa la búsqueda con
+`Juego.puntos_victoria()`. `ia/red_neuronal.py` tiene un evaluador con red neuronal.
+"""
+import math
+import numpy as np
+from backgammon.core.codificacion import codificar_jugadas
+from backgammon.core.mascaras import CASA, prime_mas_largo
+from backgammon.core.perspectiva import lado_de
+from backgammon.core.tablero import PUNTOS
+from backgammon.core.tablero_compacto import BARRA
+
+# Pesos de la heurística, en pips equivalentes.
+PESO_BLOT_PROPIO = 2.0
+PESO_BLOT_RIVAL = 4.0
+PESO_PUNTO_EN_CASA = 3.0
+PESO_PRIME = 2.0
+# Pips de ventaja que valen aproximadamente una partida ganada.
+ESCALA = 30.0
+
+# Pips que aporta cada punto a cada lado: J1 saca desde p con p+1, J2 con 24-p.
+_PIPS_POR_PUNTO = (
+    np.arange(1, PUNTOS + 1),
+    np.arange(PUNTOS, 0, -1),
+)
+# Puntos del home board de cada lado dentro de las filas codificadas.
+_CASA_EN_FILA = (slice(0, 6), slice(18, PUNTOS))
+
+
+def _rasgos(tablero, jugador_id: int) -> tuple[int, int, int, int]:
+    """Devuelve (pips, blots, puntos hechos en casa, prime más largo) del jugador."""
+    lado = lado_de(jugador_id)
+    _, blots, hechos = tablero.mascaras(jugador_id)
+    return (
+        tablero.pips(jugador_id),
+        blots.bit_count(),
+        (hechos & CASA[lado]).bit_count(),
+        prime_mas_largo(hechos),
+    )
+
+
+def evaluar_heuristica(juego) -> float:
+    """Puntúa la posición para el jugador que va a tirar.
+
+    Combina la ventaja de pips con los blots de cada lado (los del rival pesan
+    más porque el jugador que tira puede golpearlos), los puntos hechos en casa
+    y el prime más largo, y lo lleva a [-1, 1] con una tangente hiperbólica.
+    """
+    pid = juego.jugador_actual.id
+    j1, j2 = juego.jugadores
+    rival = j2.id if pid == j1.id else j1.id
+    pips, blots, casa, prime = _rasgos(juego.tablero, pid)
+    pips_r, blots_r, casa_r, prime_r = _rasgos(juego.tablero, rival)
+    ventaja = (
+        (pips_r - pips)
+        + PESO_BLOT_RIVAL * blots_r - PESO_BLOT_PROPIO * blots
+        + PESO_PUNTO_EN_CASA * (casa - casa_r)
+        + PESO_PRIME * (prime - prime_r)
+    )
+    return math.tanh(ventaja / ESCALA)
+
+
+def pips_de_filas(filas, lado: int) -> np.ndarray:
+    """Pip count del lado en cada fila de `codificacion` (la barra cuenta 25)."""
+    puntos = filas[:, :PUNTOS].astype(np.int32)
+    if lado == 0:
+        fichas = np.maximum(puntos, 0)
+    else:
+        fichas = np.maximum(-puntos, 0)
+    return fichas @ _PIPS_POR_PUNTO[lado] + 25 * filas[:, BARRA + lado].astype(np.int32)
+
+
+def puntuar_jugadas(celdas, lado: int, jugadas) -> np.ndarray:
+    """Puntuación rápida de cada jugada para ordenarlas, desde el lado que juega.
+
+    Usa los mismos rasgos que `evaluar_heuristica` salvo el prime, calculados
+    para todas las jugadas a la vez sobre `codificar_jugadas`. Después de jugar
+    le toca tirar al rival, así que los blots propios son los que pesan más.
+    """
+    filas = codificar_jugadas(celdas, lado, jugadas)
+    puntos = filas[:, :PUNTOS]
+    signo = 1 if lado == 0 else -1
+    propios = puntos * signo
+    blots = (propios == 1).sum(axis=1)
+    blots_r = (propios == -1).sum(axis=1)
+    casa = (propios[:, _CASA_EN_FILA[lado]] >= 2).sum(axis=1)
+    casa_r = (propios[:, _CASA_EN_FILA[1 - lado]] <= -2).sum(axis=1)
+    return (
+        (pips_de_filas(filas, 1 - lado) - pips_de_filas(filas, lado))
+        - PESO_BLOT_RIVAL * blots + PESO_BLOT_PROPIO * blots_r
+        + PESO_PUNTO_EN_CASA * (casa - casa_r)
+    )
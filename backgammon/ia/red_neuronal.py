@@ -0,0 +1,205 @@
+"""Evaluador de posiciones con una red neuronal feed-forward en NumPy.
+
+La entrada es la codificación de 198 unidades de TD-Gammon, calculada desde el
+punto de vista del lado que mueve en cada fila de `codificacion`:
+
+* 96 unidades para las fichas propias y 96 para las del rival: 4 por punto,
+  ordenados por la distancia a la salida de cada lado (el primero es el que
+  está a 1 pip). Con n fichas las unidades son n >= 1, n >= 2, n >= 3 y
+  (n - 3) / 2 si hay más de tres.
+* Fichas en la barra / 2 y fichas sacadas / 15, propias y del rival.
+* Dos unidades para el lado que mueve (J1 o J2).
+
+La red tiene capas ocultas sigmoides y 5 salidas sigmoides, también desde el
+lado que mueve: P(ganar), P(ganar con gammon), P(ganar con backgammon),
+P(perder con gammon) y P(perder con backgammon). Un lote de N posiciones se
+evalúa con una multiplicación de matrices por capa.
+"""
+import numpy as np
+from backgammon.core.codificacion import COLUMNA_LADO, codificar, codificar_jugadas
+from backgammon.core.tablero import PUNTOS
+from backgammon.core.tablero_compacto import BARRA, SALIDA
+
+ENTRADAS = 198
+SALIDAS = 5
+GANAR, GAMMON, BACKGAMMON, GAMMON_PERDIDO, BACKGAMMON_PERDIDO = range(SALIDAS)
+FICHAS_POR_LADO = 15
+
+
+def _unidades_por_punto(fichas: np.ndarray) -> np.ndarray:
+    """Convierte fichas por punto (N, 24) en las 4 unidades de cada punto (N, 96)."""
+    unidades = np.empty(fichas.shape + (4,), dtype=np.float32)
+    unidades[..., 0] = fichas >= 1
+    unidades[..., 1] = fichas >= 2
+    unidades[..., 2] = fichas >= 3
+    unidades[..., 3] = np.maximum(fichas - 3, 0) / 2
+    return unidades.reshape(len(fichas), -1)
+
+
+def entradas_td(filas) -> np.ndarray:
+    """Codificación de 198 unidades de cada fila, desde el lado que mueve en la fila.
+
+    Recibe:
+        filas (np.ndarray): matriz (N, ANCHO) de `codificacion` (o una sola fila).
+    Devuelve:
+        np.ndarray: matriz (N, ENTRADAS) de float32.
+    """
+    filas = np.atleast_2d(filas)
+    puntos = filas[:, :PUNTOS].astype(np.int16)
+    # J1 saca desde el punto 0 (1 pip) y J2 desde el 23: se invierte su orden.
+    fichas_j1 = np.maximum(puntos, 0)
+    fichas_j2 = np.maximum(-puntos, 0)[:, ::-1]
+    mueve_j2 = (filas[:, COLUMNA_LADO] == 1)[:, None]
+    propias = np.where(mueve_j2, fichas_j2, fichas_j1)
+    rivales = np.where(mueve_j2, fichas_j1, fichas_j2)
+
+    lado = filas[:, COLUMNA_LADO].astype(np.intp)
+    filas_idx = np.arange(len(filas))
+    entradas = np.empty((len(filas), ENTRADAS), dtype=np.float32)
+    entradas[:, :96] = _unidades_por_punto(propias)
+    entradas[:, 96:192] = _unidades_por_punto(rivales)
+    entradas[:, 192] = filas[filas_idx, BARRA + lado] / 2
+    entradas[:, 193] = filas[filas_idx, BARRA + 1 - lado] / 2
+    entradas[:, 194] = filas[filas_idx, SALIDA + lado] / FICHAS_POR_LADO
+    entradas[:, 195] = filas[filas_idx, SALIDA + 1 - lado] / FICHAS_POR_LADO
+    entradas[:, 196] = lado == 0
+    entradas[:, 197] = lado == 1
+    return entradas
+
+
+def entradas_tablero(tablero, lado: int) -> np.ndarray:
+    """Codificación de 198 unidades de un Tablero (o TableroCompacto) para el lado que mueve."""
+    return entradas_td(codificar(tablero, lado))[0]
+
+
+def equidad(salidas) -> np.ndarray:
+    """Valor esperado en puntos de partida de cada fila de salidas (N, 5).
+
+    Antes de combinarlas corrige las salidas inconsistentes: un gammon no
+    puede ser más probable que ganar ni un backgammon más que un gammon.
+    """
+    salidas = np.atleast_2d(salidas)
+    ganar = salidas[:, GANAR]
+    gammon = np.minimum(salidas[:, GAMMON], ganar)
+    backgammon = np.minimum(salidas[:, BACKGAMMON], gammon)
+    gammon_perdido = np.minimum(salidas[:, GAMMON_PERDIDO], 1 - ganar)
+    backgammon_perdido = np.minimum(salidas[:, BACKGAMMON_PERDIDO], gammon_perdido)
+    return (2 * ganar - 1) + (gammon - gammon_perdido) + (backgammon - backgammon_perdido)
+
+
+def _sigmoide(x: np.ndarray) -> np.ndarray:
+    """Función logística, estable para valores grandes."""
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+class RedNeuronal:
+    """Red feed-forward con capas ocultas y de salida sigmoides.
+
+    Los pesos de la capa k son una matriz (entradas, salidas) y un vector de
+    sesgos; una capa sobre un lote es `sigmoide(X @ W + b)`.
+    """
+
+    def __init__(self, pesos, sesgos):
+        """Recibe las listas de matrices de pesos y de vectores de sesgos, capa por capa."""
+        pesos = [np.asarray(w, dtype=np.float32) for w in pesos]
+        sesgos = [np.asarray(b, dtype=np.float32) for b in sesgos]
+        if not pesos or len(pesos) != len(sesgos):
+            raise ValueError("se necesita un vector de sesgos por cada matriz de pesos")
+        anterior = ENTRADAS
+        for w, b in zip(pesos, sesgos):
+            if w.ndim != 2 or w.shape[0] != anterior or b.shape != (w.shape[1],):
+                raise ValueError(f"forma de capa inválida: {w.shape} con sesgos {b.shape}")
+            anterior = w.shape[1]
+        if anterior != SALIDAS:
+            raise ValueError(f"la última capa debe tener {SALIDAS} salidas")
+        self.pesos = pesos
+        self.sesgos = sesgos
+
+    @classmethod
+    def aleatoria(cls, ocultas=(80,), semilla=None) -> "RedNeuronal":
+        """Crea una red con pesos iniciales chicos al azar.
+
+        Recibe:
+            ocultas (Sequence[int]): neuronas de cada capa oculta.
+            semilla: semilla para `np.random.default_rng`.
+        """
+        rng = np.random.default_rng(semilla)
+        tamanios = [ENTRADAS, *ocultas, SALIDAS]
+        pesos = [
+            rng.normal(0.0, 1.0 / np.sqrt(entradas), (entradas, salidas))
+            for entradas, salidas in zip(tamanios, tamanios[1:])
+        ]
+        return cls(pesos, [np.zeros(salidas) for salidas in tamanios[1:]])
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "RedNeuronal":
+        """Carga los pesos guardados con `guardar` (.npz con pesos_k y sesgos_k)."""
+        with np.load(ruta) as datos:
+            capas = sum(1 for nombre in datos.files if nombre.startswith("pesos_"))
+            try:
+                pesos = [datos[f"pesos_{k}"] for k in range(capas)]
+                sesgos = [datos[f"sesgos_{k}"] for k in range(capas)]
+            except KeyError as error:
+                raise ValueError(f"{ruta} no tiene los pesos de una red: {error}") from None
+        return cls(pesos, sesgos)
+
+    def guardar(self, ruta: str):
+        """Guarda los pesos en un archivo .npz."""
+        arreglos = {}
+        for k, (w, b) in enumerate(zip(self.pesos, self.sesgos)):
+            arreglos[f"pesos_{k}"] = w
+            arreglos[f"sesgos_{k}"] = b
+        np.savez(ruta, **arreglos)
+
+    @property
+    def ocultas(self) -> tuple[int, ...]:
+        """Neuronas de cada capa oculta."""
+        return tuple(w.shape[1] for w in self.pesos[:-1])
+
+    def activaciones(self, entradas) -> list[np.ndarray]:
+        """Salidas de cada capa para un lote, empezando por las entradas."""
+        capas = [np.atleast_2d(np.asarray(entradas, dtype=np.float32))]
+        for w, b in zip(self.pesos, self.sesgos):
+            capas.append(_sigmoide(capas[-1] @ w + b))
+        return capas
+
+    def evaluar_lote(self, entradas) -> np.ndarray:
+        """Salidas (N, 5) de la red para un lote de entradas (N, 198)."""
+        return self.activaciones(entradas)[-1]
+
+
+class EvaluadorRed:
+    """Evaluador y estrategia basados en una `RedNeuronal`.
+
+    Como evaluador (`evaluador(juego)`) devuelve la equidad del jugador que va
+    a tirar, entre -3 y 3. Como estrategia puntúa todas las jugadas candidatas
+    en un solo lote con `codificar_jugadas`.
+    """
+
+    nombre = "red"
+
+    def __init__(self, red: RedNeuronal):
+        """Recibe la red ya cargada (ver `RedNeuronal.cargar`)."""
+        self.red = red
+
+    def salidas(self, juego) -> np.ndarray:
+        """Las 5 probabilidades de la red para el jugador que va a tirar."""
+        filas = codificar(juego.tablero, juego.lado_actual())
+        return self.red.evaluar_lote(entradas_td(filas))[0]
+
+    def __call__(self, juego) -> float:
+        """Equidad de la posición para el jugador que va a tirar."""
+        return float(equidad(self.salidas(juego))[0])
+
+    def puntuar_jugadas(self, juego, jugadas) -> np.ndarray:
+        """Equidad de cada jugada para el jugador que la hace, en un solo lote.
+
+        Las filas de `codificar_jugadas` quedan con el turno del rival, así que
+        la red las evalúa desde el rival y se cambia el signo.
+        """
+        filas = codificar_jugadas(juego.tablero.celdas(), juego.lado_actual(), jugadas)
+        return -equidad(self.red.evaluar_lote(entradas_td(filas)))
+
+    def elegir_jugada(self, juego, jugadas, rng):
+        """Devuelve la jugada con mayor equidad (rng no se usa)."""
+        return jugadas[int(np.argmax(self.puntuar_jugadas(juego, jugadas)))]
@@ -14,6 +14,8 @@ import sys
 import pygame
 from backgammon.core.juego import Juego
 from backgammon.core.jugador import Jugador
+from backgammon.core.destinos import puntos_de_entrada
+from backgammon.core.perspectiva import lado_de
 from backgammon.core.tablero import PUNTOS
 
 ANCHO = 1000
@@ -188,9 +190,10 @@ def dibujar_punto_seleccionado(
 
         # Mostrar texto de ayuda
         font = pygame.font.Font(None, 20)
-        pid = juego.jugador_actual.id
-        entrada = juego._entrada_para(pid)
-        txt = font.render(f"Click en punto {entrada} para entrar", True, (255, 140, 0))
+        puntos = puntos_de_entrada(
+            lado_de(juego.jugador_actual.id), juego.movimientos_disponibles())
+        texto = ", ".join(str(punto) for punto in puntos)
+        txt = font.render(f"Click en punto {texto} para entrar", True, (255, 140, 0))
         surface.blit(txt, (bar_rect.centerx - 100, bar_rect.centery - 10))
         return
 
@@ -380,31 +383,7 @@ def draw_bearing_off_bar(
 
 def _tiene_movimientos_validos(juego: Juego, punto: int) -> bool:
     """Verifica si un punto tiene movimientos válidos."""
-    movs = juego.movimientos_disponibles()
-    if not movs:
-        return False
-
-    pid = juego.jugador_actual.id
-
-    if juego.tablero.fichas_en_barra(pid) > 0:
-        entrada = juego._entrada_para(pid)
-        return punto == entrada
-
-    for mov in movs:
- #J1 (impar) decrementa, J2 (par) incrementa
-        destino = (punto - mov) if pid % 2 != 0 else (punto + mov)
-
-        if 0 <= destino < PUNTOS:
-            ok, _ = juego._validar_movimiento(punto, destino)
-            if ok:
-                return True
-
-        if juego.tablero.puede_sacar_fichas(pid):
-            ok, _ = juego._validar_movimiento(punto, PUNTOS)
-            if ok:
-                return True
-
-    return False
+    return any(desde == punto for desde, _, _ in juego.movimientos_legales())
 
 
 def dibujar_hints(
@@ -419,22 +398,13 @@ def dibujar_hints(
 
     board_rect = BOARD.get_rect()
     pid = juego.jugador_actual.id
-    posibles = set()
 
     fichas_barra = juego.tablero.fichas_en_barra(pid)
 
     # NUEVO: Si seleccionó la barra, mostrar punto de entrada
     if origen == BARRA_SELECCION and fichas_barra > 0:
-        entrada = juego._entrada_para(pid)
-
-        # Mostrar hints en todos los puntos posibles desde la entrada
-        for mov in movs:
-            # ✅ CORRECCIÓN: desde barra, J1 incrementa desde 0, J2 decrementa desde 23
-            destino = entrada + mov if pid % 2 != 0 else entrada - mov
-            if 0 <= destino < PUNTOS:
-                ok, _ = juego._validar_movimiento(entrada, destino)
-                if ok:
-                    posibles.add(destino)
+        # Con fichas en la barra todos los movimientos legales son reingresos
+        posibles = {hasta for _, hasta, _ in juego.movimientos_legales()}
 
         # Dibujar los hints
         for idx in posibles:
@@ -445,7 +415,6 @@ def dibujar_hints(
 
     # Si tiene fichas en barra pero NO seleccionó nada, mostrar advertencia
     if fichas_barra > 0 and origen is None:
-        entrada = juego._entrada_para(pid)
         bar_rect = BOARD.get_bar_rect()
 
         # Destacar la barra
@@ -460,26 +429,13 @@ def dibujar_hints(
     if origen is None:
         return
 
-    for distancia in movs:
-        # J1 (impar) decrementa en tablero, J2 (par) incrementa en tablero
-        if pid % 2 != 0:
-            destino_fwd = origen - distancia
-        else:
-            destino_fwd = origen + distancia
-
-        if 0 <= destino_fwd < PUNTOS:
-            ok_mov, _ = juego._validar_movimiento(origen, destino_fwd)
-            if ok_mov:
-                posibles.add(destino_fwd)
-
-        if juego.tablero.puede_sacar_fichas(pid):
-            ok_sacar, _ = juego._validar_movimiento(origen, PUNTOS)
-            if ok_sacar:
-                posibles.add(PUNTOS)
+    posibles = {
+        hasta for desde, hasta, _ in juego.movimientos_legales() if desde == origen
+    }
 
     for idx in posibles:
         if idx == PUNTOS:
-            out_x = OUT_BAR_X_J1 if pid % 2 != 0 else OUT_BAR_X_J2
+            out_x = OUT_BAR_X_J1 if lado_de(pid) == 0 else OUT_BAR_X_J2
             rect = pygame.Rect(
                 out_x + 10, board_rect.centery - 15, OUT_BAR_W - 20, 30
             )
@@ -593,38 +549,7 @@ def manejar_evento_tirada(juego: Juego, font: pygame.font.Font):
 
     dado1, dado2, movs = juego.tirar()
 
-    pid = juego.jugador_actual.id
-    tiene_movimientos = False
-
-    if juego.tablero.fichas_en_barra(pid) > 0:
-        entrada = juego._entrada_para(pid)
-        for mov in movs:
-            # ✅ CORRECCIÓN: desde barra, J1 incrementa desde 0, J2 decrementa desde 23
-            destino = entrada + mov if pid % 2 != 0 else entrada - mov
-            if 0 <= destino < PUNTOS:
-                ok, _ = juego._validar_movimiento(entrada, destino)
-                if ok:
-                    tiene_movimientos = True
-                    break
-    else:
-        for punto in range(PUNTOS):
-            fichas = juego.tablero.punto(punto)
-            if fichas and fichas[0].owner_id == pid:
-                for mov in movs:
-                    # J1 (impar) decrementa en tablero, J2 (par) incrementa en tablero
-                    destino = (punto - mov) if pid % 2 != 0 else (punto + mov)
-                    if 0 <= destino < PUNTOS:
-                        ok, _ = juego._validar_movimiento(punto, destino)
-                        if ok:
-                            tiene_movimientos = True
-                            break
-                    if juego.tablero.puede_sacar_fichas(pid):
-                        ok, _ = juego._validar_movimiento(punto, PUNTOS)
-                        if ok:
-                            tiene_movimientos = True
-                            break
-                if tiene_movimientos:
-                    break
+    tiene_movimientos = bool(juego.movimientos_legales())
 
     if not tiene_movimientos:
         mensaje = f"🎲 {dado1}-{dado2} → ❌ Sin movimientos válidos"
@@ -790,14 +715,14 @@ def _dibujar_hud(
     estado_render = f16.render(estado, True, (120, 120, 120))
     surface.blit(estado_render, (15, 64))
 
-    turno_color = COLOR_J1 if juego.jugador_actual.id % 2 != 0 else COLOR_J2
+    turno_color = COLOR_J1 if lado_de(juego.jugador_actual.id) == 0 else COLOR_J2
     turno_bg = (100, 180, 100) if movs else (180, 100, 100)
 
     turno_rect = pygame.Rect(ANCHO - 320, 10, 305, 80)
     pygame.draw.rect(surface, turno_bg, turno_rect, border_radius=12)
     pygame.draw.rect(surface, LINE, turno_rect, 3, border_radius=12)
 
-    simbolo = "●" if juego.jugador_actual.id % 2 != 0 else "○"
+    simbolo = "●" if lado_de(juego.jugador_actual.id) == 0 else "○"
     nombre_font = pygame.font.Font(None, 32)
     nombre = nombre_font.render(
         f"{simbolo} {juego.jugador_actual.nombre}",
@@ -824,6 +749,32 @@ def _dibujar_hud(
         surface.blit(ultimo_txt, (25, msg_y + 7))
 
 
+def dibujar_juego(
+    surface: pygame.Surface,
+    juego: Juego,
+    fuentes: tuple[pygame.font.Font, pygame.font.Font, pygame.font.Font],
+    seleccionado: int | None = None,
+    ultimo_txt: pygame.Surface | None = None
+) -> None:
+    """Dibuja un cuadro completo (HUD, tablero, fichas, barra y pistas) del juego.
+
+    'fuentes' son las de 24, 20 y 16 puntos. La usan el bucle de la interfaz y
+    el render de `simulacion.entorno`, que dibuja sobre una superficie propia.
+    """
+    f24, f20, f16 = fuentes
+    surface.fill(BG_COLOR)
+    _dibujar_hud(surface, juego, ultimo_txt, f24, f16)
+    draw_bearing_off_bar(surface, juego, f20)
+    dibujar_marco_y_labels(surface, f20)
+    dibujar_triangulos(surface)
+    dibujar_punto_seleccionado(surface, seleccionado, juego)
+    dibujar_hints(
+        surface, seleccionado, juego.movimientos_disponibles(), juego
+    )
+    dibujar_fichas(surface, juego, f20)
+    dibujar_barra(surface, juego, f20)
+
+
 def iniciar_ui(ancho: int = ANCHO, alto: int = ALTO) -> None:
     """Función principal que inicia la interfaz gráfica del juego."""
     pygame.init()
@@ -888,17 +839,7 @@ def iniciar_ui(ancho: int = ANCHO, alto: int = ALTO) -> None:
                     if nuevo_sel is not None or txt:
                         seleccionado = nuevo_sel
 
-        screen.fill(BG_COLOR)
-        _dibujar_hud(screen, juego, ultimo_txt, f24, f16)
-        draw_bearing_off_bar(screen, juego, f20)
-        dibujar_marco_y_labels(screen, f20)
-        dibujar_triangulos(screen)
-        dibujar_punto_seleccionado(screen, seleccionado, juego)
-        dibujar_hints(
-            screen, seleccionado, juego.movimientos_disponibles(), juego
-        )
-        dibujar_fichas(screen, juego, f20)
-        dibujar_barra(screen, juego, f20)
+        dibujar_juego(screen, juego, (f24, f20, f16), seleccionado, ultimo_txt)
 
         if mostrar_ayuda_flag:
             mostrar_ayuda(screen, f18)
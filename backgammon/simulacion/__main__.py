@@ -0,0 +1,42 @@
+"""Línea de comandos del simulador: python -m backgammon.simulacion --partidas 1000."""
+import argparse
+from backgammon.ia.estrategias import ESTRATEGIAS
+from backgammon.simulacion.autojuego import ejecutar, MAX_TURNOS
+
+
+def main(argv=None):
+    """Corre una simulación entre dos estrategias e imprime resultados y rendimiento."""
+    parser = argparse.ArgumentParser(description="Partidas de backgammon sin interfaz.")
+    parser.add_argument("--partidas", type=int, default=100)
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="1 para jugar en este proceso; por defecto todos los núcleos")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--max-turnos", type=int, default=MAX_TURNOS)
+    parser.add_argument("--estrategias", nargs=2, default=["aleatoria", "aleatoria"],
+                        choices=sorted(ESTRATEGIAS))
+    parser.add_argument("--detalle", action="store_true",
+                        help="imprime cada partida al terminar")
+    args = parser.parse_args(argv)
+
+    estrategias = [ESTRATEGIAS[nombre]() for nombre in args.estrategias]
+
+    def mostrar(resultado):
+        print(f"partida {resultado.indice}: ganador={resultado.ganador} "
+              f"turnos={resultado.turnos} puntos={resultado.puntos}")
+
+    resumen = ejecutar(
+        args.partidas, estrategias, args.semilla, args.procesos, args.max_turnos,
+        al_terminar=mostrar if args.detalle else None,
+    )
+    print(f"{resumen['partidas']} partidas en {resumen['segundos']:.2f} s "
+          f"({resumen['partidas_por_segundo']:.1f} partidas/s)")
+    for i, nombre in enumerate(args.estrategias):
+        print(f"  [{i}] {nombre}: {resumen['victorias'][i]} victorias, "
+              f"{resumen['gammons'][i]} gammons, {resumen['backgammons'][i]} backgammons")
+    if resumen["sin_terminar"]:
+        print(f"  {resumen['sin_terminar']} partidas alcanzaron el tope de turnos")
+    return resumen
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Partidas completas sin interfaz entre dos estrategias, en uno o varios procesos.
+
+Cada partida usa sus propios dados derivados de la semilla maestra y del índice
+de la partida (`semilla_derivada`), así que el resultado de la partida i es el
+mismo sin importar cuántos procesos se usen. En las partidas impares las
+estrategias cambian de asiento para que ninguna salga siempre primero.
+"""
+import os
+import random
+import time
+from multiprocessing import Pool
+from typing import NamedTuple
+from backgammon.core.dados import Dados, semilla_derivada
+from backgammon.core.juego import Juego
+from backgammon.core.jugador import crear_jugadores
+from backgammon.core.perspectiva import lado_de
+from backgammon.core.tablero_compacto import TableroCompacto
+
+MAX_TURNOS = 2000
+BLOQUE_DADOS = 512
+
+
+class ResultadoPartida(NamedTuple):
+    """Resultado de una partida simulada.
+
+    'ganador' es el índice (0 o 1) de la estrategia ganadora en la lista pasada
+    al simulador, o None si se alcanzó el tope de turnos. 'puntos' vale 1, 2
+    (gammon) o 3 (backgammon), y 0 sin ganador.
+    """
+    indice: int
+    ganador: int | None
+    turnos: int
+    puntos: int
+
+
+def jugar_desde(indice: int, estrategias, semilla: int = 0, celdas=None, lado: int = 0,
+                max_turnos: int = MAX_TURNOS, tiradas=None, antes_de_tirar=None,
+                nombres=("J1", "J2")) -> tuple[Juego, int]:
+    """Juega la partida 'indice' desde una posición hasta el final o el tope de turnos.
+
+    Es el bucle de turnos que comparten el simulador, los rollouts y el
+    autoentrenamiento: arma el `Juego` sobre un TableroCompacto, deriva los
+    dados y el rng de las estrategias de (semilla, indice) y pasa el turno
+    aunque no haya jugadas legales.
+
+    Recibe:
+        indice (int): número de partida; define los dados y el rng de las estrategias.
+        estrategias (Sequence): estrategia de cada lado (0 = J1, 1 = J2).
+        semilla (int): semilla maestra.
+        celdas (Sequence[int] | None): posición inicial en el formato de
+            `celdas()`; None usa la posición inicial estándar.
+        lado (int): lado que tira primero.
+        max_turnos (int): tope de turnos antes de abandonar la partida.
+        tiradas (Callable[[int], Sequence[int] | None] | None): dados fijos del
+            turno t (None en ese turno, o sin 'tiradas', tira los dados).
+        antes_de_tirar (Callable[[Juego], None] | None): se llama al comienzo
+            de cada turno, con la posición antes de los dados.
+        nombres (Sequence[str]): nombres de J1 y J2.
+    Devuelve:
+        tuple[Juego, int]: el juego en su posición final y los turnos jugados.
+    Lanza:
+        RuntimeError: si una estrategia devuelve una jugada ilegal.
+    """
+    j1, j2 = crear_jugadores(nombres)
+    if celdas is None:
+        tablero = TableroCompacto()
+        tablero.posicion_inicial_estandar(j1.id, j2.id)
+    else:
+        tablero = TableroCompacto.desde_celdas(celdas, j1.id, j2.id)
+    dados = Dados(semilla_derivada(semilla, indice, 0), bloque=BLOQUE_DADOS)
+    rng = random.Random(int(semilla_derivada(semilla, indice, 1).generate_state(1)[0]))
+    juego = Juego(j1, j2, indice_inicial=lado, tablero=tablero, dados=dados)
+
+    turnos = 0
+    while not juego.termino() and turnos < max_turnos:
+        if antes_de_tirar is not None:
+            antes_de_tirar(juego)
+        movimientos = tiradas(turnos) if tiradas is not None else None
+        if movimientos is None:
+            juego.tirar()
+        else:
+            juego.fijar_movimientos(movimientos)
+        jugadas = juego.jugadas_legales()
+        if jugadas:
+            jugada = estrategias[juego.lado_actual()].elegir_jugada(juego, jugadas, rng)
+            for desde, hasta in jugada:
+                if not juego.aplicar_movimiento(desde, hasta):
+                    raise RuntimeError(
+                        f"partida {indice}: jugada ilegal {jugada} ({juego.ultimo_error()})"
+                    )
+        turnos += 1
+        if not juego.termino():
+            juego.cambiar_turno()
+    return juego, turnos
+
+
+def jugar_partida(indice: int, estrategias, semilla: int = 0,
+                  max_turnos: int = MAX_TURNOS) -> ResultadoPartida:
+    """Juega una partida completa y devuelve su resultado.
+
+    Recibe:
+        indice (int): número de partida; define dados, rng de las estrategias y asientos.
+        estrategias (Sequence): dos estrategias (ver `backgammon.ia.estrategias`).
+        semilla (int): semilla maestra de la simulación.
+        max_turnos (int): tope de turnos antes de abandonar la partida.
+    Devuelve:
+        ResultadoPartida
+    """
+    asientos = (0, 1) if indice % 2 == 0 else (1, 0)
+    nombres = [getattr(estrategias[a], "nombre", str(a)) for a in asientos]
+    juego, turnos = jugar_desde(
+        indice, [estrategias[a] for a in asientos], semilla,
+        max_turnos=max_turnos, nombres=nombres,
+    )
+    ganador = juego.ganador()
+    if ganador is None:
+        return ResultadoPartida(indice, None, turnos, 0)
+    return ResultadoPartida(
+        indice, asientos[lado_de(ganador.id)], turnos, juego.puntos_victoria()
+    )
+
+
+# Estrategias, semilla y tope de turnos que `simular` deja en cada trabajador.
+_CONFIG = {}
+
+
+def _inicializar_proceso(estrategias, semilla, max_turnos):
+    """Guarda la configuración de la simulación en el proceso trabajador."""
+    _CONFIG["args"] = (estrategias, semilla, max_turnos)
+
+
+def _jugar_en_proceso(indice):
+    """Juega la partida 'indice' con la configuración del proceso."""
+    return jugar_partida(indice, *_CONFIG["args"])
+
+
+def simular(partidas: int, estrategias, semilla: int = 0, procesos: int | None = None,
+            max_turnos: int = MAX_TURNOS, inicio: int = 0):
+    """Juega 'partidas' partidas y devuelve los resultados a medida que terminan.
+
+    Recibe:
+        partidas (int): cantidad de partidas.
+        estrategias (Sequence): dos estrategias serializables.
+        semilla (int): semilla maestra.
+        procesos (int | None): procesos del pool; 1 juega en el proceso actual y
+            None usa todos los núcleos.
+        max_turnos (int): tope de turnos por partida.
+        inicio (int): índice de la primera partida (para repetir un rango).
+    Devuelve:
+        Iterator[ResultadoPartida]: en orden de finalización (no de índice).
+    """
+    indices = range(inicio, inicio + partidas)
+    if procesos == 1:
+        for indice in indices:
+            yield jugar_partida(indice, estrategias, semilla, max_turnos)
+        return
+
+    procesos = procesos or os.cpu_count() or 1
+    # Lotes chicos: reparten bien la carga y mantienen el flujo de resultados.
+    lote = max(1, partidas // (procesos * 16))
+    with Pool(procesos, _inicializar_proceso, (estrategias, semilla, max_turnos)) as pool:
+        yield from pool.imap_unordered(_jugar_en_proceso, indices, chunksize=lote)
+
+
+def resumir(resultados, segundos: float) -> dict:
+    """Agrega una lista de resultados en victorias, gammons y partidas por segundo."""
+    resumen = {
+        "partidas": len(resultados),
+        "victorias": [0, 0],
+        "gammons": [0, 0],
+        "backgammons": [0, 0],
+        "sin_terminar": 0,
+        "turnos_promedio": 0.0,
+        "segundos": segundos,
+        "partidas_por_segundo": len(resultados) / segundos if segundos > 0 else 0.0,
+    }
+    for resultado in resultados:
+        if resultado.ganador is None:
+            resumen["sin_terminar"] += 1
+            continue
+        resumen["victorias"][resultado.ganador] += 1
+        if resultado.puntos == 2:
+            resumen["gammons"][resultado.ganador] += 1
+        elif resultado.puntos == 3:
+            resumen["backgammons"][resultado.ganador] += 1
+    if resultados:
+        resumen["turnos_promedio"] = sum(r.turnos for r in resultados) / len(resultados)
+    return resumen
+
+
+def ejecutar(partidas: int, estrategias, semilla: int = 0, procesos: int | None = None,
+             max_turnos: int = MAX_TURNOS, al_terminar=None) -> dict:
+    """Corre la simulación completa, llamando a 'al_terminar' con cada resultado.
+
+    Devuelve el resumen de `resumir` con la duración total medida.
+    """
+    inicio = time.perf_counter()
+    resultados = []
+    for resultado in simular(partidas, estrategias, semilla, procesos, max_turnos):
+        resultados.append(resultado)
+        if al_terminar is not None:
+            al_terminar(resultado)
+    return resumir(resultados, time.perf_counter() - inicio)
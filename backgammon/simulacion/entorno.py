@@ -0,0 +1,215 @@
+"""Entorno de aprendizaje por refuerzo sobre `Juego`, con la API reset/step de Gymnasium.
+
+`EntornoJuego` no depende de Gymnasium: sigue sus firmas (`reset(seed)` devuelve
+(observación, info) y `step(accion)` devuelve (observación, recompensa,
+terminada, truncada, info)) para poder usarlo en los bucles de entrenamiento
+habituales sin adaptadores.
+
+- Observación: una fila de `codificacion` (ANCHO int8) vista desde el lado que
+  mueve, igual que en `EntornoVectorizado`; la columna del lado vale 0.
+- Acción: índice en `jugadas`, la lista de `Juego.jugadas_legales()` de la tirada.
+  `candidatas()` codifica en lote la posición que deja cada una, para agentes
+  que eligen evaluando las posiciones resultantes.
+- Recompensa: los puntos de la partida (1, 2 por gammon o 3 por backgammon)
+  cuando termina. Sin 'oponente' el agente juega los dos lados y la recompensa
+  es del lado que acaba de mover; con un 'oponente' (una estrategia de
+  `ia.estrategias`) el agente es J1, el oponente juega sus turnos dentro de
+  `step` y una derrota da los puntos en negativo.
+
+Los turnos sin jugadas legales se pasan solos. Sin 'render_mode' no se importa
+Pygame; con "rgb_array" `render()` devuelve el cuadro como arreglo (alto,
+ancho, 3) y con "human" se dibuja en una ventana en cada paso, usando las
+funciones de dibujo de `pygame_ui`.
+"""
+import os
+import random
+import numpy as np
+from backgammon.core.codificacion import ANCHO, COLUMNA_LADO, codificar_jugadas, espejar_filas
+from backgammon.core.dados import Dados, semilla_derivada
+from backgammon.core.juego import Juego
+from backgammon.core.jugador import crear_jugadores
+from backgammon.core.perspectiva import celdas_canonicas
+from backgammon.core.tablero_compacto import CELDAS, TableroCompacto
+from backgammon.simulacion.autojuego import BLOQUE_DADOS, MAX_TURNOS
+
+MODOS_RENDER = (None, "rgb_array", "human")
+
+
+class EntornoJuego:
+    """Una partida de backgammon con reset/step, observaciones NumPy y acciones por índice."""
+
+    def __init__(self, oponente=None, max_turnos: int = MAX_TURNOS, render_mode: str | None = None):
+        """Recibe la estrategia rival, el tope de turnos y el modo de render.
+
+        Con 'oponente' None el agente juega los dos lados.
+        """
+        if render_mode not in MODOS_RENDER:
+            raise ValueError(f"render_mode debe ser uno de {MODOS_RENDER}")
+        self.oponente = oponente
+        self.max_turnos = max_turnos
+        self.render_mode = render_mode
+        self.__juego__ = Juego(*crear_jugadores(["agente", "rival"]), tablero=TableroCompacto(),
+                               dados=Dados(bloque=BLOQUE_DADOS))
+        self.__rng__ = random.Random()
+        self.__jugadas__ = []
+        self.__turnos__ = 0
+        self.__pygame__ = None
+
+    @property
+    def juego(self) -> Juego:
+        """Devuelve el Juego subyacente (para consultas; no modificarlo entre pasos)."""
+        return self.__juego__
+
+    @property
+    def jugadas(self) -> list[tuple]:
+        """Jugadas legales de la tirada actual; la acción es un índice en esta lista."""
+        return self.__jugadas__
+
+    @property
+    def turnos(self) -> int:
+        """Turnos jugados (incluidos los pasados) desde el último reset."""
+        return self.__turnos__
+
+    def reset(self, seed=None, options=None) -> tuple[np.ndarray, dict]:
+        """Reinicia la partida y tira los dados del primer turno.
+
+        Recibe:
+            seed (int | None): semilla de los dados y del oponente; con None
+                siguen los flujos actuales.
+            options: ignorado (compatibilidad con Gymnasium).
+        Devuelve:
+            tuple: (observación, info).
+        """
+        if seed is not None:
+            # Flujos independientes para los dados y para el oponente, como en autojuego.
+            self.__juego__.usar_semilla(semilla_derivada(seed, 0))
+            self.__rng__.seed(int(semilla_derivada(seed, 1).generate_state(1)[0]))
+        self.__juego__.reiniciar()
+        self.__turnos__ = 0
+        self._empezar_turno()
+        if self.render_mode == "human":
+            self.render()
+        return self.observacion(), self._info()
+
+    def step(self, accion: int) -> tuple[np.ndarray, float, bool, bool, dict]:
+        """Juega la jugada 'accion' de `jugadas` y avanza hasta el próximo turno del agente.
+
+        Recibe:
+            accion (int): índice en `jugadas` (se ignora si la lista está vacía).
+        Devuelve:
+            tuple: (observación, recompensa, terminada, truncada, info).
+        Lanza:
+            IndexError: si 'accion' no es un índice de `jugadas`.
+        """
+        juego = self.__juego__
+        if self.__jugadas__:
+            self._jugar(self.__jugadas__[accion])
+        recompensa = self._fin_de_turno()
+        if recompensa is None and self.oponente is not None:
+            while (recompensa is None and juego.lado_actual() == 1
+                   and self.__turnos__ < self.max_turnos):
+                self._jugar(self.oponente.elegir_jugada(juego, self.__jugadas__, self.__rng__))
+                recompensa = self._fin_de_turno()
+            recompensa = None if recompensa is None else -recompensa
+        terminada = recompensa is not None
+        truncada = not terminada and self.__turnos__ >= self.max_turnos
+        if self.render_mode == "human":
+            self.render()
+        return self.observacion(), float(recompensa or 0), terminada, truncada, self._info()
+
+    def _jugar(self, jugada):
+        """Aplica una jugada de la lista legal al Juego."""
+        for desde, hasta in jugada:
+            if not self.__juego__.aplicar_movimiento(desde, hasta):
+                raise RuntimeError(f"jugada ilegal {jugada} ({self.__juego__.ultimo_error()})")
+
+    def _fin_de_turno(self) -> int | None:
+        """Cierra el turno: devuelve los puntos si la partida terminó, si no pasa al siguiente."""
+        self.__turnos__ += 1
+        if self.__juego__.termino():
+            self.__jugadas__ = []
+            return self.__juego__.puntos_victoria()
+        self.__juego__.cambiar_turno()
+        self._empezar_turno()
+        return None
+
+    def _empezar_turno(self):
+        """Tira los dados y pasa los turnos sin jugadas hasta que alguien pueda mover."""
+        juego = self.__juego__
+        juego.tirar()
+        self.__jugadas__ = juego.jugadas_legales()
+        while not self.__jugadas__ and self.__turnos__ < self.max_turnos:
+            self.__turnos__ += 1
+            juego.cambiar_turno()
+            juego.tirar()
+            self.__jugadas__ = juego.jugadas_legales()
+
+    def observacion(self) -> np.ndarray:
+        """Fila (ANCHO,) int8 de la posición vista desde el lado al turno (ver el módulo)."""
+        juego = self.__juego__
+        fila = np.empty(ANCHO, dtype=np.int8)
+        fila[:CELDAS] = celdas_canonicas(juego.tablero.celdas(), juego.lado_actual())
+        fila[COLUMNA_LADO] = 0
+        return fila
+
+    def candidatas(self) -> np.ndarray:
+        """Posiciones que deja cada jugada de `jugadas`, matriz (len(jugadas), ANCHO).
+
+        Están vistas desde el lado al turno, como la observación; la columna del
+        lado vale 1 porque después de la jugada mueve el rival.
+        """
+        juego = self.__juego__
+        lado = juego.lado_actual()
+        filas = codificar_jugadas(juego.tablero.celdas(), lado, self.__jugadas__)
+        return espejar_filas(filas) if lado == 1 else filas
+
+    def _info(self) -> dict:
+        """Datos auxiliares del paso: lado al turno, dados, cantidad de jugadas y turnos."""
+        juego = self.__juego__
+        return {
+            "lado": juego.lado_actual(),
+            "dados": juego.movimientos_disponibles(),
+            "acciones": len(self.__jugadas__),
+            "turnos": self.__turnos__,
+        }
+
+    def render(self) -> np.ndarray | None:
+        """Dibuja la partida con `pygame_ui.dibujar_juego`.
+
+        Devuelve:
+            np.ndarray | None: el cuadro (alto, ancho, 3) en modo "rgb_array";
+                None en modo "human" o sin modo de render.
+        """
+        if self.render_mode is None:
+            return None
+        pygame, pygame_ui, superficie, fuentes = self._pygame()
+        pygame_ui.dibujar_juego(superficie, self.__juego__, fuentes)
+        if self.render_mode == "human":
+            pygame.event.pump()
+            pygame.display.flip()
+            return None
+        return np.transpose(pygame.surfarray.array3d(superficie), (1, 0, 2))
+
+    def _pygame(self):
+        """Inicializa Pygame la primera vez que se dibuja (con ventana sólo en modo "human")."""
+        if self.__pygame__ is None:
+            if self.render_mode != "human":
+                os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            import pygame  # pylint: disable=import-outside-toplevel
+            from backgammon.pygame import pygame_ui  # pylint: disable=import-outside-toplevel
+            pygame.init()
+            tamanio = (pygame_ui.ANCHO, pygame_ui.ALTO)
+            if self.render_mode == "human":
+                superficie = pygame.display.set_mode(tamanio)
+                pygame.display.set_caption("Backgammon — entorno")
+            else:
+                superficie = pygame.Surface(tamanio)
+            fuentes = tuple(pygame.font.Font(None, tam) for tam in (24, 20, 16))
+            self.__pygame__ = (pygame, pygame_ui, superficie, fuentes)
+        return self.__pygame__
+
+    def close(self):
+        """Cierra Pygame si se usó para dibujar."""
+        if self.__pygame__ is not None:
+            self.__pygame__[0].quit()
+            self.__pygame__ = None
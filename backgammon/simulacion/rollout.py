@@ -0,0 +1,170 @@
+"""Rollouts Monte Carlo: valor de una posición jugándola muchas veces hasta el final.
+
+Cada rollout copia la posición y la juega con la misma estrategia para los dos
+lados. Los dados de los primeros 'turnos_estratificados' turnos no son al
+azar: el rollout i usa en el turno t la tirada TIRADAS[(i // 36**t) % 36], así
+que cada bloque de 36 rollouts ve cada primera tirada exactamente una vez (y
+cada bloque de 1296 cada par de primeras tiradas). Eso elimina la varianza que
+aportan las primeras tiradas, que son las que más pesan en el resultado. El
+resto de los dados sale de `semilla_derivada(semilla, i)`, como en el
+simulador, así que el resultado no depende de la cantidad de procesos.
+
+Con 'max_turnos' el rollout se corta después de esa cantidad de turnos y la
+posición se puntúa con el evaluador (rollout truncado).
+"""
+import os
+import time
+from multiprocessing import Pool
+from statistics import NormalDist
+from typing import NamedTuple
+from backgammon.core.dados import TIRADAS
+from backgammon.core.perspectiva import lado_de
+from backgammon.ia.evaluacion import evaluar_heuristica
+from backgammon.simulacion.autojuego import MAX_TURNOS, jugar_desde
+
+# Rollouts por estrato: uno por cada una de las 36 tiradas.
+ESTRATO = len(TIRADAS)
+
+
+class ResultadoRollout(NamedTuple):
+    """Resultado de `rollout`, desde el punto de vista del jugador que va a tirar.
+
+    'equidad' es el promedio de puntos (+1/+2/+3 ganando, negativo perdiendo, o
+    el valor del evaluador en los truncados), 'error' su error estándar e
+    'intervalo' el intervalo de confianza pedido. 'truncados' cuenta los
+    rollouts que se puntuaron con el evaluador en lugar de terminar.
+    """
+    equidad: float
+    error: float
+    intervalo: tuple[float, float]
+    partidas: int
+    truncados: int
+    segundos: float
+
+
+def jugar_rollout(indice: int, celdas, lado: int, estrategia, semilla: int = 0,
+                  turnos_estratificados: int = 2, max_turnos: int | None = None,
+                  evaluador=evaluar_heuristica) -> tuple[float, bool]:
+    """Juega un rollout desde la posición y devuelve (valor, truncado).
+
+    Recibe:
+        indice (int): número de rollout; define las tiradas estratificadas y los dados.
+        celdas (Sequence[int]): posición en el formato de `celdas()`.
+        lado (int): lado que va a tirar (0 = J1, 1 = J2).
+        estrategia: estrategia que juega por los dos lados.
+        semilla (int): semilla maestra.
+        turnos_estratificados (int): turnos iniciales con tiradas estratificadas.
+        max_turnos (int | None): turnos antes de puntuar con el evaluador; None
+            juega hasta el final (con el tope MAX_TURNOS del simulador).
+        evaluador (Callable[[Juego], float]): puntúa las posiciones truncadas.
+    Devuelve:
+        tuple[float, bool]: valor para el lado que tiraba y si se truncó.
+    """
+    def tiradas(turno):
+        """Tirada estratificada de los primeros turnos; None tira los dados."""
+        if turno < turnos_estratificados:
+            return TIRADAS[(indice // ESTRATO ** turno) % ESTRATO][2]
+        return None
+
+    tope = MAX_TURNOS if max_turnos is None else max_turnos
+    juego, _ = jugar_desde(indice, (estrategia, estrategia), semilla, celdas, lado,
+                           max_turnos=tope, tiradas=tiradas)
+    if juego.termino():
+        puntos = float(juego.puntos_victoria())
+        return (puntos if lado_de(juego.ganador().id) == lado else -puntos), False
+    valor = evaluador(juego)
+    return (valor if juego.lado_actual() == lado else -valor), True
+
+
+# Posición y parámetros que `rollout` deja en cada trabajador del pool.
+_CONFIG = {}
+
+
+def _inicializar_proceso(*args):
+    """Guarda la posición y la configuración del rollout en el proceso trabajador."""
+    _CONFIG["args"] = args
+
+
+def _jugar_en_proceso(indice):
+    """Juega el rollout 'indice' con la configuración del proceso."""
+    return jugar_rollout(indice, *_CONFIG["args"])
+
+
+def _resumir(suma: float, suma_cuadrados: float, partidas: int, truncados: int,
+             z: float, segundos: float) -> ResultadoRollout:
+    """Arma el resultado con la media, el error estándar y el intervalo normal."""
+    media = suma / partidas
+    varianza = max(suma_cuadrados - partidas * media * media, 0.0) / max(partidas - 1, 1)
+    error = (varianza / partidas) ** 0.5
+    return ResultadoRollout(
+        media, error, (media - z * error, media + z * error), partidas, truncados, segundos
+    )
+
+
+def rollout(juego, estrategia, partidas: int = 1296, semilla: int = 0,
+            procesos: int | None = None, turnos_estratificados: int = 2,
+            max_turnos: int | None = None, evaluador=evaluar_heuristica,
+            confianza: float = 0.95, precision: float | None = None,
+            minimo: int = 4 * ESTRATO) -> ResultadoRollout:
+    """Estima el valor de la posición para el jugador que va a tirar.
+
+    Los rollouts se consumen en orden de índice, así que al cortar antes de
+    tiempo se usan los primeros n. El corte temprano sólo se evalúa al cerrar
+    un bloque de 36 rollouts (para que las primeras tiradas queden
+    balanceadas), desde 'minimo' rollouts y cuando la mitad del intervalo de
+    confianza ya es <= 'precision'.
+
+    Recibe:
+        juego (Juego): posición antes de tirar; no se modifica.
+        estrategia: estrategia serializable que juega por los dos lados.
+        partidas (int): cantidad máxima de rollouts.
+        semilla (int): semilla maestra de los dados.
+        procesos (int | None): procesos del pool; 1 juega en el proceso actual y
+            None usa todos los núcleos.
+        turnos_estratificados (int): turnos iniciales con tiradas estratificadas.
+        max_turnos (int | None): turnos por rollout antes de puntuar con el evaluador.
+        evaluador (Callable[[Juego], float]): puntúa los rollouts truncados.
+        confianza (float): nivel del intervalo de confianza (0.95 = 95 %).
+        precision (float | None): mitad del intervalo a alcanzar para cortar antes.
+        minimo (int): rollouts mínimos antes de permitir el corte temprano.
+    Devuelve:
+        ResultadoRollout
+    """
+    if partidas < 1:
+        raise ValueError("se necesita al menos un rollout")
+    inicio = time.perf_counter()
+    z = NormalDist().inv_cdf((1 + confianza) / 2)
+    args = (juego.tablero.celdas(), juego.lado_actual(), estrategia, semilla,
+            turnos_estratificados, max_turnos, evaluador)
+
+    suma = suma_cuadrados = 0.0
+    hechas = truncados = 0
+
+    def consumir(resultados):
+        """Acumula resultados en orden y devuelve True si ya alcanza la precisión."""
+        nonlocal suma, suma_cuadrados, hechas, truncados
+        for valor, truncado in resultados:
+            suma += valor
+            suma_cuadrados += valor * valor
+            hechas += 1
+            truncados += truncado
+            if (
+                precision is not None
+                and hechas >= max(minimo, 2)
+                and hechas % ESTRATO == 0
+                and _resumir(suma, suma_cuadrados, hechas, truncados, z, 0).error * z
+                <= precision
+            ):
+                return True
+        return False
+
+    if procesos == 1:
+        consumir(jugar_rollout(i, *args) for i in range(partidas))
+    else:
+        procesos = procesos or os.cpu_count() or 1
+        lote = max(1, min(ESTRATO, partidas // (procesos * 16)))
+        with Pool(procesos, _inicializar_proceso, args) as pool:
+            # Al salir del with el pool termina los rollouts que sobran.
+            consumir(pool.imap(_jugar_en_proceso, range(partidas), chunksize=lote))
+    return _resumir(suma, suma_cuadrados, hechas, truncados, z,
+                    time.perf_counter() - inicio)
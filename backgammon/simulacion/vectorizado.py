@@ -0,0 +1,187 @@
+"""Entorno vectorizado: N partidas que avanzan juntas, una jugada por partida en cada paso.
+
+Pensado para entrenamiento por refuerzo y simulación masiva: en lugar de mover
+ficha por ficha en N objetos `Juego`, el entorno guarda las N posiciones en una
+matriz de NumPy (formato de `celdas()`), tira los dados de todas con un solo
+`Dados.tirar_lote` y aplica las N jugadas elegidas con `aplicar_movimientos`.
+
+Las posiciones se guardan siempre vistas desde el lado que mueve (ver
+core.perspectiva): después de cada paso el tablero se espeja para el rival.
+Así las observaciones, las jugadas legales y los evaluadores ven una sola
+orientación, y las jugadas legales salen de la caché de jugadas compartida
+para los dos lados. `lados` dice qué jugador está al turno en cada partida y
+`celdas()` devuelve las posiciones en la orientación real del tablero.
+
+Cuando una partida termina (o llega a 'max_turnos') se reinicia sola en el
+mismo paso, como en los entornos vectorizados de Gymnasium; `step` informa el
+resultado en 'recompensas', 'terminadas' y 'truncadas'.
+"""
+from typing import NamedTuple
+import numpy as np
+from backgammon.core.cache_jugadas import CACHE
+from backgammon.core.codificacion import aplicar_movimientos, codificar_lote, espejar_filas
+from backgammon.core.dados import Dados
+from backgammon.core.destinos import PUNTO_DE_ENTRADA
+from backgammon.core.jugadas import generar_jugadas
+from backgammon.core.tablero import FICHAS_POR_JUGADOR
+from backgammon.core.tablero_compacto import BARRA, SALIDA, TableroCompacto
+from backgammon.simulacion.autojuego import BLOQUE_DADOS, MAX_TURNOS
+
+# Pasos máximos de una jugada (dobles).
+PASOS = 4
+
+
+def _posicion_inicial() -> np.ndarray:
+    """Celdas de la posición inicial estándar (simétrica: igual desde los dos lados)."""
+    tablero = TableroCompacto()
+    tablero.posicion_inicial_estandar(1, 2)
+    return np.asarray(tablero.celdas(), dtype=np.int8)
+
+
+POSICION_INICIAL = _posicion_inicial()
+
+
+class ResultadoPaso(NamedTuple):
+    """Resultado de `EntornoVectorizado.step` para las N partidas.
+
+    'recompensas' son los puntos (1, 2 o 3) que ganó el jugador que acaba de
+    mover, o 0 si la partida sigue o se cortó. Las partidas con 'terminadas'
+    o 'truncadas' ya se reiniciaron: 'observaciones' es la posición nueva.
+    """
+    observaciones: np.ndarray
+    recompensas: np.ndarray
+    terminadas: np.ndarray
+    truncadas: np.ndarray
+
+
+def puntos_ganados(filas: np.ndarray) -> np.ndarray:
+    """Puntos del lado 0 en cada fila: 0 si no sacó las 15 fichas, si no 1, 2 o 3.
+
+    Gammon si el rival no sacó ninguna ficha; backgammon si además tiene
+    fichas en la barra o en la casa del ganador (puntos 0..5).
+    """
+    gano = filas[:, SALIDA] == FICHAS_POR_JUGADOR
+    gammon = filas[:, SALIDA + 1] == 0
+    atrapadas = (filas[:, BARRA + 1] > 0) | np.any(filas[:, :6] < 0, axis=1)
+    return gano * (1 + gammon + (gammon & atrapadas))
+
+
+class EntornoVectorizado:
+    """N partidas en paralelo con dados, jugadas legales y pasos en lote."""
+
+    def __init__(self, partidas: int, semilla=None, max_turnos: int = MAX_TURNOS):
+        """Recibe la cantidad de partidas, la semilla de los dados y el tope de turnos."""
+        self.partidas = partidas
+        self.max_turnos = max_turnos
+        self.reset(semilla)
+
+    def reset(self, semilla=None) -> np.ndarray:
+        """Reinicia todas las partidas y tira los dados; devuelve las observaciones."""
+        self.__dados__ = Dados(semilla, bloque=max(BLOQUE_DADOS, self.partidas))
+        self.__filas__ = np.tile(POSICION_INICIAL, (self.partidas, 1))
+        self.__lados__ = np.zeros(self.partidas, dtype=np.int8)
+        self.__turnos__ = np.zeros(self.partidas, dtype=np.int32)
+        self._tirar()
+        return self.observaciones()
+
+    def _tirar(self):
+        """Tira los dados de todas las partidas y descarta las jugadas calculadas."""
+        self.__tirada__ = self.__dados__.tirar_lote(self.partidas)
+        self.__jugadas__ = None
+
+    @property
+    def tiradas(self) -> np.ndarray:
+        """Dados de cada partida en este turno, matriz (N, 2)."""
+        return self.__tirada__.copy()
+
+    @property
+    def lados(self) -> np.ndarray:
+        """Lado al turno en cada partida (0 = J1, 1 = J2)."""
+        return self.__lados__.copy()
+
+    @property
+    def turnos(self) -> np.ndarray:
+        """Turnos jugados en cada partida desde su último reinicio."""
+        return self.__turnos__.copy()
+
+    def observaciones(self) -> np.ndarray:
+        """Filas de `codificacion` (N, ANCHO) vistas desde el lado que mueve.
+
+        La columna del lado vale 0 en todas las filas.
+        """
+        return codificar_lote(self.__filas__, 0)
+
+    def celdas(self) -> np.ndarray:
+        """Posiciones (N, CELDAS) en la orientación real del tablero."""
+        celdas = self.__filas__.copy()
+        j2 = self.__lados__ == 1
+        celdas[j2] = espejar_filas(celdas[j2])
+        return celdas
+
+    def movimientos(self, indice: int) -> tuple[int, ...]:
+        """Dados a jugar en la partida 'indice' (cuatro iguales si es doble)."""
+        d1, d2 = (int(d) for d in self.__tirada__[indice])
+        return (d1,) * 4 if d1 == d2 else (d1, d2)
+
+    def jugadas_legales(self) -> list[list[tuple]]:
+        """Jugadas legales de cada partida, en la orientación del lado que mueve.
+
+        Una lista vacía significa que la partida pierde el turno. Para pasarlas
+        al tablero real de J2 usar `perspectiva.espejar_jugada`.
+        """
+        if self.__jugadas__ is None:
+            self.__jugadas__ = [self._jugadas(i) for i in range(self.partidas)]
+        return self.__jugadas__
+
+    def _jugadas(self, indice: int) -> list[tuple]:
+        """Jugadas de una partida, pasando por la caché de jugadas del proceso."""
+        fila = self.__filas__[indice]
+        movimientos = self.movimientos(indice)
+        return CACHE.obtener(
+            (fila.tobytes(), movimientos, "vectorizado"),
+            lambda: generar_jugadas(fila.tolist(), 0, movimientos, PUNTO_DE_ENTRADA[0]),
+        )
+
+    def step(self, elecciones) -> ResultadoPaso:
+        """Aplica una jugada por partida, pasa el turno y reinicia las terminadas.
+
+        Recibe:
+            elecciones (Sequence[int]): índice en `jugadas_legales()[i]` de cada
+                partida; se ignora en las partidas sin jugadas.
+        Devuelve:
+            ResultadoPaso: observaciones nuevas, puntos del que movió y fin de cada partida.
+        Lanza:
+            ValueError: si 'elecciones' no tiene una entrada por partida o si
+                alguna no es un índice de las jugadas de su partida.
+        """
+        if len(elecciones) != self.partidas:
+            raise ValueError(
+                f"se esperaban {self.partidas} elecciones y llegaron {len(elecciones)}"
+            )
+        movimientos = np.full((self.partidas, PASOS, 2), -1, dtype=np.intp)
+        for i, (jugadas, eleccion) in enumerate(zip(self.jugadas_legales(), elecciones)):
+            if jugadas:
+                if not 0 <= eleccion < len(jugadas):
+                    raise ValueError(
+                        f"la elección {eleccion} de la partida {i} no está entre 0 y "
+                        f"{len(jugadas) - 1}"
+                    )
+                jugada = jugadas[eleccion]
+                movimientos[i, :len(jugada)] = jugada
+        aplicar_movimientos(self.__filas__, movimientos, 0)
+
+        recompensas = puntos_ganados(self.__filas__)
+        terminadas = recompensas > 0
+        self.__turnos__ += 1
+        truncadas = ~terminadas & (self.__turnos__ >= self.max_turnos)
+
+        self.__filas__ = espejar_filas(self.__filas__)
+        self.__lados__ ^= 1
+        reiniciar = terminadas | truncadas
+        self.__filas__[reiniciar] = POSICION_INICIAL
+        self.__lados__[reiniciar] = 0
+        self.__turnos__[reiniciar] = 0
+        self._tirar()
+        return ResultadoPaso(
+            self.observaciones(), recompensas.astype(np.float32), terminadas, truncadas,
+        )
@@ -0,0 +1,122 @@
+"""Tests para el libro de aperturas."""
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from backgammon.ia.aperturas import (
+    TIRADAS_APERTURA, LibroAperturas, calcular, clave_libro, generar, nombre_tirada,
+)
+from backgammon.ia.busqueda import BotExpectiminimax, aplicar_jugada
+from backgammon.core.juego import juego_inicial
+
+
+class PruebasAperturas(unittest.TestCase):
+    """Pruebas del cálculo, el archivo y las consultas del libro."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Genera un libro con búsqueda de 1 ply una sola vez."""
+        cls.carpeta = tempfile.TemporaryDirectory()
+        cls.bot = BotExpectiminimax(profundidad=1)
+        cls.ruta = generar(os.path.join(cls.carpeta.name, "libro.json"), cls.bot)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Borra la carpeta temporal."""
+        cls.carpeta.cleanup()
+
+    def test_nombre_tirada(self):
+        """Verifica los nombres de tiradas completas y None a mitad de turno."""
+        self.assertEqual(len(TIRADAS_APERTURA), 15)
+        self.assertEqual(nombre_tirada([1, 3]), "3-1")
+        self.assertEqual(nombre_tirada([4, 4, 4, 4]), "4-4")
+        self.assertIsNone(nombre_tirada([4, 4, 4]))
+        self.assertIsNone(nombre_tirada([5]))
+        self.assertIsNone(nombre_tirada([]))
+
+    def test_clave_no_depende_de_los_ids(self):
+        """Verifica que la clave sólo dependa de la posición vista desde el lado que mueve."""
+        self.assertEqual(clave_libro(juego_inicial()), clave_libro(juego_inicial()))
+        # La posición inicial es simétrica: los dos lados ven lo mismo.
+        self.assertEqual(clave_libro(juego_inicial(lado=0)), clave_libro(juego_inicial(lado=1)))
+        juego = juego_inicial()
+        juego.fijar_movimientos([6, 5])
+        aplicar_jugada(juego, ((23, 17), (17, 12)))
+        juego.cambiar_turno()
+        self.assertNotEqual(clave_libro(juego), clave_libro(juego_inicial()))
+
+    def test_aperturas_y_respuestas(self):
+        """Verifica que el libro devuelva la jugada de la búsqueda para cada lado."""
+        libro = LibroAperturas(self.ruta)
+        for lado in (0, 1):
+            juego = juego_inicial(lado=lado)
+            for apertura in TIRADAS_APERTURA:
+                juego.fijar_movimientos(apertura)
+                jugada, valor = libro.buscar(juego, juego.jugadas_legales())
+                self.assertEqual((jugada, valor), self._analizar(juego))
+        juego = juego_inicial()
+        juego.fijar_movimientos([6, 5])
+        aplicar_jugada(juego, libro.buscar(juego)[0])
+        juego.cambiar_turno()
+        juego.fijar_movimientos([2, 2, 2, 2])
+        self.assertEqual(libro.buscar(juego), self._analizar(juego))
+        # 15 aperturas y 21 respuestas por cada una, compartidas por los dos lados
+        # (algunas aperturas llegan a la misma posición y comparten las respuestas).
+        self.assertGreater(len(libro), 15 * 15)
+
+    def _analizar(self, juego):
+        """(jugada, valor) de la búsqueda, con el valor redondeado como en el archivo."""
+        jugada, valor = self.bot.analizar(juego)
+        return jugada, round(valor, 4)
+
+    def test_sin_entrada(self):
+        """Verifica las consultas que el libro no responde."""
+        libro = LibroAperturas(self.ruta)
+        juego = juego_inicial()
+        self.assertIsNone(libro.buscar(juego))
+        juego.fijar_movimientos([3])
+        self.assertIsNone(libro.buscar(juego))
+        juego.fijar_movimientos([3, 1])
+        self.assertIsNone(libro.buscar(juego, [((0, 1),)]))
+        with tempfile.TemporaryDirectory() as carpeta:
+            self.assertEqual(len(LibroAperturas(os.path.join(carpeta, "no_existe.json"))), 0)
+            ruta = os.path.join(carpeta, "otro.json")
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump({"version": 0, "entradas": {}}, archivo)
+            with self.assertRaises(ValueError):
+                len(LibroAperturas(ruta))
+
+    def test_sin_respuestas_y_serializacion(self):
+        """Verifica el libro de sólo aperturas y que se serialice sin sus entradas."""
+        entradas = calcular(self.bot, respuestas=False)
+        self.assertEqual(sum(len(tiradas) for tiradas in entradas.values()), 15)
+        libro = LibroAperturas(self.ruta)
+        len(libro)
+        copia = pickle.loads(pickle.dumps(libro))
+        self.assertIsNone(copia.__getstate__()["__entradas__"])
+        self.assertEqual(len(copia), len(libro))
+
+    def test_bot_responde_desde_el_libro(self):
+        """Verifica que el bot use el libro sin buscar y busque fuera de él."""
+        bot = BotExpectiminimax(profundidad=2, libro=LibroAperturas(self.ruta))
+        juego = juego_inicial()
+        juego.fijar_movimientos([4, 2])
+        resultado = bot.buscar(juego)
+        self.assertEqual((resultado.jugada, resultado.valor), self._analizar(juego))
+        self.assertEqual((resultado.profundidad, resultado.nodos), (0, 0))
+        juego.fijar_movimientos([4, 4, 4, 4])
+        self.assertEqual(bot.buscar(juego).profundidad, 2)
+
+    def test_libro_incluido(self):
+        """Verifica que el libro del paquete tenga una jugada legal para cada apertura."""
+        libro = LibroAperturas()
+        for lado in (0, 1):
+            juego = juego_inicial(lado=lado)
+            for apertura in TIRADAS_APERTURA:
+                juego.fijar_movimientos(apertura)
+                self.assertIsNotNone(libro.buscar(juego, juego.jugadas_legales()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests para el simulador de partidas sin interfaz."""
+import unittest
+from unittest import mock
+from backgammon.ia.estrategias import EstrategiaAleatoria, EstrategiaCarrera, ESTRATEGIAS
+from backgammon.simulacion.autojuego import (
+    ResultadoPartida, jugar_desde, jugar_partida, simular, resumir, ejecutar,
+)
+from backgammon.simulacion.__main__ import main
+
+
+class PruebasAutojuego(unittest.TestCase):
+    """Pruebas del simulador de partidas."""
+
+    def setUp(self):
+        """Crea las estrategias usadas en las pruebas."""
+        self.estrategias = [EstrategiaAleatoria(), EstrategiaCarrera()]
+
+    def test_partida_termina_y_es_reproducible(self):
+        """Verifica que la misma partida dé el mismo resultado."""
+        primero = jugar_partida(3, self.estrategias, semilla=11)
+        segundo = jugar_partida(3, self.estrategias, semilla=11)
+        self.assertEqual(primero, segundo)
+        self.assertIn(primero.ganador, (0, 1))
+        self.assertIn(primero.puntos, (1, 2, 3))
+        self.assertGreater(primero.turnos, 0)
+
+    def test_tope_de_turnos(self):
+        """Verifica que una partida cortada no tenga ganador."""
+        resultado = jugar_partida(0, self.estrategias, max_turnos=3)
+        self.assertEqual(resultado, ResultadoPartida(0, None, 3, 0))
+
+    def test_jugar_desde_posicion_y_tiradas(self):
+        """Verifica el lado inicial, las tiradas fijas y el tope al jugar desde una posición."""
+        celdas = [0] * 28
+        celdas[0], celdas[23] = 2, -2
+        celdas[26], celdas[27] = 13, 13
+        estrategias = [EstrategiaAleatoria()] * 2
+        juego, turnos = jugar_desde(0, estrategias, celdas=celdas, lado=1, max_turnos=1,
+                                    tiradas=lambda turno: (6, 5))
+        self.assertEqual(turnos, 1)
+        self.assertEqual(juego.tablero.fichas_salidas(juego.jugadores[1].id), 15)
+        self.assertTrue(juego.termino())
+
+    def test_procesos_no_cambian_resultados(self):
+        """Verifica que repartir entre procesos dé los mismos resultados por índice."""
+        local = sorted(simular(8, self.estrategias, semilla=4, procesos=1))
+        repartido = sorted(simular(8, self.estrategias, semilla=4, procesos=2))
+        self.assertEqual(local, repartido)
+        self.assertEqual([r.indice for r in local], list(range(8)))
+
+    def test_simular_desde_inicio(self):
+        """Verifica que se pueda repetir una partida puntual de un lote."""
+        lote = sorted(simular(5, self.estrategias, semilla=6, procesos=1))
+        (repetida,) = simular(1, self.estrategias, semilla=6, procesos=1, inicio=3)
+        self.assertEqual(repetida, lote[3])
+
+    def test_resumir(self):
+        """Verifica las cuentas del resumen."""
+        resultados = [
+            ResultadoPartida(0, 0, 10, 1),
+            ResultadoPartida(1, 1, 20, 2),
+            ResultadoPartida(2, 1, 30, 3),
+            ResultadoPartida(3, None, 40, 0),
+        ]
+        resumen = resumir(resultados, 2.0)
+        self.assertEqual(resumen["victorias"], [1, 2])
+        self.assertEqual(resumen["gammons"], [0, 1])
+        self.assertEqual(resumen["backgammons"], [0, 1])
+        self.assertEqual(resumen["sin_terminar"], 1)
+        self.assertEqual(resumen["turnos_promedio"], 25)
+        self.assertEqual(resumen["partidas_por_segundo"], 2.0)
+
+    def test_ejecutar_llama_al_terminar(self):
+        """Verifica que cada resultado se informe al terminar."""
+        vistos = []
+        resumen = ejecutar(4, self.estrategias, procesos=1, al_terminar=vistos.append)
+        self.assertEqual(len(vistos), 4)
+        self.assertEqual(resumen["partidas"], 4)
+        self.assertGreater(resumen["partidas_por_segundo"], 0)
+
+    def test_linea_de_comandos(self):
+        """Verifica la entrada por línea de comandos."""
+        self.assertEqual(set(ESTRATEGIAS), {"aleatoria", "carrera", "expectiminimax"})
+        with mock.patch("builtins.print"):
+            resumen = main(["--partidas", "2", "--procesos", "1", "--detalle"])
+        self.assertEqual(resumen["partidas"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests para la base de bearing off de un lado."""
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from backgammon.core.tablero_compacto import TableroCompacto
+from backgammon.ia.bearing_off import (
+    BaseBearingOff, calcular, cantidad_posiciones, generar, indice_posicion,
+    posicion_en_tablero, todas_las_posiciones, MAX_TIRADAS,
+)
+
+
+class PruebasBearingOff(unittest.TestCase):
+    """Pruebas del cálculo, el archivo y las consultas de la base."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Calcula una base chica (hasta 5 fichas) una sola vez."""
+        cls.esperadas, cls.distribucion = calcular(5)
+
+    def test_indices_consecutivos(self):
+        """Verifica que los índices recorran 0..N-1 sin huecos."""
+        posiciones = todas_las_posiciones(4)
+        self.assertEqual(len(posiciones), cantidad_posiciones(4))
+        self.assertEqual(cantidad_posiciones(), 54264)
+        for indice, posicion in enumerate(posiciones):
+            self.assertEqual(indice_posicion(posicion), indice)
+        self.assertEqual(indice_posicion((0,) * 6), 0)
+
+    def test_valores_conocidos(self):
+        """Verifica tiradas esperadas calculables a mano."""
+        def esperadas(posicion):
+            return self.esperadas[indice_posicion(posicion)]
+        self.assertEqual(esperadas((0, 0, 0, 0, 0, 0)), 0.0)
+        self.assertEqual(esperadas((2, 0, 0, 0, 0, 0)), 1.0)
+        # Una ficha a 6 pips no sale con 1-1, 1-2, 1-3, 1-4 ni 2-3 (9/36).
+        self.assertAlmostEqual(esperadas((0, 0, 0, 0, 0, 1)), 1.25)
+        # Cuatro fichas en el punto 1 necesitan un doble o dos tiradas.
+        self.assertAlmostEqual(esperadas((4, 0, 0, 0, 0, 0)), 2 - 6 / 36)
+
+    def test_distribucion_coherente(self):
+        """Verifica que cada distribución sume 1 y su media sean las tiradas esperadas."""
+        self.assertTrue(np.allclose(self.distribucion.sum(axis=1), 1.0))
+        media = self.distribucion @ np.arange(MAX_TIRADAS)
+        self.assertTrue(np.allclose(media, self.esperadas))
+
+    def test_base_chica_es_prefijo(self):
+        """Verifica que la base con menos fichas coincida con el comienzo de la grande."""
+        esperadas, distribucion = calcular(3)
+        self.assertTrue(np.allclose(esperadas, self.esperadas[:len(esperadas)]))
+        self.assertTrue(np.allclose(distribucion, self.distribucion[:len(esperadas)]))
+
+    def test_archivo_mapeado(self):
+        """Verifica generar, abrir con mmap, consultar y serializar la base."""
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = generar(os.path.join(carpeta, "datos", "base.bin"), max_fichas=5)
+            self.assertEqual(
+                os.path.getsize(ruta), 24 + 68 * cantidad_posiciones(5)
+            )
+            base = BaseBearingOff(ruta)
+            posicion = (1, 0, 2, 0, 1, 1)
+            indice = indice_posicion(posicion)
+            self.assertAlmostEqual(
+                base.tiradas_esperadas(posicion), self.esperadas[indice], places=5
+            )
+            self.assertTrue(
+                np.allclose(base.distribucion(posicion), self.distribucion[indice], atol=1e-4)
+            )
+            self.assertAlmostEqual(
+                base.probabilidad_ganar((1, 0, 0, 0, 0, 0), posicion), 1.0, places=4
+            )
+            self.assertAlmostEqual(
+                base.probabilidad_ganar((0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0)), 0.75, places=3
+            )
+            with self.assertRaises(ValueError):
+                base.tiradas_esperadas((6, 0, 0, 0, 0, 0))
+            copia = pickle.loads(pickle.dumps(base))
+            self.assertAlmostEqual(
+                copia.tiradas_esperadas(posicion), base.tiradas_esperadas(posicion)
+            )
+            base.cerrar()
+            copia.cerrar()
+
+    def test_archivo_invalido_o_faltante(self):
+        """Verifica los errores con archivos que no son una base."""
+        with tempfile.TemporaryDirectory() as carpeta:
+            faltante = BaseBearingOff(os.path.join(carpeta, "no_existe.bin"))
+            with self.assertRaises(FileNotFoundError):
+                faltante.tiradas_esperadas((1, 0, 0, 0, 0, 0))
+            ruta = os.path.join(carpeta, "otro.bin")
+            with open(ruta, "wb") as archivo:
+                archivo.write(b"\0" * 64)
+            with self.assertRaises(ValueError):
+                BaseBearingOff(ruta).tiradas_esperadas((1, 0, 0, 0, 0, 0))
+
+    def test_posicion_en_tablero(self):
+        """Verifica la posición de cada lado contada desde la salida."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 0)
+        tablero.colocar_ficha(1, 5)
+        tablero.colocar_ficha(1, 5)
+        tablero.colocar_ficha(2, 23)
+        tablero.colocar_ficha(2, 20)
+        self.assertEqual(posicion_en_tablero(tablero, 1), (1, 0, 0, 0, 0, 2))
+        self.assertEqual(posicion_en_tablero(tablero, 2), (1, 0, 0, 1, 0, 0))
+        tablero.colocar_ficha(2, 10)
+        self.assertIsNone(posicion_en_tablero(tablero, 2))
+        tablero.enviar_a_barra(1)
+        self.assertIsNone(posicion_en_tablero(tablero, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
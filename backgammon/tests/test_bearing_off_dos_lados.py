@@ -0,0 +1,151 @@
+"""Tests para la tabla exacta de bearing off de dos lados."""
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+from functools import lru_cache
+import numpy as np
+from backgammon.core.dados import TIRADAS_DISTINTAS
+from backgammon.core.juego import Juego, juego_inicial
+from backgammon.core.jugador import crear_jugadores
+from backgammon.core.tablero_compacto import CELDAS, SALIDA, TableroCompacto
+from backgammon.ia.bearing_off import ESCALA, todas_las_posiciones
+from backgammon.ia.bearing_off_dos_lados import (
+    TablaBearingOff, _finales, calcular, generar,
+)
+from backgammon.ia.busqueda import BotExpectiminimax, aplicar_jugada, deshacer_jugada
+
+
+@lru_cache(maxsize=None)
+def probabilidad_referencia(al_turno, rival) -> float:
+    """Recursión directa sobre las posiciones, como referencia para las pruebas."""
+    if not any(al_turno):
+        return 1.0
+    if not any(rival):
+        return 0.0
+    return 1.0 - sum(
+        probabilidad * min(probabilidad_referencia(rival, f) for f in _finales(al_turno, m))
+        for m, probabilidad in TIRADAS_DISTINTAS
+    )
+
+
+def juego_sin_contacto(propia, rival) -> Juego:
+    """Juego con J1 al turno en 'propia' y J2 en 'rival' (posiciones de bearing off)."""
+    j1, j2 = crear_jugadores(["A", "B"])
+    celdas = [0] * CELDAS
+    for i, fichas in enumerate(propia):
+        celdas[i] = fichas
+    for i, fichas in enumerate(rival):
+        celdas[23 - i] = -fichas
+    celdas[SALIDA] = 15 - sum(propia)
+    celdas[SALIDA + 1] = 15 - sum(rival)
+    return Juego(j1, j2, tablero=TableroCompacto.desde_celdas(celdas, j1.id, j2.id))
+
+
+class PruebasBearingOffDosLados(unittest.TestCase):
+    """Pruebas del cálculo, el archivo y el uso de la tabla en la búsqueda."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Genera una tabla chica (hasta 3 fichas por lado) una sola vez."""
+        cls.carpeta = tempfile.TemporaryDirectory()
+        cls.ruta = generar(os.path.join(cls.carpeta.name, "tabla.bin"), 3, procesos=1)
+        cls.tabla = TablaBearingOff(cls.ruta)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Cierra el mapeo y borra la carpeta temporal."""
+        cls.tabla.cerrar()
+        cls.carpeta.cleanup()
+
+    def test_coincide_con_la_recursion(self):
+        """Verifica los pares de hasta 2 fichas contra la recursión directa."""
+        for propia in todas_las_posiciones(2):
+            for rival in todas_las_posiciones(2):
+                if any(propia) and any(rival):
+                    self.assertAlmostEqual(
+                        self.tabla.probabilidad_ganar(propia, rival),
+                        probabilidad_referencia(propia, rival), delta=1 / ESCALA,
+                    )
+
+    def test_valores_conocidos(self):
+        """Verifica valores calculables a mano y los bordes de la tabla."""
+        seis_pips, un_pip = (0, 0, 0, 0, 0, 1), (1, 0, 0, 0, 0, 0)
+        self.assertAlmostEqual(self.tabla.probabilidad_ganar(seis_pips, un_pip), 0.75, places=4)
+        self.assertEqual(self.tabla.probabilidad_ganar(un_pip, seis_pips), 1.0)
+        self.assertEqual(self.tabla.probabilidad_ganar((0,) * 6, un_pip), 1.0)
+        self.assertEqual(self.tabla.probabilidad_ganar(un_pip, (0,) * 6), 0.0)
+
+    def test_en_paralelo_da_lo_mismo(self):
+        """Verifica que el pool de procesos calcule la misma matriz que un proceso."""
+        with tempfile.TemporaryDirectory() as carpeta:
+            serie = np.array(calcular(os.path.join(carpeta, "a.f32"), 2, procesos=1))
+            paralelo = np.array(calcular(os.path.join(carpeta, "b.f32"), 2, procesos=2))
+        self.assertTrue(np.array_equal(serie, paralelo))
+
+    def test_archivo(self):
+        """Verifica tamaño, errores y serialización de la tabla."""
+        self.assertEqual(os.path.getsize(self.ruta), 20 + 2 * 84 * 84)
+        with self.assertRaises(ValueError):
+            self.tabla.probabilidad_ganar((4, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0))
+        self.assertFalse(self.tabla.cubre((4, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0)))
+        copia = pickle.loads(pickle.dumps(self.tabla))
+        self.assertEqual(
+            copia.probabilidad_ganar((1, 1, 0, 0, 0, 0), (0, 2, 0, 0, 0, 0)),
+            self.tabla.probabilidad_ganar((1, 1, 0, 0, 0, 0), (0, 2, 0, 0, 0, 0)),
+        )
+        with tempfile.TemporaryDirectory() as carpeta:
+            faltante = TablaBearingOff(os.path.join(carpeta, "no_existe.bin"))
+            with self.assertRaises(FileNotFoundError):
+                faltante.probabilidad_ganar((1, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0))
+            ruta = os.path.join(carpeta, "otro.bin")
+            with open(ruta, "wb") as archivo:
+                archivo.write(b"\0" * 64)
+            with self.assertRaises(ValueError):
+                TablaBearingOff(ruta).cubre((0,) * 6, (0,) * 6)
+
+    def test_valor_del_juego(self):
+        """Verifica el valor para el jugador al turno y None con contacto o fuera de la tabla."""
+        propia, rival = (0, 1, 0, 1, 0, 0), (1, 0, 1, 0, 0, 0)
+        juego = juego_sin_contacto(propia, rival)
+        esperado = 2 * self.tabla.probabilidad_ganar(propia, rival) - 1
+        self.assertAlmostEqual(self.tabla.valor(juego), esperado)
+        juego.cambiar_turno()
+        esperado = 2 * self.tabla.probabilidad_ganar(rival, propia) - 1
+        self.assertAlmostEqual(self.tabla.valor(juego), esperado)
+        self.assertIsNone(self.tabla.valor(juego_sin_contacto((4, 0, 0, 0, 0, 0), rival)))
+        self.assertIsNone(self.tabla.valor(juego_inicial()))
+
+    def test_valor_sin_fichas_sacadas(self):
+        """Verifica que sin fichas sacadas en algún lado (posible gammon) no haya valor."""
+        juego = juego_sin_contacto((15, 0, 0, 0, 0, 0), (1, 0, 0, 0, 0, 0))
+        with mock.patch.object(TablaBearingOff, "cubre", return_value=True):
+            self.assertIsNone(self.tabla.valor(juego))
+            juego.cambiar_turno()
+            self.assertIsNone(self.tabla.valor(juego))
+
+    def test_bot_usa_la_tabla(self):
+        """Verifica que la búsqueda con tabla devuelva el valor exacto de cada jugada."""
+        propia, rival = (1, 0, 1, 0, 0, 1), (0, 1, 1, 0, 0, 0)
+        juego = juego_sin_contacto(propia, rival)
+        juego.fijar_movimientos([2, 1])
+        jugadas = juego.jugadas_legales()
+        bot = BotExpectiminimax(profundidad=2, bearing_off=self.tabla)
+        jugada, valor = bot.analizar(juego)
+        mejor = float("-inf")
+        for candidata in jugadas:
+            registros = aplicar_jugada(juego, candidata)
+            juego.cambiar_turno()
+            mejor = max(mejor, -self.tabla.valor(juego))
+            juego.cambiar_turno()
+            deshacer_jugada(juego, registros)
+        self.assertAlmostEqual(valor, mejor)
+        self.assertIn(jugada, jugadas)
+        sin_tabla = BotExpectiminimax(profundidad=2)
+        sin_tabla.analizar(juego)
+        self.assertLess(bot.nodos, sin_tabla.nodos)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests para la medición y la comparación de benchmarks."""
+import os
+import tempfile
+import unittest
+from backgammon.benchmarks.casos import CASOS_MOTOR
+from backgammon.benchmarks.medicion import (
+    Medicion, medir, cargar_linea_base, guardar_linea_base, regresiones,
+)
+
+
+class PruebasBenchmarks(unittest.TestCase):
+    """Pruebas del paquete de benchmarks."""
+
+    def test_medir_devuelve_tasa_y_memoria(self):
+        """Verifica que medir informe una tasa positiva y memoria no negativa."""
+        medicion = medir("lista", lambda: lambda: [0] * 100, segundos=0.01,
+                         repeticiones=1, muestras_memoria=3)
+        self.assertEqual(medicion.nombre, "lista")
+        self.assertGreater(medicion.ops_por_segundo, 0)
+        self.assertGreater(medicion.memoria_pico_bytes, 0)
+
+    def test_casos_del_motor_se_ejecutan(self):
+        """Verifica que cada caso del motor pueda repetirse sin fallar."""
+        for nombre, preparar in CASOS_MOTOR.items():
+            if nombre == "partida.aleatoria":
+                continue
+            with self.subTest(caso=nombre):
+                operacion = preparar()
+                for _ in range(5):
+                    operacion()
+
+    def test_linea_base_ida_y_vuelta(self):
+        """Verifica que la línea base guardada se lea igual y conserve casos previos."""
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "base.json")
+            self.assertEqual(cargar_linea_base(ruta), {})
+            guardar_linea_base(ruta, [Medicion("a", 100.0, 10.0)])
+            guardar_linea_base(ruta, [Medicion("b", 5.0, 1.0)], cargar_linea_base(ruta))
+            base = cargar_linea_base(ruta)
+        self.assertEqual(base["a"], {"ops_por_segundo": 100.0, "memoria_pico_bytes": 10.0})
+        self.assertEqual(base["b"]["ops_por_segundo"], 5.0)
+
+    def test_regresiones_respetan_la_tolerancia(self):
+        """Verifica que solo se marquen caídas de tasa o subas de memoria fuera de tolerancia."""
+        base = {"a": {"ops_por_segundo": 100.0, "memoria_pico_bytes": 1000.0}}
+        dentro = [Medicion("a", 80.0, 1100.0), Medicion("sin_base", 1.0, 1e9)]
+        self.assertEqual(regresiones(dentro, base, 0.25, margen_memoria=0), [])
+        lenta = regresiones([Medicion("a", 70.0, 1000.0)], base, 0.25, margen_memoria=0)
+        self.assertEqual(len(lenta), 1)
+        self.assertIn("ops/s", lenta[0])
+        pesada = regresiones([Medicion("a", 100.0, 1300.0)], base, 0.25, margen_memoria=0)
+        self.assertEqual(len(pesada), 1)
+        self.assertIn("B por operación", pesada[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,267 @@
+"""Tests para la búsqueda expectiminimax y su tabla de transposición."""
+import pickle
+import unittest
+from backgammon.core.dados import TIRADAS_DISTINTAS
+from backgammon.core.juego import Juego, juego_inicial
+from backgammon.core.jugador import crear_jugadores
+from backgammon.core.tablero_compacto import TableroCompacto
+from backgammon.ia.busqueda import (
+    BotExpectiminimax, TablaTransposicion, COTA_INFERIOR, COTA_SUPERIOR,
+    aplicar_jugada, deshacer_jugada, juego_de_busqueda,
+)
+from backgammon.ia.evaluacion import (
+    evaluar_heuristica, puntuar_jugadas, PESO_BLOT_PROPIO, PESO_BLOT_RIVAL,
+    PESO_PUNTO_EN_CASA,
+)
+
+
+def valor_tras_jugar(juego, jugada, profundidad: int) -> float:
+    """Expectiminimax sin podas ni tabla, como referencia para las pruebas."""
+    registros = aplicar_jugada(juego, jugada)
+    try:
+        if juego.termino():
+            return float(juego.puntos_victoria())
+        restantes = juego.movimientos_disponibles()
+        juego.cambiar_turno()
+        if profundidad == 1:
+            valor = -evaluar_heuristica(juego)
+        else:
+            valor = 0.0
+            for movimientos, probabilidad in TIRADAS_DISTINTAS:
+                juego.fijar_movimientos(movimientos)
+                jugadas = juego.jugadas_legales()
+                assert jugadas, "la referencia no contempla pasar"
+                mejor = max(valor_tras_jugar(juego, j, profundidad - 1) for j in jugadas)
+                valor -= probabilidad * mejor
+        juego.cambiar_turno()
+        juego.fijar_movimientos(restantes)
+        return valor
+    finally:
+        deshacer_jugada(juego, registros)
+
+
+class PruebasBusquedaConPlazo(unittest.TestCase):
+    """Pruebas de la búsqueda anytime con profundización iterativa."""
+
+    def test_sin_tiempo_devuelve_la_primera_jugada_ordenada(self):
+        """Verifica que con plazo vencido igual haya una jugada legal."""
+        juego = juego_inicial([3, 1])
+        antes = juego.estado_dict()
+        resultado = BotExpectiminimax(profundidad=3, tiempo=0.0).buscar(juego)
+        self.assertEqual(juego.estado_dict(), antes)
+        self.assertIn(resultado.jugada, juego.jugadas_legales())
+        self.assertIsNone(resultado.valor)
+        self.assertEqual(resultado.profundidad, 0)
+        self.assertFalse(resultado.completa)
+
+    def test_plazo_holgado_completa_la_profundidad(self):
+        """Verifica que con tiempo de sobra se llegue a la profundidad máxima."""
+        juego = juego_inicial([3, 1])
+        resultado = BotExpectiminimax(profundidad=2, tiempo=60.0).buscar(juego)
+        _, valor = BotExpectiminimax(profundidad=2).analizar(juego)
+        self.assertTrue(resultado.completa)
+        self.assertEqual(resultado.profundidad, 2)
+        self.assertAlmostEqual(resultado.valor, valor)
+        self.assertGreater(resultado.nodos, 0)
+
+    def test_respeta_el_plazo(self):
+        """Verifica que una búsqueda profunda se corte cerca del plazo y deje el juego igual."""
+        juego = juego_inicial([5, 2])
+        antes = juego.estado_dict()
+        clave = juego.clave_posicion()
+        bot = BotExpectiminimax(profundidad=6, tiempo=0.05)
+        resultado = bot.buscar(juego)
+        self.assertLess(resultado.segundos, 0.5)
+        self.assertFalse(resultado.completa)
+        self.assertLess(resultado.profundidad, 6)
+        self.assertIn(resultado.jugada, juego.jugadas_legales())
+        self.assertEqual(juego.estado_dict(), antes)
+        self.assertEqual(juego.clave_posicion(), clave)
+        self.assertIs(bot.ultimo_resultado, resultado)
+        self.assertEqual(bot.nodos, resultado.nodos)
+
+    def test_una_sola_jugada_no_busca(self):
+        """Verifica que con plazo y una única jugada no se busque."""
+        juego = juego_inicial([6, 5])
+        jugada = juego.jugadas_legales()[0]
+        resultado = BotExpectiminimax(profundidad=3, tiempo=1.0).buscar(juego, [jugada])
+        self.assertEqual(resultado.jugada, jugada)
+        self.assertEqual(resultado.nodos, 0)
+
+
+class PruebasTablaTransposicion(unittest.TestCase):
+    """Pruebas de la tabla de transposición acotada."""
+
+    def test_guardar_y_buscar(self):
+        """Verifica que el valor se encuentre sólo con profundidad suficiente."""
+        tabla = TablaTransposicion(4)
+        tabla.guardar(123, 2, 0.5)
+        self.assertEqual(tabla.buscar(123, 2), 0.5)
+        self.assertEqual(tabla.buscar(123, 1), 0.5)
+        self.assertIsNone(tabla.buscar(123, 3))
+        self.assertIsNone(tabla.buscar(124, 0))
+        self.assertEqual((tabla.consultas, tabla.aciertos), (4, 2))
+
+    def test_tamano_acotado_y_reemplazo(self):
+        """Verifica el tope de ranuras y la preferencia por profundidad."""
+        tabla = TablaTransposicion(2)
+        for clave in range(100):
+            tabla.guardar(clave, 0, float(clave))
+        self.assertEqual(len(tabla), tabla.ranuras)
+        # 1 y 5 comparten ranura: la hoja no desplaza al valor más profundo.
+        tabla.guardar(1, 3, 1.0)
+        tabla.guardar(5, 0, 5.0)
+        self.assertEqual(tabla.buscar(1, 3), 1.0)
+        # En una búsqueda nueva la entrada vieja sí se reemplaza.
+        tabla.nueva_busqueda()
+        tabla.guardar(5, 0, 5.0)
+        self.assertIsNone(tabla.buscar(1, 0))
+        self.assertEqual(tabla.buscar(5, 0), 5.0)
+        tabla.limpiar()
+        self.assertEqual(len(tabla), 0)
+
+    def test_cotas_solo_sirven_fuera_de_la_ventana(self):
+        """Verifica que las cotas se usen sólo cuando ya deciden el corte."""
+        tabla = TablaTransposicion(4)
+        tabla.guardar(7, 1, 0.4, COTA_INFERIOR)
+        self.assertIsNone(tabla.buscar(7, 1, -1.0, 1.0))
+        self.assertEqual(tabla.buscar(7, 1, -1.0, 0.3), 0.4)
+        tabla.guardar(8, 1, -0.4, COTA_SUPERIOR)
+        self.assertIsNone(tabla.buscar(8, 1, -1.0, 1.0))
+        self.assertEqual(tabla.buscar(8, 1, -0.2, 1.0), -0.4)
+
+
+class PruebasBotExpectiminimax(unittest.TestCase):
+    """Pruebas del bot expectiminimax sobre Juego."""
+
+    def test_tiradas_distintas(self):
+        """Verifica que las 21 tiradas sumen probabilidad 1."""
+        self.assertEqual(len(TIRADAS_DISTINTAS), 21)
+        self.assertAlmostEqual(sum(p for _, p in TIRADAS_DISTINTAS), 1.0)
+        self.assertIn(((6, 6, 6, 6), 1 / 36), TIRADAS_DISTINTAS)
+
+    def test_un_ply_maximiza_la_evaluacion(self):
+        """Verifica que con profundidad 1 se elija la jugada de mejor evaluación."""
+        juego = juego_inicial([6, 5])
+        bot = BotExpectiminimax(profundidad=1)
+        jugada, valor = bot.analizar(juego)
+        valores = []
+        for candidata in juego.jugadas_legales():
+            registros = [juego.hacer_movimiento(d, h) for d, h in candidata]
+            restantes = juego.movimientos_disponibles()
+            juego.cambiar_turno()
+            valores.append(-evaluar_heuristica(juego))
+            juego.cambiar_turno()
+            juego.fijar_movimientos(restantes)
+            for registro in reversed(registros):
+                juego.deshacer_movimiento(registro)
+        self.assertAlmostEqual(valor, max(valores))
+        self.assertIn(jugada, juego.jugadas_legales())
+
+    def test_busqueda_deja_el_juego_intacto(self):
+        """Verifica que la búsqueda a dos plies restaure tablero, dados y turno."""
+        juego = juego_inicial([3, 1])
+        antes = juego.estado_dict()
+        clave = juego.clave_posicion()
+        bot = BotExpectiminimax(profundidad=2, ranuras_log2=12)
+        jugada, valor = bot.analizar(juego)
+        self.assertEqual(juego.estado_dict(), antes)
+        self.assertEqual(juego.clave_posicion(), clave)
+        self.assertIn(jugada, juego.jugadas_legales())
+        self.assertTrue(-3.0 <= valor <= 3.0)
+        self.assertGreater(bot.nodos, 21)
+        # La segunda búsqueda encuentra las posiciones en la tabla.
+        bot.analizar(juego)
+        self.assertGreater(bot.tabla.aciertos, 0)
+        self.assertLessEqual(len(bot.tabla), bot.tabla.ranuras)
+
+    def test_jugada_ganadora_vale_los_puntos(self):
+        """Verifica que sacar la última ficha valga los puntos de la partida."""
+        j1, j2 = crear_jugadores(["A", "B"])
+        juego = Juego(j1, j2)
+        tablero = juego.tablero
+        tablero.preparar_posicion_inicial()
+        for _ in range(13):
+            tablero.registrar_salida(j1.id)
+        tablero.colocar_ficha(j1.id, 2)
+        tablero.colocar_ficha(j1.id, 5)
+        tablero.registrar_salida(j2.id)
+        for _ in range(14):
+            tablero.colocar_ficha(j2.id, 23)
+        juego.fijar_movimientos([6, 3])
+        _, valor = BotExpectiminimax(profundidad=2).analizar(juego)
+        self.assertEqual(valor, 1.0)
+
+    def test_serializa_sin_tabla(self):
+        """Verifica que el bot se pueda enviar a otro proceso sin su tabla."""
+        bot = BotExpectiminimax(profundidad=1)
+        bot.analizar(juego_inicial([2, 1]))
+        copia = pickle.loads(pickle.dumps(bot))
+        self.assertEqual(copia.profundidad, 1)
+        self.assertEqual(len(copia.tabla), 0)
+
+    def test_profundidad_invalida(self):
+        """Verifica que la profundidad mínima sea 1."""
+        with self.assertRaises(ValueError):
+            BotExpectiminimax(profundidad=0)
+        with self.assertRaises(ValueError):
+            BotExpectiminimax(poda_k=0)
+
+    def test_podas_star_no_cambian_el_valor(self):
+        """Verifica que Star1/Star2 y el orden den el valor exacto con menos nodos."""
+        juego = juego_de_busqueda(juego_inicial([4, 2]))
+        referencia = max(
+            valor_tras_jugar(juego, jugada, 2) for jugada in juego.jugadas_legales()
+        )
+        sin_star2 = BotExpectiminimax(profundidad=2, star2=False, ordenar=False)
+        con_star2 = BotExpectiminimax(profundidad=2)
+        _, valor_sin = sin_star2.analizar(juego)
+        _, valor_con = con_star2.analizar(juego)
+        self.assertAlmostEqual(valor_sin, referencia)
+        self.assertAlmostEqual(valor_con, referencia)
+        self.assertLess(con_star2.nodos, sin_star2.nodos)
+
+    def test_poda_hacia_adelante(self):
+        """Verifica que poda_k limite las jugadas buscadas y devuelva una jugada legal."""
+        juego = juego_inicial([6, 1])
+        completo = BotExpectiminimax(profundidad=2)
+        podado = BotExpectiminimax(profundidad=2, poda_k=2)
+        completo.analizar(juego)
+        jugada, _ = podado.analizar(juego)
+        self.assertIn(jugada, juego.jugadas_legales())
+        self.assertLess(podado.nodos, completo.nodos)
+
+    def test_juego_de_busqueda_copia_a_tablero_compacto(self):
+        """Verifica que la copia de búsqueda tenga la misma posición, turno y dados."""
+        juego = juego_inicial([5, 3])
+        juego.cambiar_turno()
+        juego.fijar_movimientos([5, 3])
+        copia = juego_de_busqueda(juego)
+        self.assertIsInstance(copia.tablero, TableroCompacto)
+        self.assertEqual(copia.clave_posicion(), juego.clave_posicion())
+        self.assertEqual(copia.jugadas_legales(), juego.jugadas_legales())
+        self.assertIs(juego_de_busqueda(copia), copia)
+
+    def test_puntuar_jugadas_coincide_con_el_tablero(self):
+        """Verifica la puntuación vectorizada contra los agregados del tablero."""
+        juego = juego_de_busqueda(juego_inicial([6, 4]))
+        j1, j2 = juego.jugadores
+        jugadas = juego.jugadas_legales()
+        puntajes = puntuar_jugadas(juego.tablero.celdas(), 0, jugadas)
+        self.assertEqual(len(puntajes), len(jugadas))
+        for jugada, puntaje in zip(jugadas, puntajes):
+            registros = aplicar_jugada(juego, jugada)
+            _, blots, hechos = juego.tablero.mascaras(j1.id)
+            _, blots_r, hechos_r = juego.tablero.mascaras(j2.id)
+            esperado = (
+                juego.tablero.pips(j2.id) - juego.tablero.pips(j1.id)
+                - PESO_BLOT_RIVAL * blots.bit_count() + PESO_BLOT_PROPIO * blots_r.bit_count()
+                + PESO_PUNTO_EN_CASA * ((hechos & 0b111111).bit_count()
+                                        - (hechos_r >> 18).bit_count())
+            )
+            deshacer_jugada(juego, registros)
+            self.assertAlmostEqual(puntaje, esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Tests para la caché LRU de jugadas legales."""
+import pickle
+import random
+import threading
+import unittest
+from backgammon.core.cache_jugadas import (
+    CACHE, MEMORIA_POR_DEFECTO, CacheJugadas, configurar_cache,
+)
+from backgammon.core.jugadas import _aplicar, generar_jugadas, primeros_movimientos
+from backgammon.core.tablero_compacto import BARRA
+from backgammon.core.juego import juego_inicial
+
+
+def finales(celdas, lado: int, jugadas) -> set:
+    """Posiciones a las que llevan las jugadas (el orden de cada jugada puede variar)."""
+    resultado = set()
+    for jugada in jugadas:
+        copia = list(celdas)
+        for desde, hasta in jugada:
+            _aplicar(copia, lado, desde, hasta, copia[BARRA + lado] > 0)
+        resultado.add(tuple(copia))
+    return resultado
+
+
+class PruebasCacheJugadas(unittest.TestCase):
+    """Pruebas del reemplazo LRU, el presupuesto, los contadores y el uso desde Juego."""
+
+    def setUp(self):
+        """Empieza cada prueba con la caché del proceso vacía."""
+        CACHE.limpiar()
+
+    def test_aciertos_y_copias(self):
+        """Verifica que la segunda consulta acierte y devuelva una lista independiente."""
+        cache = CacheJugadas()
+        llamadas = []
+
+        def calcular():
+            llamadas.append(1)
+            return [((12, 6), (6, 1))]
+
+        primera = cache.obtener("k", calcular)
+        primera.append("basura")
+        segunda = cache.obtener("k", calcular)
+        self.assertEqual(segunda, [((12, 6), (6, 1))])
+        self.assertEqual(len(llamadas), 1)
+        estadisticas = cache.estadisticas()
+        self.assertEqual((estadisticas["aciertos"], estadisticas["fallos"]), (1, 1))
+        self.assertEqual(estadisticas["tasa_aciertos"], 0.5)
+        cache.limpiar()
+        self.assertEqual((len(cache), cache.memoria, cache.aciertos), (0, 0, 0))
+
+    def test_desaloja_la_menos_usada(self):
+        """Verifica que al pasar el presupuesto se descarte la entrada usada hace más tiempo."""
+        cache = CacheJugadas()
+        cache.obtener(0, lambda: [((1, 2),)])
+        tamanio = cache.memoria
+        cache.configurar(3 * tamanio)
+        cache.obtener(1, lambda: [((1, 2),)])
+        cache.obtener(2, lambda: [((1, 2),)])
+        cache.obtener(0, lambda: [])
+        cache.obtener(3, lambda: [((1, 2),)])
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.desalojos, 1)
+        self.assertLessEqual(cache.memoria, cache.memoria_maxima)
+        self.assertEqual(cache.obtener(0, lambda: []), [((1, 2),)])
+        self.assertEqual(cache.obtener(1, lambda: []), [])
+        cache.configurar(0)
+        self.assertEqual((len(cache), cache.memoria), (0, 0))
+        cache.obtener(4, lambda: [((1, 2),)])
+        self.assertEqual(len(cache), 0)
+
+    def test_igual_que_el_generador(self):
+        """Verifica que Juego devuelva lo mismo que el generador en partidas al azar."""
+        rng = random.Random(5)
+        juego = juego_inicial([])
+        for _ in range(300):
+            if juego.termino():
+                juego.reiniciar()
+            juego.fijar_movimientos(rng.choice([[6, 5], [5, 6], [2, 2, 2, 2], [4, 1]]))
+            entrada = juego._entrada_para(juego.jugador_actual.id)
+            argumentos = (juego.tablero.celdas(), juego.lado_actual(),
+                          juego.movimientos_disponibles(), entrada)
+            jugadas = juego.jugadas_legales()
+            esperadas = generar_jugadas(*argumentos)
+            self.assertEqual(len(jugadas), len(esperadas))
+            self.assertEqual(finales(*argumentos[:2], jugadas), finales(*argumentos[:2], esperadas))
+            self.assertEqual(juego.jugadas_legales(), jugadas)
+            self.assertEqual(juego.movimientos_legales(), primeros_movimientos(*argumentos))
+            if jugadas:
+                for desde, hasta in rng.choice(jugadas):
+                    juego.aplicar_movimiento(desde, hasta)
+            juego.cambiar_turno()
+        self.assertGreater(CACHE.aciertos, 300)
+
+    def test_varios_hilos(self):
+        """Verifica que consultas concurrentes den el mismo resultado que una sola."""
+        configurar_cache(4096)
+        try:
+            esperado = {tirada: juego_inicial(tirada).jugadas_legales()
+                        for tirada in ((6, 5), (3, 1), (4, 4, 4, 4), (2, 1))}
+            errores = []
+
+            def consultar(semilla):
+                rng = random.Random(semilla)
+                for _ in range(200):
+                    tirada = rng.choice(list(esperado))
+                    if juego_inicial(list(tirada)).jugadas_legales() != esperado[tirada]:
+                        errores.append(tirada)
+
+            hilos = [threading.Thread(target=consultar, args=(i,)) for i in range(4)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+            self.assertEqual(errores, [])
+            self.assertLessEqual(CACHE.memoria, 4096)
+        finally:
+            configurar_cache(MEMORIA_POR_DEFECTO)
+
+    def test_serializacion(self):
+        """Verifica que la caché se serialice vacía y con el mismo presupuesto."""
+        cache = CacheJugadas(1 << 20)
+        cache.obtener("k", lambda: [((1, 2),)])
+        copia = pickle.loads(pickle.dumps(cache))
+        self.assertEqual((len(copia), copia.memoria_maxima), (0, 1 << 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests para el módulo codificacion."""
+import unittest
+import numpy as np
+from backgammon.core.codificacion import (
+    ANCHO, COLUMNA_LADO, codificar, codificar_lote, codificar_jugadas, decodificar, a_tablero,
+    aplicar_movimientos, espejar_filas,
+)
+from backgammon.core.perspectiva import espejar_celdas
+from backgammon.core.tablero import Tablero, PUNTOS
+from backgammon.core.tablero_compacto import TableroCompacto, BARRA, SALIDA, CELDAS
+from backgammon.core.zobrist import hash_desde_cero
+from backgammon.core.juego import juego_inicial
+from backgammon.tests.utilidades import jugar_al_azar
+
+
+def posiciones_aleatorias(semilla, cantidad):
+    """Juega al azar y devuelve (celdas, lado, jugadas) de varias posiciones."""
+    return [
+        (juego.tablero.celdas(), juego.lado_actual(), juego.jugadas_legales())
+        for juego in jugar_al_azar(juego_inicial(tablero=TableroCompacto()), semilla, cantidad)
+    ]
+
+
+def aplicar_una_por_una(celdas, lado, jugada):
+    """Aplica una jugada sobre una copia de 'celdas' sin NumPy."""
+    celdas = list(celdas)
+    signo = 1 if lado == 0 else -1
+    for desde, hasta in jugada:
+        if celdas[BARRA + lado] > 0:
+            celdas[BARRA + lado] -= 1
+        else:
+            celdas[desde] -= signo
+        if hasta == PUNTOS:
+            celdas[SALIDA + lado] += 1
+            continue
+        if celdas[hasta] == -signo:
+            celdas[hasta] = 0
+            celdas[BARRA + 1 - lado] += 1
+        celdas[hasta] += signo
+    return celdas
+
+
+class PruebasCodificacion(unittest.TestCase):
+    """Pruebas de codificación y decodificación de posiciones."""
+
+    def test_codificar_tablero(self):
+        """Verifica que la fila tenga las celdas del tablero y el lado que mueve."""
+        for clase in (Tablero, TableroCompacto):
+            tablero = clase()
+            tablero.posicion_inicial_estandar(1, 2)
+            fila = codificar(tablero, 1)
+            self.assertEqual(fila.shape, (ANCHO,))
+            self.assertEqual(fila.dtype, np.int8)
+            self.assertEqual(fila[:CELDAS].tolist(), tablero.celdas())
+            self.assertEqual(fila[COLUMNA_LADO], 1)
+
+    def test_codificar_lote(self):
+        """Verifica la forma y el contenido de un lote."""
+        posiciones = posiciones_aleatorias(1, 10)
+        filas = codificar_lote([c for c, _, _ in posiciones], [l for _, l, _ in posiciones])
+        self.assertEqual(filas.shape, (10, ANCHO))
+        for fila, (celdas, lado, _) in zip(filas, posiciones):
+            self.assertEqual(decodificar(fila), (celdas, lado))
+
+    def test_codificar_jugadas_igual_que_aplicar_en_orden(self):
+        """Compara la versión vectorizada con aplicar cada jugada por separado."""
+        for celdas, lado, jugadas in posiciones_aleatorias(5, 60):
+            filas = codificar_jugadas(celdas, lado, jugadas)
+            self.assertEqual(filas.shape, (len(jugadas), ANCHO))
+            for fila, jugada in zip(filas, jugadas):
+                esperado = aplicar_una_por_una(celdas, lado, jugada)
+                self.assertEqual(decodificar(fila), (esperado, 1 - lado))
+
+    def test_codificar_jugadas_con_hit_reingreso_y_salida(self):
+        """Verifica un caso armado con reingreso con hit y un bearing off."""
+        celdas = [0] * CELDAS
+        celdas[BARRA] = 1
+        celdas[2] = -1
+        celdas[1] = 1
+        filas = codificar_jugadas(celdas, 0, [((0, 2), (1, 24))])
+        esperado = [0] * CELDAS
+        esperado[2] = 1
+        esperado[BARRA + 1] = 1
+        esperado[SALIDA] = 1
+        self.assertEqual(decodificar(filas[0]), (esperado, 1))
+
+    def test_sin_jugadas(self):
+        """Verifica que sin jugadas se devuelva una matriz vacía."""
+        self.assertEqual(codificar_jugadas([0] * CELDAS, 0, []).shape, (0, ANCHO))
+
+    def test_aplicar_movimientos_y_espejar_en_lote(self):
+        """Verifica una jugada distinta por fila y el espejo de cada fila."""
+        posiciones = [p for p in posiciones_aleatorias(4, 40) if p[1] == 0 and p[2]]
+        filas = codificar_lote([celdas for celdas, _, _ in posiciones], 0)
+        movimientos = np.full((len(posiciones), 4, 2), -1, dtype=np.intp)
+        for i, (_, _, jugadas) in enumerate(posiciones):
+            movimientos[i, :len(jugadas[-1])] = jugadas[-1]
+        aplicar_movimientos(filas, movimientos, 0)
+        for fila, (celdas, _, jugadas) in zip(filas, posiciones):
+            self.assertEqual(fila[:CELDAS].tolist(), aplicar_una_por_una(celdas, 0, jugadas[-1]))
+        espejo = espejar_filas(filas)
+        self.assertTrue(np.all(espejo[:, COLUMNA_LADO] == 1))
+        for fila, original in zip(espejo, filas):
+            self.assertEqual(fila[:CELDAS].tolist(), espejar_celdas(original[:CELDAS].tolist()))
+        self.assertTrue(np.array_equal(espejar_filas(espejo), filas))
+
+    def test_a_tablero_reconstruye_hash(self):
+        """Verifica que reconstruir el tablero dé las mismas celdas y el mismo hash."""
+        for celdas, lado, _ in posiciones_aleatorias(9, 15):
+            reconstruido = a_tablero(codificar_lote([celdas], lado)[0], 1, 2)
+            self.assertEqual(reconstruido.celdas(), celdas)
+            self.assertEqual(reconstruido.hash_posicion, hash_desde_cero(reconstruido, (1, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 """Tests para el módulo dados."""
 import unittest
-from backgammon.core.dados import Dados
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from backgammon.core.dados import Dados, TIRADAS, semilla_derivada, semillas_derivadas
 
 
 class PruebasDados(unittest.TestCase):
@@ -107,5 +109,100 @@ class PruebasDados(unittest.TestCase):
         self.assertIsInstance(movimientos, list)
 
 
+class PruebasDadosBloque(unittest.TestCase):
+    """Pruebas del modo bloque (NumPy) de Dados."""
+
+    def test_tiradas_internadas(self):
+        """Verifica que las tiradas sean las tuplas compartidas de TIRADAS."""
+        dados = Dados(semilla=3, bloque=64)
+        for _ in range(100):
+            tirada = dados.tirar()
+            d1, d2, movimientos = tirada
+            self.assertIs(tirada, TIRADAS[6 * (d1 - 1) + (d2 - 1)])
+            self.assertEqual(len(movimientos), 4 if d1 == d2 else 2)
+            self.assertIs(dados.ultimo_tiro(), tirada)
+
+    def test_secuencia_no_depende_del_bloque_ni_del_lote(self):
+        """Verifica la reproducibilidad con distintos bloques y consumo mixto."""
+        chico = Dados(semilla=9, bloque=5)
+        grande = Dados(semilla=9, bloque=4096)
+        esperado = [chico.tirar()[:2] for _ in range(40)]
+        obtenido = [tuple(par) for par in grande.tirar_lote(13).tolist()]
+        obtenido += [grande.tirar()[:2] for _ in range(27)]
+        self.assertEqual(esperado, obtenido)
+
+    def test_fijar_semilla_reinicia_secuencia(self):
+        """Verifica que fijar_semilla vuelva a empezar la secuencia del bloque."""
+        dados = Dados(semilla=1, bloque=16)
+        primero = dados.tirar_lote(50)
+        dados.fijar_semilla(1)
+        self.assertIsNone(dados.ultimo_tiro())
+        self.assertTrue((dados.tirar_lote(50) == primero).all())
+
+    def test_lote_cubre_las_36_tiradas(self):
+        """Verifica rango y que aparezcan todas las combinaciones."""
+        lote = Dados(semilla=2, bloque=128).tirar_lote(5000)
+        self.assertEqual(lote.shape, (5000, 2))
+        self.assertTrue(((lote >= 1) & (lote <= 6)).all())
+        self.assertEqual(len({tuple(par) for par in lote.tolist()}), 36)
+
+    def test_tirar_lote_sin_bloque_falla(self):
+        """Verifica que el modo clásico no ofrezca tirar_lote."""
+        with self.assertRaises(ValueError):
+            Dados(semilla=1).tirar_lote(3)
+
+
+def tiradas_de_partidas(semilla_maestra, indices, bloque=None):
+    """Primeras 20 tiradas de cada partida, derivando su semilla por índice."""
+    return {
+        i: [Dados(semilla_derivada(semilla_maestra, i), bloque=bloque).tirar()[:2]
+            for _ in range(20)]
+        for i in indices
+    }
+
+
+class PruebasSemillasDerivadas(unittest.TestCase):
+    """Pruebas de la derivación de semillas para partidas en paralelo."""
+
+    def test_equivale_a_spawn(self):
+        """Verifica que coincida con SeedSequence(maestra).spawn(n)[i]."""
+        hijas = np.random.SeedSequence(77).spawn(5)
+        for i, hija in enumerate(hijas):
+            self.assertEqual(
+                list(semilla_derivada(77, i).generate_state(4)),
+                list(hija.generate_state(4)),
+            )
+
+    def test_semillas_derivadas_con_inicio(self):
+        """Verifica que un rango de partidas derive las mismas semillas por índice."""
+        todas = semillas_derivadas(3, 6)
+        parte = semillas_derivadas(3, 2, inicio=4)
+        self.assertEqual(
+            [list(s.generate_state(2)) for s in todas[4:]],
+            [list(s.generate_state(2)) for s in parte],
+        )
+
+    def test_partidas_distintas_tienen_flujos_distintos(self):
+        """Verifica que dos partidas no reciban la misma secuencia."""
+        tiradas = tiradas_de_partidas(1, [0, 1], bloque=64)
+        self.assertNotEqual(tiradas[0], tiradas[1])
+
+    def test_modo_clasico_acepta_seed_sequence(self):
+        """Verifica que el modo random también sea reproducible con semillas derivadas."""
+        self.assertEqual(tiradas_de_partidas(8, [3]), tiradas_de_partidas(8, [3]))
+
+    def test_reparto_entre_procesos_da_el_mismo_resultado(self):
+        """Verifica que repartir partidas entre procesos no cambie sus dados."""
+        secuencial = tiradas_de_partidas(2024, range(6), bloque=32)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            partes = pool.map(
+                tiradas_de_partidas, [2024, 2024], [[0, 2, 4], [1, 3, 5]], [32, 32]
+            )
+            repartido = {}
+            for parte in partes:
+                repartido.update(parte)
+        self.assertEqual(secuencial, repartido)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
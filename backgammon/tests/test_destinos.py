@@ -0,0 +1,52 @@
+"""Tests para la tabla de destinos por lado, origen y dado."""
+import unittest
+from backgammon.core.destinos import (
+    DESTINOS, FUERA, ORIGEN_BARRA, dado_de_entrada, destino, puntos_de_entrada,
+)
+from backgammon.core.perspectiva import PIPS_PARA_SALIR, espejar_punto
+from backgammon.core.tablero import PUNTOS
+from backgammon.core.juego import juego_inicial
+
+
+class PruebasDestinos(unittest.TestCase):
+    """Pruebas de la tabla y del reingreso desde la barra."""
+
+    def test_movimientos_normales(self):
+        """Verifica la dirección de cada lado y que pasar el punto 0 o el 23 sea FUERA."""
+        for punto in range(PUNTOS):
+            for dado in range(1, 7):
+                j1 = punto - dado if punto - dado >= 0 else FUERA
+                j2 = punto + dado if punto + dado < PUNTOS else FUERA
+                self.assertEqual(destino(0, punto, dado), j1)
+                self.assertEqual(destino(1, punto, dado), j2)
+                self.assertEqual(destino(1, espejar_punto(punto), dado),
+                                 espejar_punto(destino(0, punto, dado)))
+        self.assertEqual((PIPS_PARA_SALIR[0][0], PIPS_PARA_SALIR[1][0]), (1, 24))
+        self.assertIsNone(DESTINOS[0][5][0])
+
+    def test_reingreso(self):
+        """Verifica que J1 entre en 24-dado y J2 en dado-1, dentro de la casa rival."""
+        for dado in range(1, 7):
+            self.assertEqual(destino(0, ORIGEN_BARRA, dado), 24 - dado)
+            self.assertEqual(destino(1, ORIGEN_BARRA, dado), dado - 1)
+            self.assertEqual(dado_de_entrada(0, 24 - dado), dado)
+            self.assertEqual(dado_de_entrada(1, dado - 1), dado)
+        self.assertEqual(puntos_de_entrada(0, [6, 1, 1]), [18, 23])
+        self.assertEqual(puntos_de_entrada(1, [6, 1]), [0, 5])
+
+    def test_reingreso_en_juego(self):
+        """Verifica el reingreso de J2 con las jugadas legales y con mover_ficha."""
+        juego = juego_inicial(lado=1)
+        pid = juego.jugador_actual.id
+        juego.tablero.quitar_ficha(pid, 23)
+        juego.tablero.enviar_a_barra(pid)
+        # El punto 5 (dado 6) es de J1: sólo se puede entrar con el 2, en el punto 1.
+        juego.fijar_movimientos([6, 2])
+        self.assertEqual(juego.movimientos_legales(), [(0, 1, 2)])
+        self.assertFalse(juego.mover_ficha(0, 5))
+        self.assertTrue(juego.mover_ficha(0, 1))
+        self.assertEqual(juego.tablero.fichas_en_barra(pid), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
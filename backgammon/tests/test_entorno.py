@@ -0,0 +1,113 @@
+"""Tests para el entorno reset/step sobre Juego."""
+import random
+import unittest
+import numpy as np
+from backgammon.core.codificacion import ANCHO, COLUMNA_LADO, espejar_filas
+from backgammon.core.perspectiva import celdas_canonicas
+from backgammon.ia.estrategias import EstrategiaAleatoria
+from backgammon.simulacion.entorno import EntornoJuego
+
+
+def jugar(entorno, rng, pasos):
+    """Juega 'pasos' acciones al azar y devuelve las transiciones (info previa, resultado)."""
+    _, info = entorno.reset(seed=7)
+    transiciones = []
+    for _ in range(pasos):
+        resultado = entorno.step(rng.randrange(info["acciones"]) if info["acciones"] else 0)
+        transiciones.append((info, resultado))
+        info = resultado[4]
+        if resultado[2] or resultado[3]:
+            _, info = entorno.reset()
+    return transiciones
+
+
+class PruebasEntorno(unittest.TestCase):
+    """Pruebas de reset, step, recompensas y render del entorno."""
+
+    def test_reset_reproducible(self):
+        """Verifica la observación inicial y que la misma semilla repita la partida."""
+        entorno = EntornoJuego()
+        observacion, info = entorno.reset(seed=3)
+        self.assertEqual((observacion.shape, observacion.dtype), ((ANCHO,), np.int8))
+        self.assertEqual((info["lado"], observacion[COLUMNA_LADO]), (0, 0))
+        self.assertEqual(info["acciones"], len(entorno.jugadas))
+        primera = jugar(entorno, random.Random(1), 60)
+        segunda = jugar(entorno, random.Random(1), 60)
+        for (_, a), (_, b) in zip(primera, segunda):
+            self.assertTrue(np.array_equal(a[0], b[0]))
+            self.assertEqual(a[1:], b[1:])
+
+    def test_observacion_y_candidatas(self):
+        """Verifica que la observación siguiente sea la candidata elegida vista por el rival."""
+        entorno = EntornoJuego()
+        observacion, info = entorno.reset(seed=5)
+        rng = random.Random(5)
+        for _ in range(200):
+            juego = entorno.juego
+            esperada = celdas_canonicas(juego.tablero.celdas(), juego.lado_actual())
+            self.assertEqual(observacion[:COLUMNA_LADO].tolist(), esperada)
+            candidatas = entorno.candidatas()
+            self.assertEqual(len(candidatas), info["acciones"])
+            self.assertTrue(np.all(candidatas[:, COLUMNA_LADO] == 1))
+            accion = rng.randrange(info["acciones"])
+            observacion, _, terminada, truncada, nueva = entorno.step(accion)
+            if terminada or truncada:
+                observacion, info = entorno.reset()
+                continue
+            if nueva["turnos"] == info["turnos"] + 1:
+                self.assertTrue(np.array_equal(observacion, espejar_filas(candidatas[[accion]])[0]))
+            info = nueva
+
+    def test_recompensas_autojuego(self):
+        """Verifica que al terminar la recompensa sea los puntos de quien ganó."""
+        entorno = EntornoJuego()
+        finales = [r for _, r in jugar(entorno, random.Random(2), 3000) if r[2]]
+        self.assertGreater(len(finales), 0)
+        self.assertTrue(all(r[1] in (1.0, 2.0, 3.0) for r in finales))
+
+    def test_oponente(self):
+        """Verifica que con oponente el agente sea siempre J1 y pueda perder puntos."""
+        entorno = EntornoJuego(EstrategiaAleatoria())
+        recompensas = set()
+        for info, resultado in jugar(entorno, random.Random(4), 3000):
+            self.assertEqual(info["lado"], 0)
+            if resultado[2]:
+                recompensas.add(resultado[1])
+            else:
+                self.assertEqual(resultado[1], 0.0)
+        self.assertTrue(recompensas & {1.0, 2.0, 3.0})
+        self.assertTrue(recompensas & {-1.0, -2.0, -3.0})
+
+    def test_truncada(self):
+        """Verifica el corte por tope de turnos."""
+        entorno = EntornoJuego(max_turnos=2)
+        entorno.reset(seed=1)
+        _, _, terminada, truncada, _ = entorno.step(0)
+        self.assertFalse(terminada or truncada)
+        _, recompensa, terminada, truncada, _ = entorno.step(0)
+        self.assertEqual((recompensa, terminada, truncada), (0.0, False, True))
+
+    def test_render(self):
+        """Verifica el render sin modo, el cuadro en rgb_array y el modo inválido."""
+        entorno = EntornoJuego()
+        entorno.reset(seed=1)
+        self.assertIsNone(entorno.render())
+        with self.assertRaises(ValueError):
+            EntornoJuego(render_mode="ventana")
+        try:
+            import pygame  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            pygame = None
+        if not hasattr(pygame, "Surface"):
+            # Sin pygame, o con el paquete backgammon/pygame tapándolo en sys.path.
+            self.skipTest("pygame no está disponible")
+        entorno = EntornoJuego(render_mode="rgb_array")
+        entorno.reset(seed=1)
+        cuadro = entorno.render()
+        entorno.close()
+        self.assertEqual((cuadro.ndim, cuadro.shape[2], cuadro.dtype), (3, 3, np.uint8))
+        self.assertGreater(len(np.unique(cuadro.reshape(-1, 3), axis=0)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests para el entrenamiento TD(λ) por autojuego."""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from backgammon.core.codificacion import COLUMNA_LADO
+from backgammon.ia.entrenamiento import (
+    ARCHIVO_ESTADO, actualizar, entrenar, invertir_salidas, jugar_autoentrenamiento, main,
+    objetivos_td, resultado_para,
+)
+from backgammon.ia.red_neuronal import RedNeuronal, entradas_td
+
+
+class PruebasEntrenamiento(unittest.TestCase):
+    """Pruebas de los objetivos TD, la actualización y los puntos de control."""
+
+    def test_invertir_y_resultado(self):
+        """Verifica el cambio de punto de vista de las salidas y del resultado final."""
+        salidas = np.array([[0.7, 0.2, 0.05, 0.1, 0.01]])
+        self.assertTrue(np.allclose(invertir_salidas(salidas), [[0.3, 0.1, 0.01, 0.2, 0.05]]))
+        self.assertTrue(np.allclose(invertir_salidas(invertir_salidas(salidas)), salidas))
+        self.assertEqual(resultado_para(0, 0, 2).tolist(), [1, 1, 0, 0, 0])
+        self.assertEqual(resultado_para(1, 0, 3).tolist(), [0, 0, 0, 1, 1])
+
+    def test_objetivos_td(self):
+        """Verifica los λ-retornos en los extremos λ = 1 (resultado) y λ = 0 (siguiente)."""
+        salidas = np.random.default_rng(0).random((4, 5)).astype(np.float32)
+        lados = [0, 1, 0, 1]
+        monte_carlo = objetivos_td(salidas, lados, ganador=1, puntos=1, lam=1.0)
+        self.assertEqual(monte_carlo[:, 0].tolist(), [0, 1, 0, 1])
+        td0 = objetivos_td(salidas, lados, ganador=1, puntos=1, lam=0.0)
+        self.assertTrue(np.allclose(td0[:3], invertir_salidas(salidas[1:])))
+        self.assertEqual(td0[3].tolist(), [1, 0, 0, 0, 0])
+
+    def test_actualizar_se_acerca_al_objetivo(self):
+        """Verifica que los pasos de gradiente reduzcan el error."""
+        red = RedNeuronal.aleatoria(ocultas=(6,), semilla=1)
+        entradas = np.random.default_rng(1).random((8, 198)).astype(np.float32)
+        objetivos = np.tile(np.array([0.9, 0.3, 0.1, 0.05, 0.0], dtype=np.float32), (8, 1))
+        primero = actualizar(red, entradas, objetivos, alfa=1.0)
+        for _ in range(50):
+            ultimo = actualizar(red, entradas, objetivos, alfa=1.0)
+        self.assertLess(ultimo, primero / 4)
+
+    def test_partida_de_autojuego(self):
+        """Verifica que la trayectoria sea reproducible y alterne el lado que mueve."""
+        red = RedNeuronal.aleatoria(ocultas=(4,), semilla=2)
+        trayectoria = jugar_autoentrenamiento(5, red, semilla=3)
+        repetida = jugar_autoentrenamiento(5, red, semilla=3)
+        self.assertTrue(np.array_equal(trayectoria.filas, repetida.filas))
+        self.assertIn(trayectoria.ganador, (0, 1))
+        self.assertIn(trayectoria.puntos, (1, 2, 3))
+        lados = trayectoria.filas[:, COLUMNA_LADO]
+        self.assertTrue(np.all(lados[1:] != lados[:-1]))
+        self.assertEqual(entradas_td(trayectoria.filas).shape, (len(lados), 198))
+        cortada = jugar_autoentrenamiento(5, red, semilla=3, max_turnos=3)
+        self.assertIsNone(cortada.ganador)
+        self.assertEqual(len(cortada.filas), 3)
+
+    def test_retomar_da_lo_mismo(self):
+        """Verifica que cortar y retomar, o usar más procesos, dé los mismos pesos."""
+        config = {"ocultas": [4], "ronda": 2, "semilla": 7}
+        with tempfile.TemporaryDirectory() as carpeta:
+            seguido = os.path.join(carpeta, "seguido")
+            cortado = os.path.join(carpeta, "cortado")
+            paralelo = os.path.join(carpeta, "paralelo")
+            entrenar(seguido, 6, procesos=1, cada=2, **config)
+            entrenar(cortado, 4, procesos=1, cada=2, **config)
+            estado = entrenar(cortado, 6, procesos=1, cada=2, alfa=5.0)
+            entrenar(paralelo, 6, procesos=2, cada=2, **config)
+            redes = [RedNeuronal.cargar(os.path.join(c, "red.npz"))
+                     for c in (seguido, cortado, paralelo)]
+            with open(os.path.join(seguido, ARCHIVO_ESTADO), encoding="utf-8") as archivo:
+                guardado = json.load(archivo)
+        for red in redes[1:]:
+            for w, otro in zip(redes[0].pesos, red.pesos):
+                self.assertTrue(np.array_equal(w, otro))
+        self.assertEqual(estado["partidas"], 6)
+        self.assertEqual(estado["configuracion"]["alfa"], 0.1)
+        self.assertEqual([h["partidas"] for h in estado["historial"]], [2, 4, 6])
+        self.assertEqual([h["partidas"] for h in guardado["historial"]], [2, 4, 6])
+        with self.assertRaises(ValueError):
+            entrenar(carpeta, 1, procesos=1, gamma=0.5)
+
+    def test_linea_de_comandos(self):
+        """Verifica la entrada por línea de comandos."""
+        with tempfile.TemporaryDirectory() as carpeta, mock.patch("builtins.print") as impreso:
+            estado = main(["--carpeta", carpeta, "--partidas", "2", "--procesos", "1",
+                           "--cada", "1", "--ocultas", "3"])
+        self.assertEqual(estado["partidas"], 2)
+        self.assertEqual(estado["configuracion"]["ocultas"], [3])
+        self.assertEqual(impreso.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 """Tests para el módulo juego."""
 import unittest
-from backgammon.core.juego import Juego
-from backgammon.core.jugador import Jugador
+from backgammon.core.juego import Juego, juego_inicial
+from backgammon.core.jugador import Jugador, crear_jugadores
 from backgammon.core.tablero import PUNTOS, FICHAS_POR_JUGADOR, Tablero, Checker
+from backgammon.core.dados import Dados
+from backgammon.core.tablero_compacto import TableroCompacto
 
 
 class TableroFalso:
@@ -72,6 +74,13 @@ class PruebasJuego(unittest.TestCase):
         juego.cambiar_turno()
         self.assertEqual(juego.jugador_actual.nombre, "B")
 
+    def test_lado_actual(self):
+        """Verifica que lado_actual() siga la paridad del id del jugador al turno."""
+        juego = Juego(*crear_jugadores(["A", "B"]))
+        self.assertEqual(juego.lado_actual(), 0)
+        juego.cambiar_turno()
+        self.assertEqual(juego.lado_actual(), 1)
+
     def test_termino_y_ganador_none(self):
         """Verifica estado inicial sin ganador."""
         juego = Juego(Jugador("A"), Jugador("B"))
@@ -425,7 +434,8 @@ class PruebasJuego(unittest.TestCase):
         pid = juego.jugador_actual.id
         juego.tablero.enviar_a_barra(pid)
         juego.__movs_restantes__ = [3]
-        resultado = juego.mover_ficha(0, 3)
+        self.assertFalse(juego.mover_ficha(23, 20))
+        resultado = juego.mover_ficha(23, 21)
         self.assertTrue(resultado)
         self.assertEqual(juego.tablero.fichas_en_barra(pid), 0)
         self.assertEqual(juego.movimientos_disponibles(), [])
@@ -573,18 +583,18 @@ class PruebasJuego(unittest.TestCase):
         self.assertFalse(resultado)
 
     def test_entrada_para_j1(self):
-        """Verifica que _entrada_para retorne 0 para J1."""
+        """Verifica que _entrada_para retorne 23 para J1 (entra en la casa de J2)."""
         juego = Juego(Jugador("A"), Jugador("B"))
         j1_id = juego.jugadores[0].id
         entrada = juego._entrada_para(j1_id)
-        self.assertEqual(entrada, 0)
+        self.assertEqual(entrada, 23)
 
     def test_entrada_para_j2(self):
-        """Verifica que _entrada_para retorne 23 para J2."""
+        """Verifica que _entrada_para retorne 0 para J2 (entra en la casa de J1)."""
         juego = Juego(Jugador("A"), Jugador("B"))
         j2_id = juego.jugadores[1].id
         entrada = juego._entrada_para(j2_id)
-        self.assertEqual(entrada, 23)
+        self.assertEqual(entrada, 0)
 
     def test_en_barra_true(self):
         """Verifica que _en_barra retorne True si hay fichas en barra."""
@@ -606,5 +616,69 @@ class PruebasJuego(unittest.TestCase):
         self.assertTrue(resultado)
 
 
+    def test_hacer_y_deshacer_todas_las_jugadas(self):
+        """Verifica que cada jugada legal se pueda aplicar y revertir exactamente."""
+        juego = Juego(Jugador("A"), Jugador("B"))
+        juego.reiniciar()
+        juego.__movs_restantes__ = [6, 5]
+        juego.__estado__ = "en_curso"
+        clave = juego.clave_posicion()
+        puntos = [len(juego.tablero.punto(i)) for i in range(PUNTOS)]
+        for jugada in juego.jugadas_legales():
+            registros = [juego.hacer_movimiento(desde, hasta) for desde, hasta in jugada]
+            self.assertNotIn(None, registros)
+            self.assertEqual(juego.movimientos_disponibles(), [])
+            self.assertEqual(juego.jugador_actual.nombre, "A")
+            for registro in reversed(registros):
+                juego.deshacer_movimiento(registro)
+            self.assertEqual(juego.movimientos_disponibles(), [6, 5])
+            self.assertEqual(juego.clave_posicion(), clave)
+            self.assertEqual([len(juego.tablero.punto(i)) for i in range(PUNTOS)], puntos)
+
+    def test_hacer_movimiento_invalido_devuelve_none(self):
+        """Verifica que un movimiento inválido no devuelva registro ni consuma dados."""
+        juego = Juego(Jugador("A"), Jugador("B"))
+        juego.reiniciar()
+        juego.__movs_restantes__ = [2]
+        self.assertIsNone(juego.hacer_movimiento(0, 5))
+        self.assertEqual(juego.movimientos_disponibles(), [2])
+        self.assertIsNotNone(juego.ultimo_error())
+
+
+    def test_juego_con_dados_en_modo_bloque(self):
+        """Verifica que Juego acepte Dados en modo bloque y copie los movimientos."""
+        juego = Juego(Jugador("A"), Jugador("B"), dados=Dados(semilla=4, bloque=32))
+        juego.reiniciar()
+        d1, d2, _ = juego.tirar()
+        self.assertIsInstance(juego.movimientos_disponibles(), list)
+        self.assertEqual(sorted(set(juego.movimientos_disponibles())), sorted({d1, d2}))
+
+
+    def test_puntos_victoria(self):
+        """Verifica victoria simple, gammon y backgammon."""
+        juego = Juego(Jugador("A"), Jugador("B"))
+        ganador, perdedor = [j.id for j in juego.jugadores]
+        self.assertEqual(juego.puntos_victoria(), 0)
+        juego.tablero.__salidas__ = {ganador: FICHAS_POR_JUGADOR}
+        juego.tablero.colocar_ficha(perdedor, 12)
+        self.assertEqual(juego.puntos_victoria(), 2)
+        juego.tablero.registrar_salida(perdedor)
+        self.assertEqual(juego.puntos_victoria(), 1)
+        juego.tablero.__salidas__[perdedor] = 0
+        casa_ganador = 3 if ganador % 2 != 0 else 20
+        juego.tablero.colocar_ficha(perdedor, casa_ganador)
+        self.assertEqual(juego.puntos_victoria(), 3)
+
+
+    def test_juego_inicial_fija_lado_y_dados(self):
+        """Verifica que juego_inicial deje la posición inicial con el lado y los dados dados."""
+        juego = juego_inicial([3, 1], lado=1, tablero=TableroCompacto())
+        self.assertIsInstance(juego.tablero, TableroCompacto)
+        self.assertEqual(juego.lado_actual(), 1)
+        self.assertEqual(juego.movimientos_disponibles(), [3, 1])
+        self.assertEqual(juego.tablero.celdas(), juego_inicial().tablero.celdas())
+        self.assertEqual(juego_inicial().movimientos_disponibles(), [])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""Tests para el módulo jugadas (generador de jugadas legales)."""
+import copy
+import unittest
+from backgammon.core.perspectiva import PIPS_PARA_SALIR
+from backgammon.core.tablero import PUNTOS
+from backgammon.core.tablero_compacto import TableroCompacto, SALIDA
+from backgammon.core.jugadas import generar_jugadas, primeros_movimientos
+from backgammon.core.juego import juego_inicial
+from backgammon.tests.utilidades import jugar_al_azar
+
+
+def movimientos_validos(juego):
+    """Todos los (desde, hasta) que acepta _validar_movimiento."""
+    tope = PUNTOS if juego._en_barra(juego.jugador_actual.id) else PUNTOS + 1
+    return [
+        (desde, hasta)
+        for desde in range(PUNTOS)
+        for hasta in range(tope)
+        if juego._validar_movimiento(desde, hasta)[0]
+    ]
+
+
+def finales_fuerza_bruta(juego):
+    """Posiciones finales legales calculadas probando todo con Juego.aplicar_movimiento."""
+    hojas = []
+    visitados = set()
+
+    def explorar(actual, usados):
+        clave = (tuple(actual.tablero.celdas()), tuple(sorted(usados)))
+        if clave in visitados:
+            return
+        visitados.add(clave)
+        hijos = False
+        for desde, hasta in movimientos_validos(actual):
+            copia = copy.deepcopy(actual)
+            antes = copia.movimientos_disponibles()
+            if not copia.aplicar_movimiento(desde, hasta):
+                continue
+            despues = copia.movimientos_disponibles()
+            for dado in despues:
+                antes.remove(dado)
+            hijos = True
+            explorar(copia, usados + antes)
+        if not hijos:
+            hojas.append((tuple(actual.tablero.celdas()), usados))
+
+    explorar(juego, [])
+    maximo = max(len(usados) for _, usados in hojas)
+    if maximo == 0:
+        return set()
+    dados = juego.movimientos_disponibles()
+    mayor = max(dados)
+    if maximo == 1 and len(set(dados)) == 2 and any(u == [mayor] for _, u in hojas):
+        return {pos for pos, u in hojas if u == [mayor]}
+    return {pos for pos, u in hojas if len(u) == maximo}
+
+
+def finales_generador(juego):
+    """Posiciones finales de las jugadas de Juego.jugadas_legales."""
+    finales = set()
+    for jugada in juego.jugadas_legales():
+        copia = copy.deepcopy(juego)
+        for desde, hasta in jugada:
+            assert copia.aplicar_movimiento(desde, hasta), (jugada, copia.ultimo_error())
+        finales.add(tuple(copia.tablero.celdas()))
+    return finales
+
+
+class PruebasJugadas(unittest.TestCase):
+    """Pruebas del generador de jugadas completas."""
+
+    def test_apertura_3_1_tiene_16_jugadas(self):
+        """Verifica la cantidad de jugadas distintas de la apertura 3-1."""
+        juego = juego_inicial([3, 1], tablero=TableroCompacto())
+        jugadas = juego.jugadas_legales()
+        self.assertEqual(len(jugadas), 16)
+        self.assertTrue(all(len(j) == 2 for j in jugadas))
+
+    def test_doble_usa_cuatro_movimientos(self):
+        """Verifica que un doble genere jugadas de cuatro movimientos."""
+        juego = juego_inicial([2, 2, 2, 2])
+        jugadas = juego.jugadas_legales()
+        self.assertTrue(jugadas)
+        self.assertTrue(all(len(j) == 4 for j in jugadas))
+
+    def test_sin_dados_no_hay_jugadas(self):
+        """Verifica que sin dados la lista esté vacía."""
+        juego = juego_inicial()
+        self.assertEqual(juego.jugadas_legales(), [])
+        self.assertEqual(juego.movimientos_legales(), [])
+
+    def test_barra_bloqueada_pierde_turno(self):
+        """Verifica que con la entrada bloqueada no haya jugadas."""
+        celdas = [0] * (PUNTOS + 4)
+        celdas[PUNTOS] = 1
+        celdas[21] = -2
+        celdas[19] = -2
+        self.assertEqual(generar_jugadas(celdas, 0, [3, 5]), [])
+
+    def test_debe_usar_el_dado_mayor(self):
+        """Verifica la regla del dado mayor cuando sólo se puede usar uno."""
+        celdas = [0] * (PUNTOS + 4)
+        celdas[10] = 1
+        celdas[1] = -2   # bloquea 10→7→1 y 10→4→1
+        # Se puede jugar el 3 o el 6, pero no ambos: hay que jugar el 6.
+        self.assertEqual(generar_jugadas(celdas, 0, [3, 6]), [((10, 4),)])
+        self.assertEqual(primeros_movimientos(celdas, 0, [3, 6]), [(10, 4, 6)])
+        celdas[4] = -2
+        # Con el 6 bloqueado sólo queda el 3.
+        self.assertEqual(generar_jugadas(celdas, 0, [3, 6]), [((10, 7),)])
+
+    def test_bearing_off_exacto_y_over_bearing(self):
+        """Verifica salidas exactas y con dado mayor desde la ficha más lejana."""
+        celdas = [0] * (PUNTOS + 4)
+        celdas[1] = 1
+        celdas[SALIDA] = 14
+        jugadas = generar_jugadas(celdas, 0, [5, 6])
+        self.assertEqual(jugadas, [((1, PUNTOS),)])
+
+    def test_primeros_movimientos_incluye_ambos_ordenes(self):
+        """Verifica que el orden alternativo aparezca como primer movimiento."""
+        celdas = [0] * (PUNTOS + 4)
+        celdas[12] = 1
+        celdas[20] = 1
+        primeros = primeros_movimientos(celdas, 0, [1, 2])
+        origenes = {desde for desde, _, _ in primeros}
+        self.assertEqual(origenes, {12, 20})
+
+    def test_dobles_sin_ordenes_equivalentes(self):
+        """Verifica que los dobles den cada jugada con las fichas más lejanas primero."""
+        for lado in (0, 1):
+            juego = juego_inicial([3, 3, 3, 3], lado, TableroCompacto())
+            self.assertEqual(finales_generador(juego), finales_fuerza_bruta(juego))
+            celdas = juego.tablero.celdas()
+            for jugada in generar_jugadas(celdas, lado, [3, 3, 3, 3]):
+                distancias = [PIPS_PARA_SALIR[lado][desde] for desde, _ in jugada]
+                self.assertEqual(distancias, sorted(distancias, reverse=True))
+            # Las interfaces siguen viendo todos los primeros movimientos posibles.
+            origenes = {desde for desde, _, _ in primeros_movimientos(celdas, lado, [3] * 4)}
+            self.assertEqual(len(origenes), 4)
+
+    def test_coincide_con_fuerza_bruta(self):
+        """Compara las posiciones finales con una búsqueda exhaustiva vía Juego."""
+        revisadas = 0
+        for semilla in (3, 8):
+            for juego in jugar_al_azar(juego_inicial(tablero=TableroCompacto()), semilla, 30):
+                self.assertEqual(finales_generador(juego), finales_fuerza_bruta(juego))
+                revisadas += 1
+        self.assertGreater(revisadas, 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+"""Tests para los jugadores y la creación de la pareja J1/J2."""
+import unittest
+from backgammon.core.jugador import Jugador, crear_jugadores
+
+
+class PruebasJugador(unittest.TestCase):
+    """Pruebas de ids y de crear_jugadores."""
+
+    def test_ids_autoincrementales(self):
+        """Verifica que cada jugador nuevo reciba el id siguiente."""
+        primero = Jugador("a")
+        segundo = Jugador("b")
+        self.assertEqual(segundo.id, primero.id + 1)
+        self.assertEqual(primero.nombre, "a")
+
+    def test_crear_jugadores_respeta_paridad(self):
+        """Verifica que J1 tenga id impar y J2 id par sin importar el contador."""
+        for _ in range(3):
+            j1, j2 = crear_jugadores(["a", "b"])
+            self.assertEqual(j1.id % 2, 1)
+            self.assertEqual(j2.id % 2, 0)
+            self.assertEqual((j1.nombre, j2.nombre), ("a", "b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
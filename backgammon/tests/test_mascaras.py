@@ -0,0 +1,70 @@
+"""Tests para el módulo mascaras."""
+import unittest
+from backgammon.core.mascaras import (
+    CASA, FUERA_DE_CASA, TODOS, mascaras_desde_celdas, mas_lejano,
+    hay_fichas_detras, prime_mas_largo, puntos_de,
+)
+from backgammon.core.tablero import Tablero
+from backgammon.core.tablero_compacto import TableroCompacto, CELDAS
+
+
+class PruebasMascaras(unittest.TestCase):
+    """Pruebas de las funciones sobre máscaras de 24 bits."""
+
+    def test_casa_y_fuera_de_casa_se_complementan(self):
+        """Verifica que home board y resto cubran los 24 puntos sin solaparse."""
+        for lado in (0, 1):
+            self.assertEqual(CASA[lado] | FUERA_DE_CASA[lado], TODOS)
+            self.assertEqual(CASA[lado] & FUERA_DE_CASA[lado], 0)
+
+    def test_mascaras_desde_celdas(self):
+        """Verifica propios, blots y hechos a partir del arreglo plano."""
+        celdas = [0] * CELDAS
+        celdas[3] = 1
+        celdas[5] = 4
+        celdas[20] = -1
+        celdas[21] = -2
+        propios, blots, hechos = mascaras_desde_celdas(celdas)
+        self.assertEqual(propios, [(1 << 3) | (1 << 5), (1 << 20) | (1 << 21)])
+        self.assertEqual(blots, [1 << 3, 1 << 20])
+        self.assertEqual(hechos, [1 << 5, 1 << 21])
+
+    def test_mas_lejano_segun_lado(self):
+        """Verifica el punto más atrasado para cada dirección."""
+        mascara = (1 << 2) | (1 << 9) | (1 << 17)
+        self.assertEqual(mas_lejano(mascara, 0), 17)
+        self.assertEqual(mas_lejano(mascara, 1), 2)
+        self.assertIsNone(mas_lejano(0, 0))
+
+    def test_hay_fichas_detras(self):
+        """Verifica la pregunta "¿hay fichas más lejos que este punto?"."""
+        mascara = (1 << 2) | (1 << 9)
+        self.assertTrue(hay_fichas_detras(mascara, 2, 0))
+        self.assertFalse(hay_fichas_detras(mascara, 9, 0))
+        self.assertTrue(hay_fichas_detras(mascara, 9, 1))
+        self.assertFalse(hay_fichas_detras(mascara, 2, 1))
+
+    def test_prime_mas_largo(self):
+        """Verifica el largo de la secuencia de puntos hechos consecutivos."""
+        self.assertEqual(prime_mas_largo(0), 0)
+        self.assertEqual(prime_mas_largo(0b1011110), 4)
+        self.assertEqual(prime_mas_largo(0b111111 << 4), 6)
+
+    def test_puntos_de(self):
+        """Verifica la lista de índices encendidos."""
+        self.assertEqual(puntos_de((1 << 0) | (1 << 7) | (1 << 23)), [0, 7, 23])
+        self.assertEqual(puntos_de(0), [])
+
+    def test_tableros_mantienen_mascaras(self):
+        """Verifica que ambos backends mantengan las máscaras de la posición inicial."""
+        for clase in (Tablero, TableroCompacto):
+            tablero = clase()
+            tablero.posicion_inicial_estandar(1, 2)
+            propios, blots, hechos = mascaras_desde_celdas(tablero.celdas())
+            self.assertEqual(tablero.mascaras(1), (propios[0], blots[0], hechos[0]))
+            self.assertEqual(tablero.mascaras(2), (propios[1], blots[1], hechos[1]))
+            self.assertEqual(prime_mas_largo(tablero.mascaras(1)[2]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests para la vista canónica desde el lado que mueve."""
+import random
+import unittest
+from backgammon.core.cache_jugadas import CACHE
+from backgammon.core.juego import Juego, juego_inicial
+from backgammon.core.perspectiva import (
+    celdas_canonicas, distancia_para_salir, espejar_celdas, espejar_jugada, lado_de,
+    punto_relativo,
+)
+from backgammon.core.tablero import Tablero, PUNTOS
+from backgammon.core.tablero_compacto import TableroCompacto
+from backgammon.ia.bearing_off import posicion_en_tablero
+
+
+def espejo_de(juego) -> Juego:
+    """Juego con la posición espejada y el otro lado al turno (mismos dados)."""
+    j1, j2 = juego.jugadores
+    otro = Juego(j1, j2, tablero=TableroCompacto.desde_celdas(
+        espejar_celdas(juego.tablero.celdas()), j1.id, j2.id))
+    if juego.lado_actual() == 0:
+        otro.cambiar_turno()
+    otro.fijar_movimientos(juego.movimientos_disponibles())
+    return otro
+
+
+class PruebasPerspectiva(unittest.TestCase):
+    """Pruebas del espejo, el hash canónico y las cachés compartidas entre lados."""
+
+    def test_puntos_y_lados(self):
+        """Verifica lado, punto relativo y distancia para salir de cada lado."""
+        self.assertEqual((lado_de(1), lado_de(2)), (0, 1))
+        self.assertEqual((punto_relativo(5, 0), punto_relativo(5, 1)), (5, 18))
+        self.assertEqual((distancia_para_salir(0, 0), distancia_para_salir(23, 1)), (1, 1))
+        self.assertEqual(espejar_jugada(((23, 17), (5, PUNTOS))), ((0, 6), (18, PUNTOS)))
+
+    def test_espejar_celdas(self):
+        """Verifica que espejar dos veces sea la identidad y que intercambie barra y salidas."""
+        tablero = TableroCompacto()
+        tablero.posicion_inicial_estandar(1, 2)
+        tablero.mover_ficha_seguro(1, 12, 9)
+        tablero.enviar_a_barra(2)
+        tablero.registrar_salida(1)
+        celdas = tablero.celdas()
+        espejo = espejar_celdas(celdas)
+        self.assertEqual(espejo[9 + 5], -1)
+        self.assertEqual(espejo[24:], [1, 0, 0, 1])
+        self.assertEqual(espejar_celdas(espejo), celdas)
+        self.assertEqual(celdas_canonicas(celdas, 0), celdas)
+        self.assertEqual(celdas_canonicas(celdas, 1), espejo)
+
+    def test_hash_canonico_incremental(self):
+        """Verifica en partidas al azar que el hash espejado coincida con el del espejo."""
+        rng = random.Random(3)
+        for tablero in (Tablero(), TableroCompacto()):
+            juego = juego_inicial(tablero=tablero)
+            for _ in range(120):
+                if juego.termino():
+                    break
+                juego.fijar_movimientos(rng.choice([[6, 1], [3, 3, 3, 3], [5, 2]]))
+                jugadas = juego.jugadas_legales()
+                if jugadas:
+                    for desde, hasta in rng.choice(jugadas):
+                        juego.aplicar_movimiento(desde, hasta)
+                espejo = TableroCompacto.desde_celdas(
+                    espejar_celdas(juego.tablero.celdas()), 1, 2)
+                self.assertEqual(juego.tablero.hash_canonico(1), espejo.hash_posicion)
+                self.assertEqual(juego.tablero.hash_canonico(0), juego.tablero.hash_posicion)
+                juego.cambiar_turno()
+
+    def test_espejo_comparte_cache_y_clave(self):
+        """Verifica que un juego y su espejo tengan la misma clave y compartan la caché."""
+        juego = juego_inicial()
+        juego.fijar_movimientos([6, 5])
+        juego.aplicar_movimiento(23, 17)
+        juego.cambiar_turno()
+        juego.fijar_movimientos([4, 2])
+        otro = espejo_de(juego)
+        self.assertEqual(juego.clave_canonica(), otro.clave_canonica())
+        self.assertNotEqual(juego.clave_posicion(), otro.clave_posicion())
+        CACHE.limpiar()
+        jugadas = juego.jugadas_legales()
+        self.assertEqual(otro.jugadas_legales(), [espejar_jugada(j) for j in jugadas])
+        self.assertEqual(CACHE.estadisticas()["aciertos"], 1)
+        movimientos = otro.movimientos_legales()
+        self.assertEqual(movimientos, sorted(movimientos))
+        self.assertEqual(len(movimientos), len(juego.movimientos_legales()))
+
+    def test_bearing_off_desde_cada_lado(self):
+        """Verifica que la posición de bearing off de J2 se lea desde su lado."""
+        tablero = TableroCompacto()
+        for pid, punto in ((1, 0), (1, 2), (2, 23), (2, 21)):
+            tablero.colocar_ficha(pid, punto)
+        self.assertEqual(posicion_en_tablero(tablero, 1), posicion_en_tablero(tablero, 2))
+        self.assertEqual(posicion_en_tablero(tablero, 2), (1, 0, 1, 0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
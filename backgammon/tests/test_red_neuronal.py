@@ -0,0 +1,107 @@
+"""Tests para el evaluador con red neuronal."""
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from backgammon.core.codificacion import codificar_lote
+from backgammon.core.tablero_compacto import BARRA, CELDAS, SALIDA
+from backgammon.ia.busqueda import aplicar_jugada, deshacer_jugada
+from backgammon.ia.red_neuronal import (
+    ENTRADAS, SALIDAS, EvaluadorRed, RedNeuronal, entradas_tablero, entradas_td, equidad,
+)
+from backgammon.core.juego import juego_inicial
+
+
+class PruebasRedNeuronal(unittest.TestCase):
+    """Pruebas de la codificación de 198 entradas, la red y el evaluador."""
+
+    def test_entradas_de_la_posicion_inicial(self):
+        """Verifica las unidades de la posición inicial y su simetría entre lados."""
+        tablero = juego_inicial().tablero
+        j1 = entradas_tablero(tablero, 0)
+        j2 = entradas_tablero(tablero, 1)
+        self.assertEqual(j1.shape, (ENTRADAS,))
+        # Cinco fichas en el punto a 6 pips: 1, 1, 1 y (5 - 3) / 2.
+        self.assertEqual(j1[20:24].tolist(), [1, 1, 1, 1])
+        # Dos fichas en el punto a 24 pips del rival.
+        self.assertEqual(j1[96 + 92:96 + 96].tolist(), [1, 1, 0, 0])
+        self.assertTrue(np.array_equal(j1[:196], j2[:196]))
+        self.assertEqual(j1[196:].tolist(), [1, 0])
+        self.assertEqual(j2[196:].tolist(), [0, 1])
+
+    def test_barra_salidas_y_lote(self):
+        """Verifica barra y salidas desde cada lado y que el lote coincida fila a fila."""
+        celdas = [0] * CELDAS
+        celdas[3] = 7
+        celdas[20] = -4
+        celdas[BARRA] = 2
+        celdas[SALIDA] = 6
+        celdas[BARRA + 1] = 1
+        celdas[SALIDA + 1] = 10
+        filas = codificar_lote([celdas, celdas], [0, 1])
+        lote = entradas_td(filas)
+        j1, j2 = lote
+        self.assertEqual(j1[12:16].tolist(), [1, 1, 1, 2])
+        self.assertEqual(j2[12:16].tolist(), [1, 1, 1, 0.5])
+        self.assertTrue(np.allclose(j1[192:196], [1, 0.5, 6 / 15, 10 / 15]))
+        self.assertTrue(np.allclose(j2[192:196], [0.5, 1, 10 / 15, 6 / 15]))
+        self.assertTrue(np.array_equal(entradas_td(filas[1]), lote[1:]))
+
+    def test_evaluar_lote(self):
+        """Verifica el paso hacia adelante contra la cuenta capa por capa."""
+        red = RedNeuronal.aleatoria(ocultas=(8, 4), semilla=1)
+        self.assertEqual(red.ocultas, (8, 4))
+        entradas = entradas_td(codificar_lote([juego_inicial().tablero.celdas()] * 3, [0, 1, 0]))
+        salidas = red.evaluar_lote(entradas)
+        self.assertEqual(salidas.shape, (3, SALIDAS))
+        capa = entradas.astype(np.float64)
+        for w, b in zip(red.pesos, red.sesgos):
+            capa = 1 / (1 + np.exp(-(capa @ w + b)))
+        self.assertTrue(np.allclose(salidas, capa, atol=1e-5))
+
+    def test_equidad(self):
+        """Verifica la equidad y la corrección de salidas inconsistentes."""
+        self.assertEqual(equidad([1, 1, 1, 0, 0]).tolist(), [3])
+        self.assertEqual(equidad([0, 0, 0, 1, 1]).tolist(), [-3])
+        self.assertAlmostEqual(float(equidad([0.5, 0.9, 0.9, 0.0, 0.0])[0]), 1.0)
+        self.assertAlmostEqual(float(equidad([0.5, 0.2, 0.0, 0.1, 0.0])[0]), 0.1)
+
+    def test_guardar_y_cargar(self):
+        """Verifica el archivo de pesos y los errores de forma."""
+        red = RedNeuronal.aleatoria(ocultas=(6,), semilla=2)
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "red.npz")
+            red.guardar(ruta)
+            cargada = RedNeuronal.cargar(ruta)
+            np.savez(os.path.join(carpeta, "otra.npz"), pesos_0=red.pesos[0])
+            with self.assertRaises(ValueError):
+                RedNeuronal.cargar(os.path.join(carpeta, "otra.npz"))
+        entradas = entradas_tablero(juego_inicial().tablero, 0)
+        self.assertTrue(np.array_equal(red.evaluar_lote(entradas), cargada.evaluar_lote(entradas)))
+        with self.assertRaises(ValueError):
+            RedNeuronal([np.zeros((10, 5))], [np.zeros(5)])
+        with self.assertRaises(ValueError):
+            RedNeuronal([np.zeros((ENTRADAS, 4))], [np.zeros(4)])
+
+    def test_evaluador_y_jugadas(self):
+        """Verifica que el lote de jugadas dé lo mismo que evaluar cada posición."""
+        evaluador = pickle.loads(pickle.dumps(EvaluadorRed(RedNeuronal.aleatoria(semilla=3))))
+        juego = juego_inicial()
+        self.assertLessEqual(abs(evaluador(juego)), 3)
+        juego.fijar_movimientos([6, 4])
+        jugadas = juego.jugadas_legales()
+        puntajes = evaluador.puntuar_jugadas(juego, jugadas)
+        for jugada, puntaje in zip(jugadas, puntajes):
+            registros = aplicar_jugada(juego, jugada)
+            juego.cambiar_turno()
+            self.assertAlmostEqual(-evaluador(juego), float(puntaje), places=5)
+            juego.cambiar_turno()
+            deshacer_jugada(juego, registros)
+            juego.fijar_movimientos([6, 4])
+        elegida = evaluador.elegir_jugada(juego, jugadas, None)
+        self.assertEqual(elegida, jugadas[int(np.argmax(puntajes))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Tests para los rollouts Monte Carlo."""
+import unittest
+from backgammon.core.dados import TIRADAS
+from backgammon.core.tablero_compacto import CELDAS, SALIDA
+from backgammon.ia.estrategias import EstrategiaAleatoria
+from backgammon.simulacion.rollout import ESTRATO, jugar_rollout, rollout
+from backgammon.core.juego import juego_inicial
+
+
+class EstrategiaEspia(EstrategiaAleatoria):
+    """Estrategia aleatoria que anota los dados con que le tocó jugar."""
+
+    def __init__(self):
+        """Empieza sin tiradas anotadas."""
+        self.tiradas = []
+
+    def elegir_jugada(self, juego, jugadas, rng):
+        """Anota los dados restantes y elige al azar."""
+        self.tiradas.append(tuple(juego.movimientos_disponibles()))
+        return super().elegir_jugada(juego, jugadas, rng)
+
+
+class PruebasRollout(unittest.TestCase):
+    """Pruebas de los rollouts y su intervalo de confianza."""
+
+    def test_primeras_tiradas_estratificadas(self):
+        """Verifica que cada bloque de 36 rollouts vea cada primera tirada una vez."""
+        celdas = juego_inicial().tablero.celdas()
+        espia = EstrategiaEspia()
+        for indice in range(ESTRATO, 2 * ESTRATO):
+            jugar_rollout(indice, celdas, 0, espia, max_turnos=1)
+        self.assertEqual(sorted(espia.tiradas), sorted(t[2] for t in TIRADAS))
+
+    def test_truncado_usa_el_evaluador(self):
+        """Verifica que con tope de turnos se use el evaluador desde el lado correcto."""
+        juego = juego_inicial()
+        resultado = rollout(juego, EstrategiaAleatoria(), partidas=36, procesos=1,
+                            max_turnos=0, evaluador=lambda j: 0.5)
+        self.assertEqual(resultado.truncados, 36)
+        self.assertEqual(resultado.equidad, 0.5)
+        self.assertEqual(resultado.error, 0.0)
+        valor, truncado = jugar_rollout(0, juego.tablero.celdas(), 0, EstrategiaAleatoria(),
+                                        max_turnos=1, evaluador=lambda j: 0.5)
+        self.assertEqual((valor, truncado), (-0.5, True))
+
+    def test_final_ganado(self):
+        """Verifica el valor de una posición ganada con gammon con cualquier tirada."""
+        celdas = [0] * CELDAS
+        celdas[0] = 1
+        celdas[SALIDA] = 14
+        celdas[12] = -15
+        valores = [jugar_rollout(i, celdas, 0, EstrategiaAleatoria()) for i in range(ESTRATO)]
+        self.assertEqual(set(valores), {(2.0, False)})
+        # Con J2 al turno, J1 igual saca su última ficha en la tirada siguiente.
+        self.assertEqual(jugar_rollout(0, celdas, 1, EstrategiaAleatoria()), (-2.0, False))
+
+    def test_reproducible_con_procesos(self):
+        """Verifica que el resultado no dependa de la cantidad de procesos."""
+        juego = juego_inicial()
+        local = rollout(juego, EstrategiaAleatoria(), partidas=ESTRATO, semilla=3,
+                        procesos=1, max_turnos=6)
+        repartido = rollout(juego, EstrategiaAleatoria(), partidas=ESTRATO, semilla=3,
+                            procesos=2, max_turnos=6)
+        self.assertEqual(local[:5], repartido[:5])
+        inferior, superior = local.intervalo
+        self.assertLess(inferior, local.equidad)
+        self.assertGreater(superior, local.equidad)
+
+    def test_corte_temprano(self):
+        """Verifica que con precisión holgada se corte al alcanzar el mínimo."""
+        juego = juego_inicial()
+        resultado = rollout(juego, EstrategiaAleatoria(), partidas=20 * ESTRATO, procesos=1,
+                            max_turnos=4, precision=1.0, minimo=2 * ESTRATO)
+        self.assertEqual(resultado.partidas, 2 * ESTRATO)
+        sin_corte = rollout(juego, EstrategiaAleatoria(), partidas=3 * ESTRATO, procesos=1,
+                            max_turnos=4, precision=1e-9, minimo=ESTRATO)
+        self.assertEqual(sin_corte.partidas, 3 * ESTRATO)
+        with self.assertRaises(ValueError):
+            rollout(juego, EstrategiaAleatoria(), partidas=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
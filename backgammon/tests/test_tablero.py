@@ -4,6 +4,7 @@ from backgammon.core.tablero import Tablero, PUNTOS, FICHAS_POR_JUGADOR
 from backgammon.core.juego import Juego
 from backgammon.core.jugador import Jugador
 from backgammon.core.checker import Checker
+from backgammon.core.zobrist import hash_desde_cero
 
 
 class PruebasTablero(unittest.TestCase):
@@ -325,5 +326,56 @@ class PruebasTableroExtra(unittest.TestCase):
                 )
 
 
+class PruebasAgregados(unittest.TestCase):
+    """Pruebas de pips, fichas fuera de casa y punto más lejano."""
+
+    def test_posicion_inicial(self):
+        """Verifica los agregados de la posición inicial (167 pips cada uno)."""
+        tablero = Tablero()
+        tablero.posicion_inicial_estandar(1, 2)
+        self.assertEqual(tablero.pips(1), 167)
+        self.assertEqual(tablero.pips(2), 167)
+        self.assertEqual(tablero.fichas_fuera_de_casa(1), 10)
+        self.assertEqual(tablero.fichas_fuera_de_casa(2), 10)
+        self.assertEqual(tablero.punto_mas_lejano(1), 23)
+        self.assertEqual(tablero.punto_mas_lejano(2), 0)
+
+    def test_barra_cuenta_25_y_fuera_de_casa(self):
+        """Verifica que una ficha en la barra sume 25 pips y cuente fuera de casa."""
+        tablero = Tablero()
+        tablero.colocar_ficha(1, 2)
+        self.assertTrue(tablero.puede_sacar_fichas(1))
+        tablero.enviar_a_barra(1)
+        self.assertEqual(tablero.pips(1), 3 + 25)
+        self.assertEqual(tablero.fichas_fuera_de_casa(1), 1)
+        self.assertFalse(tablero.puede_sacar_fichas(1))
+
+    def test_punto_mas_lejano_se_recalcula_al_vaciarse(self):
+        """Verifica que al vaciar el punto más lejano se busque el siguiente."""
+        tablero = Tablero()
+        tablero.colocar_ficha(2, 3)
+        tablero.colocar_ficha(2, 10)
+        self.assertEqual(tablero.punto_mas_lejano(2), 3)
+        tablero.mover_ficha_seguro(2, 3, 12)
+        self.assertEqual(tablero.punto_mas_lejano(2), 10)
+        tablero.quitar_ficha(2, 10)
+        tablero.quitar_ficha(2, 12)
+        self.assertIsNone(tablero.punto_mas_lejano(2))
+        self.assertEqual(tablero.pips(2), 0)
+
+    def test_asignar_punto_directo_mantiene_agregados(self):
+        """Verifica que reemplazar la lista de un punto actualice hash, pips y máscaras."""
+        tablero = Tablero()
+        tablero.__puntos__[4] = [Checker(2), Checker(2)]
+        tablero.__puntos__[9] = [Checker(1)]
+        self.assertEqual(tablero.hash_posicion, hash_desde_cero(tablero, (1, 2)))
+        self.assertEqual(tablero.pips(2), 40)
+        self.assertEqual(tablero.mascaras(2), (1 << 4, 0, 1 << 4))
+        self.assertEqual(tablero.mascaras(1), (1 << 9, 1 << 9, 0))
+        tablero.__puntos__[4] = []
+        self.assertEqual(tablero.mascaras(2), (0, 0, 0))
+        self.assertEqual(tablero.hash_posicion, hash_desde_cero(tablero, (1, 2)))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
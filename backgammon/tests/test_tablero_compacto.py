@@ -0,0 +1,287 @@
+"""Tests para el módulo tablero_compacto."""
+import random
+import unittest
+from backgammon.core.tablero import Tablero, PUNTOS, FICHAS_POR_JUGADOR
+from backgammon.core.tablero_compacto import TableroCompacto, CELDAS, BARRA, SALIDA
+from backgammon.core.zobrist import hash_desde_cero
+from backgammon.core.jugadas import movimientos_simples, entrada_por_defecto
+from backgammon.core.mascaras import mascaras_desde_celdas
+from backgammon.core.juego import juego_inicial
+from backgammon.tests.utilidades import jugar_al_azar
+
+
+def resumen(tablero, ids):
+    """Resume un tablero (de cualquier backend) como tupla comparable.
+
+    Las fichas se identifican por la posición del dueño en 'ids' para poder
+    comparar partidas jugadas con distintos objetos Jugador.
+    """
+    puntos = tuple(
+        tuple(ids.index(f.owner_id) for f in tablero.punto(i)) for i in range(PUNTOS)
+    )
+    barra = tuple(tablero.fichas_en_barra(pid) for pid in ids)
+    salidas = tuple(tablero.fichas_salidas(pid) for pid in ids)
+    return puntos, barra, salidas
+
+
+def agregados_desde_cero(tablero, pid):
+    """Calcula pips, fichas fuera de casa y punto más lejano recorriendo el tablero."""
+    propios = [i for i in range(PUNTOS) for f in tablero.punto(i) if f.owner_id == pid]
+    barra = tablero.fichas_en_barra(pid)
+    if pid % 2 != 0:
+        pips = sum(i + 1 for i in propios)
+        fuera = sum(1 for i in propios if i >= 6)
+        mas_lejano = max(propios, default=None)
+    else:
+        pips = sum(PUNTOS - i for i in propios)
+        fuera = sum(1 for i in propios if i < 18)
+        mas_lejano = min(propios, default=None)
+    return pips + 25 * barra, fuera + barra, mas_lejano
+
+
+class PruebasTableroCompacto(unittest.TestCase):
+    """Pruebas básicas de la clase TableroCompacto."""
+
+    def test_tablero_vacio(self):
+        """Verifica que el arreglo empiece en cero y sin ganador."""
+        tablero = TableroCompacto()
+        self.assertEqual(tablero.celdas(), [0] * CELDAS)
+        self.assertFalse(tablero.hay_ganador())
+        self.assertIsNone(tablero.id_ganador())
+
+    def test_punto_invalido(self):
+        """Verifica que índices fuera de rango lancen excepción."""
+        tablero = TableroCompacto()
+        with self.assertRaises(ValueError):
+            tablero.punto(PUNTOS)
+        with self.assertRaises(ValueError):
+            tablero.colocar_ficha(1, -1)
+
+    def test_colocar_usa_signo_por_lado(self):
+        """Verifica que J1 sume en positivo y J2 en negativo."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 5)
+        tablero.colocar_ficha(1, 5)
+        tablero.colocar_ficha(2, 18)
+        celdas = tablero.celdas()
+        self.assertEqual(celdas[5], 2)
+        self.assertEqual(celdas[18], -1)
+        self.assertEqual([f.owner_id for f in tablero.punto(5)], [1, 1])
+
+    def test_punto_devuelve_copia(self):
+        """Verifica que modificar la lista devuelta no altere el tablero."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 3)
+        tablero.punto(3).clear()
+        self.assertEqual(len(tablero.punto(3)), 1)
+
+    def test_colocar_sobre_rival_falla(self):
+        """Verifica que no se puedan mezclar fichas de ambos jugadores."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(2, 4)
+        self.assertFalse(tablero.colocar_ficha(1, 4))
+        self.assertEqual(tablero.celdas()[4], -1)
+
+    def test_otro_id_misma_paridad_lanza_error(self):
+        """Verifica que un lado no pueda quedar asociado a dos jugadores."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 0)
+        with self.assertRaises(ValueError):
+            tablero.colocar_ficha(3, 0)
+        self.assertFalse(tablero.quitar_ficha(3, 0))
+        self.assertEqual(tablero.fichas_en_barra(3), 0)
+
+    def test_quitar_ficha(self):
+        """Verifica quitar fichas propias y no ajenas."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 0)
+        self.assertFalse(tablero.quitar_ficha(2, 0))
+        self.assertTrue(tablero.quitar_ficha(1, 0))
+        self.assertEqual(tablero.punto(0), [])
+
+    def test_barra_y_salidas_en_el_mismo_arreglo(self):
+        """Verifica que barra y salidas vivan en las celdas finales."""
+        tablero = TableroCompacto()
+        self.assertEqual(tablero.enviar_a_barra(2), 1)
+        self.assertEqual(tablero.registrar_salida(1), 1)
+        celdas = tablero.celdas()
+        self.assertEqual(celdas[BARRA + 1], 1)
+        self.assertEqual(celdas[SALIDA], 1)
+
+    def test_hay_ganador_con_quince_salidas(self):
+        """Verifica la detección de ganador."""
+        tablero = TableroCompacto()
+        for _ in range(FICHAS_POR_JUGADOR):
+            tablero.registrar_salida(4)
+        self.assertTrue(tablero.hay_ganador())
+        self.assertEqual(tablero.id_ganador(), 4)
+
+    def test_mover_ficha_seguro_hit(self):
+        """Verifica que golpear un blot lo envíe a la barra."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 7)
+        tablero.colocar_ficha(2, 4)
+        self.assertTrue(tablero.mover_ficha_seguro(1, 7, 4))
+        self.assertEqual(tablero.celdas()[4], 1)
+        self.assertEqual(tablero.fichas_en_barra(2), 1)
+
+    def test_mover_ficha_seguro_bloqueado(self):
+        """Verifica que un punto con dos rivales bloquee el movimiento."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 7)
+        tablero.colocar_ficha(2, 4)
+        tablero.colocar_ficha(2, 4)
+        self.assertTrue(tablero._bloqueado_por_oponente(1, 4))
+        self.assertFalse(tablero.mover_ficha_seguro(1, 7, 4))
+        self.assertEqual(tablero.celdas()[7], 1)
+
+    def test_reingresar_desde_barra(self):
+        """Verifica el reingreso con hit y el bloqueo."""
+        tablero = TableroCompacto()
+        tablero.enviar_a_barra(1)
+        tablero.colocar_ficha(2, 3)
+        tablero.colocar_ficha(2, 4)
+        tablero.colocar_ficha(2, 4)
+        self.assertFalse(tablero.reingresar_desde_barra(1, 4))
+        self.assertTrue(tablero.reingresar_desde_barra(1, 3))
+        self.assertEqual(tablero.fichas_en_barra(1), 0)
+        self.assertEqual(tablero.fichas_en_barra(2), 1)
+
+    def test_puede_sacar_y_sacar_ficha(self):
+        """Verifica el bearing off para ambos lados."""
+        tablero = TableroCompacto()
+        tablero.colocar_ficha(1, 2)
+        tablero.colocar_ficha(2, 20)
+        self.assertTrue(tablero.puede_sacar_fichas(1))
+        self.assertTrue(tablero.puede_sacar_fichas(2))
+        tablero.colocar_ficha(1, 6)
+        self.assertFalse(tablero.puede_sacar_fichas(1))
+        self.assertFalse(tablero.sacar_ficha(1, 2))
+        self.assertTrue(tablero.sacar_ficha(2, 20))
+        self.assertEqual(tablero.fichas_salidas(2), 1)
+
+    def test_posicion_inicial_estandar(self):
+        """Verifica que la posición inicial coincida con la de Tablero."""
+        compacto = TableroCompacto()
+        clasico = Tablero()
+        compacto.posicion_inicial_estandar(1, 2)
+        clasico.posicion_inicial_estandar(1, 2)
+        self.assertEqual(resumen(compacto, (1, 2)), resumen(clasico, (1, 2)))
+
+
+class PruebasEquivalenciaBackends(unittest.TestCase):
+    """Compara Juego con Tablero y con TableroCompacto jugada a jugada."""
+
+    def _jugar(self, tablero, semilla):
+        """Juega una partida aleatoria y devuelve el estado al comienzo de cada turno."""
+        juego = juego_inicial(tablero=tablero)
+        ids = [j.id for j in juego.jugadores]
+        return [resumen(estado.tablero, ids) for estado in jugar_al_azar(juego, semilla, 200)]
+
+    def test_partidas_aleatorias_identicas(self):
+        """Verifica que ambos backends produzcan exactamente los mismos estados."""
+        for semilla in (1, 2, 3):
+            clasico = self._jugar(Tablero(), semilla)
+            compacto = self._jugar(TableroCompacto(), semilla)
+            self.assertTrue(clasico)
+            self.assertEqual(clasico, compacto)
+
+
+class PruebasHacerDeshacer(unittest.TestCase):
+    """Pruebas de hacer_movimiento/deshacer_movimiento en ambos backends."""
+
+    def _foto(self, tablero):
+        """Estado comparable del tablero incluyendo su hash."""
+        return resumen(tablero, (1, 2)), tablero.hash_posicion
+
+    def test_hit_y_deshacer(self):
+        """Verifica que deshacer un hit reinstale el blot rival."""
+        for clase in (Tablero, TableroCompacto):
+            tablero = clase()
+            tablero.colocar_ficha(1, 7)
+            tablero.colocar_ficha(2, 4)
+            antes = self._foto(tablero)
+            registro = tablero.hacer_movimiento(1, 7, 4)
+            self.assertEqual(registro.golpeado, 2)
+            self.assertEqual(tablero.fichas_en_barra(2), 1)
+            tablero.deshacer_movimiento(registro)
+            self.assertEqual(self._foto(tablero), antes)
+
+    def test_reingreso_con_hit_y_deshacer(self):
+        """Verifica que la ficha vuelva a la barra y el rival a su punto."""
+        for clase in (Tablero, TableroCompacto):
+            tablero = clase()
+            tablero.enviar_a_barra(1)
+            tablero.colocar_ficha(2, 3)
+            antes = self._foto(tablero)
+            registro = tablero.hacer_movimiento(1, None, 3)
+            self.assertEqual(tablero.fichas_en_barra(1), 0)
+            tablero.deshacer_movimiento(registro)
+            self.assertEqual(self._foto(tablero), antes)
+
+    def test_bearing_off_y_deshacer(self):
+        """Verifica que deshacer una salida descuente el contador."""
+        for clase in (Tablero, TableroCompacto):
+            tablero = clase()
+            tablero.colocar_ficha(2, 21)
+            antes = self._foto(tablero)
+            registro = tablero.hacer_movimiento(2, 21, PUNTOS)
+            self.assertEqual(tablero.fichas_salidas(2), 1)
+            tablero.deshacer_movimiento(registro)
+            self.assertEqual(self._foto(tablero), antes)
+
+    def test_movimiento_invalido_devuelve_none(self):
+        """Verifica que un destino bloqueado no modifique el tablero."""
+        for clase in (Tablero, TableroCompacto):
+            tablero = clase()
+            tablero.colocar_ficha(1, 7)
+            tablero.colocar_ficha(2, 4)
+            tablero.colocar_ficha(2, 4)
+            antes = self._foto(tablero)
+            self.assertIsNone(tablero.hacer_movimiento(1, 7, 4))
+            self.assertIsNone(tablero.hacer_movimiento(1, None, 5))
+            self.assertEqual(self._foto(tablero), antes)
+
+    def test_recorrido_aleatorio_vuelve_al_inicio(self):
+        """Aplica cientos de movimientos al azar y los deshace en orden inverso."""
+        for clase in (Tablero, TableroCompacto):
+            tablero = clase()
+            tablero.posicion_inicial_estandar(1, 2)
+            inicial = self._foto(tablero)
+            elector = random.Random(11)
+            pila = []
+            for paso in range(300):
+                pid, lado = (1, 0) if paso % 2 == 0 else (2, 1)
+                dados = (elector.randint(1, 6),)
+                movimientos = movimientos_simples(
+                    tablero.celdas(), lado, dados, entrada_por_defecto(lado)
+                )
+                if not movimientos:
+                    continue
+                desde, hasta, _ = elector.choice(movimientos)
+                if tablero.fichas_en_barra(pid):
+                    desde = None
+                registro = tablero.hacer_movimiento(pid, desde, hasta)
+                self.assertIsNotNone(registro)
+                pila.append(registro)
+                self.assertEqual(tablero.hash_posicion, hash_desde_cero(tablero, (1, 2)))
+                propios, blots, hechos = mascaras_desde_celdas(tablero.celdas())
+                for jugador in (1, 2):
+                    lado = jugador - 1
+                    self.assertEqual(
+                        tablero.mascaras(jugador), (propios[lado], blots[lado], hechos[lado])
+                    )
+                    self.assertEqual(
+                        (tablero.pips(jugador), tablero.fichas_fuera_de_casa(jugador),
+                         tablero.punto_mas_lejano(jugador)),
+                        agregados_desde_cero(tablero, jugador),
+                    )
+            self.assertTrue(any(r.golpeado is not None for r in pila))
+            while pila:
+                tablero.deshacer_movimiento(pila.pop())
+            self.assertEqual(self._foto(tablero), inicial)
+            self.assertEqual(tablero.pips(1), 167)
+            self.assertEqual(tablero.punto_mas_lejano(2), 0)
+
+if __name__ == "__main__":
+    unittest.main()
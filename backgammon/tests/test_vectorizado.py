@@ -0,0 +1,91 @@
+"""Tests para el entorno vectorizado de N partidas."""
+import random
+import unittest
+import numpy as np
+from backgammon.core.codificacion import ANCHO, COLUMNA_LADO
+from backgammon.core.perspectiva import espejar_jugada
+from backgammon.core.tablero_compacto import TableroCompacto
+from backgammon.simulacion.vectorizado import POSICION_INICIAL, EntornoVectorizado
+from backgammon.core.juego import juego_inicial
+
+
+class PruebasVectorizado(unittest.TestCase):
+    """Pruebas del entorno contra partidas jugadas con Juego."""
+
+    def test_reset(self):
+        """Verifica la forma de las observaciones y los dados iniciales."""
+        entorno = EntornoVectorizado(16, semilla=1)
+        observaciones = entorno.reset(2)
+        self.assertEqual(observaciones.shape, (16, ANCHO))
+        self.assertTrue(np.all(observaciones[:, COLUMNA_LADO] == 0))
+        self.assertTrue(np.all((entorno.tiradas >= 1) & (entorno.tiradas <= 6)))
+        otra = EntornoVectorizado(16, semilla=2)
+        self.assertTrue(np.array_equal(entorno.tiradas, otra.tiradas))
+
+    def test_igual_que_juego(self):
+        """Verifica posiciones, jugadas, premios y reinicios contra un Juego por partida."""
+        partidas = 6
+        entorno = EntornoVectorizado(partidas, semilla=3)
+        juegos = [juego_inicial(tablero=TableroCompacto()) for _ in range(partidas)]
+        rng = random.Random(3)
+        terminadas = 0
+        for _ in range(400):
+            elecciones = []
+            for i, (juego, jugadas) in enumerate(zip(juegos, entorno.jugadas_legales())):
+                juego.fijar_movimientos(entorno.movimientos(i))
+                lado = juego.lado_actual()
+                self.assertEqual(entorno.lados[i], lado)
+                reales = [espejar_jugada(j) if lado else j for j in jugadas]
+                self.assertEqual(reales, juego.jugadas_legales())
+                elecciones.append(rng.randrange(len(jugadas)) if jugadas else 0)
+                for desde, hasta in reales[elecciones[-1]] if jugadas else ():
+                    self.assertTrue(juego.aplicar_movimiento(desde, hasta))
+            resultado = entorno.step(elecciones)
+            for i, juego in enumerate(juegos):
+                if resultado.terminadas[i]:
+                    terminadas += 1
+                    self.assertEqual(resultado.recompensas[i], juego.puntos_victoria())
+                    juegos[i] = juego = juego_inicial(tablero=TableroCompacto())
+                else:
+                    self.assertFalse(juego.termino())
+                    self.assertEqual(resultado.recompensas[i], 0)
+                    juego.cambiar_turno()
+                self.assertEqual(entorno.celdas()[i].tolist(), juego.tablero.celdas())
+        self.assertGreater(terminadas, 0)
+
+    def test_truncadas(self):
+        """Verifica que al llegar al tope de turnos las partidas se reinicien sin premio."""
+        entorno = EntornoVectorizado(4, semilla=5, max_turnos=3)
+        for paso in range(3):
+            resultado = entorno.step([0] * 4)
+        self.assertEqual(paso, 2)
+        self.assertTrue(np.all(resultado.truncadas))
+        self.assertFalse(np.any(resultado.terminadas))
+        self.assertTrue(np.all(resultado.recompensas == 0))
+        self.assertTrue(np.all(entorno.turnos == 0))
+        self.assertTrue(np.all(entorno.lados == 0))
+        self.assertTrue(np.all(entorno.celdas() == POSICION_INICIAL))
+
+
+    def test_elecciones_de_otro_largo(self):
+        """Verifica que step rechace una lista de elecciones que no cubra las N partidas."""
+        entorno = EntornoVectorizado(4, semilla=6)
+        for elecciones in ([0] * 3, [0] * 5):
+            with self.assertRaises(ValueError):
+                entorno.step(elecciones)
+        self.assertTrue(np.all(entorno.turnos == 0))
+
+    def test_eleccion_fuera_de_rango(self):
+        """Verifica que step rechace índices negativos o mayores que las jugadas disponibles."""
+        entorno = EntornoVectorizado(2, semilla=6)
+        observaciones = entorno.observaciones()
+        largo = len(entorno.jugadas_legales()[1])
+        for eleccion in (-1, largo):
+            with self.assertRaises(ValueError):
+                entorno.step([0, eleccion])
+        self.assertTrue(np.all(entorno.turnos == 0))
+        np.testing.assert_array_equal(entorno.observaciones(), observaciones)
+
+
+if __name__ == "__main__":
+    unittest.main()
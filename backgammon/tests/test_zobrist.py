@@ -0,0 +1,81 @@
+"""Tests para el módulo zobrist y el hash incremental de los tableros."""
+import unittest
+from backgammon.core.tablero import Tablero
+from backgammon.core.tablero_compacto import TableroCompacto
+from backgammon.core.juego import Juego, juego_inicial
+from backgammon.core.jugador import Jugador
+from backgammon.core.zobrist import clave_dados, hash_desde_cero
+from backgammon.tests.utilidades import jugar_al_azar
+
+
+class PruebasZobrist(unittest.TestCase):
+    """Pruebas del hash Zobrist incremental."""
+
+    def test_tablero_vacio_hash_cero(self):
+        """Verifica que un tablero vacío tenga hash 0 en ambos backends."""
+        self.assertEqual(Tablero().hash_posicion, 0)
+        self.assertEqual(TableroCompacto().hash_posicion, 0)
+
+    def test_colocar_y_quitar_restaura_hash(self):
+        """Verifica que deshacer una operación devuelva el hash original."""
+        for tablero in (Tablero(), TableroCompacto()):
+            tablero.posicion_inicial_estandar(1, 2)
+            inicial = tablero.hash_posicion
+            tablero.colocar_ficha(1, 3)
+            self.assertNotEqual(tablero.hash_posicion, inicial)
+            tablero.quitar_ficha(1, 3)
+            self.assertEqual(tablero.hash_posicion, inicial)
+
+    def test_mismo_hash_en_ambos_backends(self):
+        """Verifica que la misma posición tenga el mismo hash en los dos backends."""
+        clasico = Tablero()
+        compacto = TableroCompacto()
+        for tablero in (clasico, compacto):
+            tablero.posicion_inicial_estandar(1, 2)
+            tablero.mover_ficha_seguro(1, 12, 9)
+            tablero.enviar_a_barra(2)
+            tablero.registrar_salida(1)
+        self.assertEqual(clasico.hash_posicion, compacto.hash_posicion)
+
+    def test_hit_actualiza_hash(self):
+        """Verifica el hash tras golpear un blot y reingresar."""
+        for tablero in (Tablero(), TableroCompacto()):
+            tablero.colocar_ficha(1, 7)
+            tablero.colocar_ficha(2, 4)
+            tablero.mover_ficha_seguro(1, 7, 4)
+            tablero.reingresar_desde_barra(2, 4)
+            self.assertEqual(tablero.hash_posicion, hash_desde_cero(tablero, (1, 2)))
+
+    def test_incremental_igual_a_desde_cero_en_partidas(self):
+        """Verifica el hash incremental contra el recálculo en partidas aleatorias."""
+        for fabrica in (Tablero, TableroCompacto):
+            juego = juego_inicial(tablero=fabrica())
+            ids = [j.id for j in juego.jugadores]
+            for estado in jugar_al_azar(juego, 11, 60):
+                self.assertEqual(
+                    estado.tablero.hash_posicion,
+                    hash_desde_cero(estado.tablero, ids),
+                )
+
+    def test_clave_dados_ignora_orden(self):
+        """Verifica que la clave de dados no dependa del orden."""
+        self.assertEqual(clave_dados([3, 5]), clave_dados([5, 3]))
+        self.assertNotEqual(clave_dados([3, 5]), clave_dados([3]))
+        self.assertEqual(clave_dados([]), 0)
+
+    def test_clave_posicion_cubre_turno_y_dados(self):
+        """Verifica que la clave de Juego cambie con el turno y los dados."""
+        juego = Juego(Jugador("A"), Jugador("B"))
+        juego.reiniciar()
+        base = juego.clave_posicion()
+        juego.__movs_restantes__ = [6, 1]
+        con_dados = juego.clave_posicion()
+        self.assertNotEqual(base, con_dados)
+        juego.cambiar_turno()
+        self.assertNotEqual(juego.clave_posicion(), base)
+        juego.cambiar_turno()
+        self.assertEqual(juego.clave_posicion(), base)
+
+
+if __name__ == "__main__":
+    unittest.main()
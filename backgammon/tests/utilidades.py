@@ -0,0 +1,30 @@
+"""Funciones auxiliares compartidas por los tests."""
+import random
+
+
+def jugar_al_azar(juego, semilla: int, turnos: int):
+    """Juega 'turnos' turnos con jugadas legales al azar, reiniciando al terminar.
+
+    Entrega el juego al comienzo de cada turno, con los dados ya tirados y
+    antes de mover; después juega una de `jugadas_legales()` y pasa el turno.
+
+    Recibe:
+        juego (Juego): partida ya preparada (por ejemplo con `juego.juego_inicial`).
+        semilla (int): semilla de los dados y de la elección de jugadas.
+        turnos (int): cantidad de turnos a jugar.
+    Devuelve:
+        Iterator[Juego]: el mismo 'juego', una vez por turno.
+    """
+    juego.usar_semilla(semilla)
+    elector = random.Random(semilla)
+    for _ in range(turnos):
+        if juego.termino():
+            juego.reiniciar()
+        juego.tirar()
+        yield juego
+        jugadas = juego.jugadas_legales()
+        if jugadas:
+            for desde, hasta in elector.choice(jugadas):
+                if not juego.aplicar_movimiento(desde, hasta):
+                    raise AssertionError(f"jugada ilegal ({juego.ultimo_error()})")
+        juego.cambiar_turno()